@@ -11,7 +11,28 @@ Attributes:
         __all__ (list[str]): Public symbols exported by the package.
 """
 
-__domains__ = ["cli", "e2e", "integration", "misc", "namer", "parser", "regression", "utils"]
+__domains__ = [
+    "cache",
+    "cli",
+    "constants",
+    "e2e",
+    "importgraph",
+    "integration",
+    "manifest",
+    "misc",
+    "namer",
+    "output",
+    "parser",
+    "pathfinder",
+    "plan",
+    "profiling",
+    "regression",
+    "renamer",
+    "resolver",
+    "stats",
+    "utils",
+    "watch",
+]
 __version__ = "2025.1.0"
 
 __all__ = ["__domains__", "__version__"]
@@ -0,0 +1,266 @@
+"""Persistent per-file analysis cache.
+
+This module stores the sentinel lists and import sets extracted from Python
+files on disk so repeated runs only re-parse files that actually changed.
+Entries are keyed by the file path and validated against the file size and
+``mtime_ns``; a separate cache file is kept per sentinel/import-root/repo-root
+configuration so changing any of those values naturally invalidates results.
+Imports expanded from ``from package import *`` also depend on the package
+directory, so the submodule listing used is stored with the entry and
+compared with the directory on every lookup.
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+from pathlib import Path
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Optional
+
+from splurge_test_namer.constants import DEFAULT_CACHE_DIR
+from splurge_test_namer.exceptions import FileReadError, FileWriteError
+from splurge_test_namer.parser import (
+    DEFAULT_IMPORT_POLICY,
+    PARSE_OK,
+    ImportPolicy,
+    ModuleAnalysis,
+    star_import_listing,
+)
+from splurge_test_namer.stats import incr
+from splurge_test_namer.util_helpers import safe_file_reader, safe_file_writer
+
+DOMAINS = ["cache"]
+
+CACHE_VERSION = 2
+
+LOGGER = logging.getLogger(__name__)
+
+__all__ = ["AnalysisCache", "DEFAULT_CACHE_DIR"]
+
+
+class AnalysisCache:
+    """On-disk cache of per-file sentinel and import extraction results.
+
+    The cache is bound to a single run configuration (sentinel name,
+    import-root and repo-root). Lookups return ``None`` when the file is not
+    cached or its size/mtime no longer match, in which case callers compute
+    the value and store it with :meth:`put_analysis`.
+
+    Args:
+        cache_dir: Directory where cache files are stored.
+        sentinel: Sentinel variable name used for extraction.
+        root_import: Import-root used for import discovery (optional).
+        repo_root: Repository root used for import resolution (optional).
+        header: Results come from header-mode analysis (see
+            :func:`~splurge_test_namer.parser.analyze_module`).
+        policy: Import-discovery policy the results were produced with.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        sentinel: str,
+        root_import: Optional[str] = None,
+        repo_root: Optional[Path] = None,
+        header: bool = False,
+        policy: ImportPolicy = DEFAULT_IMPORT_POLICY,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.repo_root = repo_root
+        settings: dict[str, Any] = {
+            "version": CACHE_VERSION,
+            "sentinel": sentinel,
+            "root_import": root_import,
+            "repo_root": str(repo_root.resolve()) if repo_root is not None else None,
+        }
+        # only set when used, so default-configuration caches keep their file name
+        if header:
+            settings["header"] = True
+        if not policy.is_default:
+            settings["imports"] = [policy.scope, policy.skip_type_checking, policy.skip_local]
+        config = json.dumps(settings, sort_keys=True)
+        digest = hashlib.sha1(config.encode("utf-8")).hexdigest()[:16]
+        self.cache_file = cache_dir / f"analysis-{digest}.json"
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+        self._updated: set[str] = set()
+        self._dirty = False
+
+    @classmethod
+    def load(
+        cls,
+        cache_dir: Path,
+        sentinel: str,
+        root_import: Optional[str] = None,
+        repo_root: Optional[Path] = None,
+        header: bool = False,
+        policy: ImportPolicy = DEFAULT_IMPORT_POLICY,
+    ) -> "AnalysisCache":
+        """Create a cache for the given configuration and load existing entries.
+
+        A missing or unreadable cache file yields an empty cache; corruption
+        never aborts a run.
+        """
+        cache = cls(cache_dir, sentinel, root_import=root_import, repo_root=repo_root, header=header, policy=policy)
+        if not cache.cache_file.exists():
+            return cache
+        try:
+            data = json.loads(safe_file_reader(cache.cache_file))
+        except (FileReadError, ValueError) as e:
+            LOGGER.debug("ignoring unreadable analysis cache %s: %s", cache.cache_file, e)
+            return cache
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION and isinstance(data.get("entries"), dict):
+            cache._entries = data["entries"]
+        return cache
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, path: Path) -> str:
+        return os.path.abspath(path)
+
+    def _entry(self, path: Path, create: bool = False) -> Optional[dict[str, Any]]:
+        """Return the validated entry for ``path`` or None.
+
+        Entries whose size or mtime no longer match the file are discarded.
+        When ``create`` is True a fresh entry for the current stat is created.
+        """
+        key = self._key(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if entry is not None and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+            return entry
+        if entry is not None:
+            del self._entries[key]
+            self._dirty = True
+        if not create:
+            return None
+        entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        self._entries[key] = entry
+        self._updated.add(key)
+        return entry
+
+    def get_analysis(self, path: Path, need_imports: bool = False) -> Optional[ModuleAnalysis]:
+        """Return the cached analysis of ``path`` or None when not cached.
+
+        Args:
+            path: File to look up.
+            need_imports: Only accept entries whose imports were scanned.
+        """
+        entry = self._entry(path)
+        if entry is None or "sentinels" not in entry:
+            incr("cache_misses")
+            return None
+        scanned = "static_imports" in entry
+        if need_imports and not scanned:
+            incr("cache_misses")
+            return None
+        stars = entry.get("star_imports") or {}
+        if self.repo_root is not None and any(
+            star_import_listing(package, self.repo_root) != listing for package, listing in stars.items()
+        ):
+            # a star-imported package gained or lost a submodule
+            incr("cache_misses")
+            return None
+        incr("cache_hits")
+        return ModuleAnalysis(
+            path,
+            entry.get("status", PARSE_OK),
+            sentinels=list(entry["sentinels"]),
+            static_imports=frozenset(entry.get("static_imports", ())),
+            dynamic_imports=frozenset(entry.get("dynamic_imports", ())),
+            imports_scanned=scanned,
+            star_imports={package: list(listing) for package, listing in stars.items()},
+        )
+
+    def put_analysis(self, path: Path, analysis: ModuleAnalysis) -> None:
+        """Store the analysis result for ``path``.
+
+        An analysis without imports never replaces imports already cached for
+        the same file version.
+        """
+        entry = self._entry(path, create=True)
+        if entry is None:
+            return
+        entry["status"] = analysis.status
+        entry["sentinels"] = list(analysis.sentinels)
+        if analysis.imports_scanned:
+            entry["static_imports"] = sorted(analysis.static_imports)
+            entry["dynamic_imports"] = sorted(analysis.dynamic_imports)
+            if analysis.star_imports:
+                entry["star_imports"] = {package: list(names) for package, names in analysis.star_imports.items()}
+            else:
+                entry.pop("star_imports", None)
+        self._updated.add(self._key(path))
+        self._dirty = True
+
+    def take_updates(self) -> dict[str, dict[str, Any]]:
+        """Return entries stored since the last call and reset the tracking.
+
+        Used by worker processes to ship newly computed entries back to the
+        parent, which applies them with :meth:`merge`.
+        """
+        updates = {k: self._entries[k] for k in self._updated if k in self._entries}
+        self._updated = set()
+        return updates
+
+    def merge(self, updates: dict[str, dict[str, Any]]) -> None:
+        """Apply entries produced by another cache instance for this configuration.
+
+        Entries for the same file version are combined so sentinels and
+        imports computed in different workers are both kept.
+        """
+        for key, entry in updates.items():
+            current = self._entries.get(key)
+            if (
+                current is not None
+                and current.get("size") == entry.get("size")
+                and current.get("mtime_ns") == entry.get("mtime_ns")
+            ):
+                current.update(entry)
+            else:
+                self._entries[key] = dict(entry)
+            self._seen.add(key)
+            self._dirty = True
+
+    def prune(self) -> int:
+        """Drop entries for files that no longer exist.
+
+        Entries validated during this run are known to exist and are not
+        re-checked.
+
+        Returns:
+            Number of entries removed.
+        """
+        stale = [k for k in self._entries if k not in self._seen and not os.path.exists(k)]
+        for k in stale:
+            del self._entries[k]
+        if stale:
+            self._dirty = True
+        return len(stale)
+
+    def save(self) -> None:
+        """Prune stale entries and write the cache to disk if it changed.
+
+        Write failures are logged and otherwise ignored; the cache is an
+        optimization and must not abort a run.
+        """
+        self.prune()
+        if not self._dirty:
+            return
+        payload = json.dumps({"version": CACHE_VERSION, "entries": self._entries}, separators=(",", ":"))
+        tmp = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            safe_file_writer(tmp, payload)
+            os.replace(tmp, self.cache_file)
+        except (FileWriteError, OSError) as e:
+            LOGGER.warning("Failed to write analysis cache %s: %s", self.cache_file, e)
+            return
+        self._dirty = False
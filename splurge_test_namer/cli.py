@@ -9,16 +9,129 @@ License: MIT
 Functions:
     parse_args: Parse command line arguments.
     main: Entry point that builds proposals and optionally applies renames.
+
+The console script runs this module on every invocation, so only argument
+parsing is imported eagerly. The analysis modules are imported once
+arguments have been validated; ``build_proposals``, ``show_dry_run`` and
+``apply_renames`` import :mod:`splurge_test_namer.namer` when first called.
 """
 
-from pathlib import Path
 import argparse
 import sys
-
-from splurge_test_namer.namer import build_proposals, show_dry_run, apply_renames
+from typing import TYPE_CHECKING, Callable, Optional
+
+from splurge_test_namer.constants import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_TOP_N,
+    IMPORT_SCOPES,
+    IMPORTS_ALL,
+    NUMBERING_POLICIES,
+    NUMBERING_SEQUENTIAL,
+    OUTPUT_FORMATS,
+    READ_FULL,
+    READ_MODES,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from splurge_test_namer.namer import FileProposal
+    from splurge_test_namer.output import ProposalWriter
+    from splurge_test_namer.parser import ModuleSentinelMemo
 
 DOMAINS = ["cli"]
 
+PROGRESS_EVERY = 100
+# Changed files listed when a saved plan is stale.
+STALE_SHOWN = 20
+
+
+def build_proposals(
+    root: "Path",
+    sentinel: str,
+    root_import: Optional[str] = None,
+    repo_root: Optional["Path"] = None,
+    excludes: Optional[list[str]] = None,
+    fallback: str = "misc",
+    prefix: str = "test",
+    cache_dir: Optional["Path"] = None,
+    jobs: Optional[int] = None,
+    memo: Optional["ModuleSentinelMemo"] = None,
+    on_result: Optional[Callable[["FileProposal"], None]] = None,
+    incremental: bool = False,
+    numbering: str = NUMBERING_SEQUENTIAL,
+    follow_depth: int = 1,
+    read_mode: str = READ_FULL,
+    imports: str = IMPORTS_ALL,
+    skip_type_checking: bool = False,
+    skip_local_imports: bool = False,
+    dependencies: Optional[dict["Path", Optional[list["Path"]]]] = None,
+) -> list[tuple["Path", "Path"]]:
+    """Call :func:`splurge_test_namer.namer.build_proposals`."""
+    from splurge_test_namer.namer import build_proposals as _build_proposals
+
+    return _build_proposals(
+        root,
+        sentinel,
+        root_import=root_import,
+        repo_root=repo_root,
+        excludes=excludes,
+        fallback=fallback,
+        prefix=prefix,
+        cache_dir=cache_dir,
+        jobs=jobs,
+        memo=memo,
+        on_result=on_result,
+        incremental=incremental,
+        numbering=numbering,
+        follow_depth=follow_depth,
+        read_mode=read_mode,
+        imports=imports,
+        skip_type_checking=skip_type_checking,
+        skip_local_imports=skip_local_imports,
+        dependencies=dependencies,
+    )
+
+
+def show_dry_run(proposals: list[tuple["Path", "Path"]], writer: Optional["ProposalWriter"] = None) -> None:
+    """Call :func:`splurge_test_namer.namer.show_dry_run`."""
+    from splurge_test_namer.namer import show_dry_run as _show_dry_run
+
+    _show_dry_run(proposals, writer=writer)
+
+
+def apply_renames(
+    proposals: list[tuple["Path", "Path"]],
+    force: bool = False,
+    writer: Optional["ProposalWriter"] = None,
+    workers: int = 1,
+) -> None:
+    """Call :func:`splurge_test_namer.namer.apply_renames`."""
+    from splurge_test_namer.namer import apply_renames as _apply_renames
+
+    _apply_renames(proposals, force=force, writer=writer, workers=workers)
+
+
+class _ProgressReporter:
+    """Print a running count of analyzed files to stderr.
+
+    Passed to :func:`build_proposals` as ``on_result`` so progress is
+    reported while the scan streams, before any proposal is numbered.
+    """
+
+    def __init__(self, every: int = PROGRESS_EVERY) -> None:
+        self.every = every
+        self.count = 0
+
+    def __call__(self, result: "FileProposal") -> None:
+        self.count += 1
+        if self.count % self.every == 0:
+            print(f"Analyzed {self.count} files...", file=sys.stderr, flush=True)
+
+    def finish(self) -> None:
+        print(f"Analyzed {self.count} files", file=sys.stderr, flush=True)
+
 
 def parse_args() -> argparse.Namespace:
     """Parse CLI arguments for the test renamer tool.
@@ -47,6 +160,24 @@ def parse_args() -> argparse.Namespace:
         ),
     )
     p.add_argument("--apply", action="store_true", help="Apply the renames (default is dry-run)")
+    p.add_argument(
+        "--plan-out",
+        dest="plan_out",
+        default=None,
+        help=(
+            "Also write the proposals and the size/mtime of every file they were derived from to this plan file, "
+            "for --apply-plan (not compatible with --apply or --watch)"
+        ),
+    )
+    p.add_argument(
+        "--apply-plan",
+        dest="apply_plan",
+        default=None,
+        help=(
+            "Apply the renames recorded in a --plan-out file without scanning again; refused when any "
+            "recorded file changed since the plan was written"
+        ),
+    )
     p.add_argument("--sentinel", default="DOMAINS", help="Module-level sentinel list to read (default: DOMAINS)")
     p.add_argument(
         "--import-root",
@@ -82,6 +213,163 @@ def parse_args() -> argparse.Namespace:
             "Must start with a letter and contain only letters, digits or underscores; max length 64."
         ),
     )
+    p.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        default=DEFAULT_CACHE_DIR,
+        help=(
+            "Directory for the persistent per-file analysis cache "
+            f"(default: '{DEFAULT_CACHE_DIR}' in the current directory)."
+        ),
+    )
+    p.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Disable the persistent analysis cache and re-parse every file",
+    )
+    p.add_argument(
+        "--follow-depth",
+        type=int,
+        default=1,
+        help=(
+            "Import hops followed when aggregating sentinels under --import-root: 1 uses the modules a test "
+            "imports directly (default), N also follows their imports up to N hops, 0 follows imports without limit"
+        ),
+    )
+    p.add_argument(
+        "--imports",
+        choices=IMPORT_SCOPES,
+        default=IMPORTS_ALL,
+        help=(
+            "Where imports are searched for: 'all' walks every node, so dynamic imports are found anywhere "
+            "(default); 'toplevel' visits statements only and finds dynamic imports only as whole statements or "
+            "assigned values; 'static' finds import statements only. 'toplevel' and 'static' are much faster on "
+            "large files"
+        ),
+    )
+    p.add_argument(
+        "--skip-type-checking",
+        action="store_true",
+        help="Ignore imports inside 'if TYPE_CHECKING:' blocks",
+    )
+    p.add_argument(
+        "--skip-local-imports",
+        action="store_true",
+        help="Ignore imports made inside function bodies",
+    )
+    p.add_argument(
+        "--read-mode",
+        choices=READ_MODES,
+        default=READ_FULL,
+        help=(
+            "How test files are read: 'full' reads whole files (default); 'header' reads each file in chunks only "
+            "up to its first module-level function or class, so imports inside test functions are not followed. "
+            "Header reads apply with --imports static or without --import-root; the other import scopes read whole "
+            "files to find dynamic imports"
+        ),
+    )
+    p.add_argument(
+        "--numbering",
+        choices=NUMBERING_POLICIES,
+        default=NUMBERING_SEQUENTIAL,
+        help=(
+            "Sequence numbering policy: 'sequential' renumbers every group from 0001 (default); 'stable' keeps the "
+            "numbers of files already named <prefix>_NNNN.py and gives new files the next free numbers"
+        ),
+    )
+    p.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Keep a manifest of each scan in the cache directory and only re-analyze test files that are new, "
+            "changed or import changed modules; only affected groups are renumbered"
+        ),
+    )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=(
+            "Number of worker processes used to analyze test files "
+            "(default: sized from the CPU count and number of files; 1 disables parallelism)"
+        ),
+    )
+    p.add_argument(
+        "--rename-jobs",
+        dest="rename_jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of threads applying renames (default: 1). Independent renames run concurrently, which "
+            "shortens --apply/--apply-plan on high-latency filesystems such as NFS; the report keeps plan order"
+        ),
+    )
+    p.add_argument(
+        "--format",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help=(
+            "Output format for proposals and applied renames (default: text). "
+            "'json' writes one document and 'ndjson' one object per line; both include "
+            "the group prefix and sentinels of every entry"
+        ),
+    )
+    p.add_argument(
+        "--output",
+        default=None,
+        help="Write proposals/renames to this file instead of stdout",
+    )
+    p.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Print wall/CPU time per phase (glob, prefilter, sentinels, imports, resolve, naming, rename, output) "
+            "to stderr"
+        ),
+    )
+    p.add_argument(
+        "--profile-out",
+        dest="profile_out",
+        default=None,
+        help="Also run under cProfile and write the statistics to this .pstats file (implies --profile)",
+    )
+    p.add_argument(
+        "--stats",
+        choices=("text", "json"),
+        default=None,
+        help=(
+            "Print run statistics to stderr: files and bytes read, parses and parse failures, "
+            "resolver hits/misses per strategy, cache hits, renames and the slowest files"
+        ),
+    )
+    p.add_argument(
+        "--stats-top",
+        dest="stats_top",
+        type=int,
+        default=DEFAULT_TOP_N,
+        help=f"Number of slowest files listed by --stats (default: {DEFAULT_TOP_N})",
+    )
+    p.add_argument(
+        "--progress",
+        action="store_true",
+        help="Report analysis progress on stderr while test files are scanned",
+    )
+    p.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "After the dry run, keep watching the test root (and repo root) and print updated proposals as files "
+            "change; stop with Ctrl+C"
+        ),
+    )
+    p.add_argument(
+        "--watch-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f"Polling interval in seconds where inotify is unavailable (default: {DEFAULT_POLL_INTERVAL})",
+    )
     return p.parse_args()
 
 
@@ -127,19 +415,17 @@ def main() -> None:
         if any(h in sys.argv for h in ("-h", "--help")):
             return
         raise
+    from pathlib import Path
+
     root = Path(args.test_root)
     sentinel = args.sentinel
     fallback_raw = args.fallback
     # Normalize explicit empty strings to None so callers can pass --import-root ""
     root_import = args.import_root if args.import_root not in ("", None) else None
     repo_root = Path(args.repo_root) if args.repo_root else None
-    from splurge_test_namer.util_helpers import configure_logging
 
-    # configure logging: --debug (most verbose) overrides --verbose
-    configure_logging(verbose=args.verbose, debug=args.debug)
-
-    # Basic validations and sanitization
-    if not root.exists() or not root.is_dir():
+    # Basic validations and sanitization; a saved plan needs no test root
+    if args.apply_plan is None and (not root.exists() or not root.is_dir()):
         print(f"Test root not found or not a directory: {root}")
         raise SystemExit(2)
     # sentinel should be a valid Python identifier (letters, digits, underscores, not starting with digit)
@@ -179,60 +465,220 @@ def main() -> None:
         raise SystemExit(2)
     prefix = prefix_raw
 
+    if args.jobs is not None and args.jobs < 1:
+        print(f"Invalid jobs value: {args.jobs}. Must be a positive integer")
+        raise SystemExit(2)
+    if args.rename_jobs < 1:
+        print(f"Invalid rename-jobs value: {args.rename_jobs}. Must be a positive integer")
+        raise SystemExit(2)
+    if args.follow_depth < 0:
+        print(f"Invalid follow-depth value: {args.follow_depth}. Must be zero or a positive integer")
+        raise SystemExit(2)
+    if args.stats_top < 0:
+        print(f"Invalid stats-top value: {args.stats_top}. Must be zero or a positive integer")
+        raise SystemExit(2)
+
     # Normalize excludes: split on ';', trim, ignore empty entries
     excludes_raw = args.exclude or ""
     excludes = [e.strip() for e in excludes_raw.split(";") if e.strip()]
 
-    # Call build_proposals in a backward-compatible way: older tests may have
-    # monkeypatched a fake build_proposals that doesn't accept the new
-    # ``excludes`` keyword. Check the callable's signature and only pass
-    # ``excludes`` if it's supported.
-    import inspect
+    if args.watch and args.apply:
+        print("--watch only reports proposals; it cannot be combined with --apply")
+        raise SystemExit(2)
+    if args.watch and args.output_format == "json":
+        print("--watch writes a report per change; use --format text or ndjson")
+        raise SystemExit(2)
+    if args.watch_interval <= 0:
+        print(f"Invalid watch-interval value: {args.watch_interval}. Must be a positive number")
+        raise SystemExit(2)
+    if args.plan_out is not None and (args.apply or args.watch or args.apply_plan is not None):
+        print("--plan-out records a dry run; it cannot be combined with --apply, --apply-plan or --watch")
+        raise SystemExit(2)
+    if args.apply_plan is not None and args.watch:
+        print("--apply-plan applies a saved plan; it cannot be combined with --watch")
+        raise SystemExit(2)
+    if args.incremental and args.no_cache:
+        print("--incremental requires the cache directory; it cannot be combined with --no-cache")
+        raise SystemExit(2)
 
-    try:
-        sig = inspect.signature(build_proposals)
-        # Call build_proposals with explicit keyword args depending on what
-        # the implementation supports to keep typing explicit for mypy.
-        if "excludes" in sig.parameters and "fallback" in sig.parameters and "prefix" in sig.parameters:
-            proposals = build_proposals(
-                root,
-                sentinel,
-                root_import=root_import,
-                repo_root=repo_root,
-                excludes=excludes,
-                fallback=fallback,
-                prefix=prefix,
-            )
-        elif "excludes" in sig.parameters and "fallback" in sig.parameters:
-            proposals = build_proposals(
-                root, sentinel, root_import=root_import, repo_root=repo_root, excludes=excludes, fallback=fallback
-            )
-        elif "excludes" in sig.parameters and "prefix" in sig.parameters:
-            proposals = build_proposals(
-                root, sentinel, root_import=root_import, repo_root=repo_root, excludes=excludes, prefix=prefix
-            )
-        elif "fallback" in sig.parameters and "prefix" in sig.parameters:
+    cache_dir = None if args.no_cache else Path(args.cache_dir)
+
+    # Arguments are valid: load the analysis modules.
+    import contextlib
+
+    from splurge_test_namer.output import ProposalWriter
+    from splurge_test_namer.profiling import profile_run
+    from splurge_test_namer.stats import collect_stats
+    from splurge_test_namer.util_helpers import configure_logging
+
+    # configure logging: --debug (most verbose) overrides --verbose
+    configure_logging(verbose=args.verbose, debug=args.debug)
+
+    callbacks: list[Callable[["FileProposal"], None]] = []
+    progress = _ProgressReporter() if args.progress else None
+    if progress is not None:
+        callbacks.append(progress)
+    # machine-readable formats and saved plans report the sentinels of every entry
+    metadata: Optional[dict[Path, "FileProposal"]] = None
+    if args.output_format != "text" or args.plan_out is not None:
+        collected: dict[Path, "FileProposal"] = {}
+        metadata = collected
+        callbacks.append(lambda r: collected.__setitem__(r.path, r))
+
+    def _on_result(result: "FileProposal") -> None:
+        for callback in callbacks:
+            callback(result)
+
+    build_kwargs = {
+        "excludes": excludes,
+        "fallback": fallback,
+        "prefix": prefix,
+        "cache_dir": cache_dir,
+        "jobs": args.jobs,
+        "incremental": args.incremental,
+        "numbering": args.numbering,
+        "follow_depth": args.follow_depth,
+        "read_mode": args.read_mode,
+        "imports": args.imports,
+        "skip_type_checking": args.skip_type_checking,
+        "skip_local_imports": args.skip_local_imports,
+        "on_result": _on_result if callbacks else None,
+    }
+
+    def _watch() -> None:
+        from splurge_test_namer.watch import WatchSession, run_watch
+
+        session = WatchSession(
+            root,
+            sentinel,
+            root_import=root_import,
+            repo_root=repo_root,
+            excludes=excludes,
+            fallback=fallback,
+            prefix=prefix,
+            cache_dir=cache_dir,
+            numbering=args.numbering,
+            follow_depth=args.follow_depth,
+            read_mode=args.read_mode,
+            imports=args.imports,
+            skip_type_checking=args.skip_type_checking,
+            skip_local_imports=args.skip_local_imports,
+        )
+        try:
+            stream = open(args.output, "w", encoding="utf-8", newline="\n") if args.output else sys.stdout
+        except OSError as e:
+            print(f"Failed to open output file {args.output}: {e}")
+            raise SystemExit(2)
+        try:
+            run_watch(session, stream, args.output_format, interval=args.watch_interval)
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+
+    def _load_plan() -> list[tuple[Path, Path]]:
+        from splurge_test_namer.exceptions import SplurgeTestNamerError
+        from splurge_test_namer.namer import FileProposal
+        from splurge_test_namer.output import group_prefix
+        from splurge_test_namer.plan import read_plan
+
+        try:
+            plan = read_plan(Path(args.apply_plan))
+        except SplurgeTestNamerError as e:
+            print(e)
+            raise SystemExit(2)
+        stale = plan.stale_files()
+        if stale:
+            print(f"Plan {args.apply_plan} is stale: {len(stale)} file(s) changed since it was written")
+            for p in stale[:STALE_SHOWN]:
+                print(f"  {p}")
+            if len(stale) > STALE_SHOWN:
+                print(f"  ... and {len(stale) - STALE_SHOWN} more")
+            print("Write a new plan with --plan-out and review it before applying")
+            raise SystemExit(2)
+        if metadata is not None:
+            for orig, prop in plan.proposals:
+                if orig in plan.sentinels:
+                    metadata[orig] = FileProposal(orig, plan.sentinels[orig], group_prefix(prop))
+        return plan.proposals
+
+    def _save_plan(proposals: list[tuple[Path, Path]], dependencies: dict[Path, Optional[list[Path]]]) -> None:
+        from splurge_test_namer.exceptions import SplurgeTestNamerError
+        from splurge_test_namer.plan import write_plan
+
+        sentinels = {f: r.domains for f, r in metadata.items()} if metadata is not None else None
+        try:
+            plan = write_plan(Path(args.plan_out), proposals, dependencies, sentinels)
+        except SplurgeTestNamerError as e:
+            print(e)
+            raise SystemExit(2)
+        print(
+            f"Plan written to {args.plan_out} ({len(plan.fingerprints)} files fingerprinted); "
+            f"apply it with --apply-plan {args.plan_out}",
+            file=sys.stderr,
+        )
+
+    def _execute() -> None:
+        if args.watch:
+            _watch()
+            return
+        apply = args.apply
+        if args.apply_plan is not None:
+            proposals = _load_plan()
+            apply = True
+        else:
+            dependencies: Optional[dict[Path, Optional[list[Path]]]] = {} if args.plan_out is not None else None
             proposals = build_proposals(
-                root, sentinel, root_import=root_import, repo_root=repo_root, fallback=fallback, prefix=prefix
+                root, sentinel, root_import=root_import, repo_root=repo_root, dependencies=dependencies, **build_kwargs
             )
-        elif "excludes" in sig.parameters:
-            proposals = build_proposals(root, sentinel, root_import=root_import, repo_root=repo_root, excludes=excludes)
-        elif "fallback" in sig.parameters:
-            proposals = build_proposals(root, sentinel, root_import=root_import, repo_root=repo_root, fallback=fallback)
-        elif "prefix" in sig.parameters:
-            proposals = build_proposals(root, sentinel, root_import=root_import, repo_root=repo_root, prefix=prefix)
-        else:
-            proposals = build_proposals(root, sentinel, root_import=root_import, repo_root=repo_root)
-    except (ValueError, TypeError):
-        # If inspection fails for any reason, fall back to a conservative
-        # call without extras to preserve compatibility with test doubles.
-        proposals = build_proposals(root, sentinel, root_import=root_import, repo_root=repo_root)
-    if not args.apply:
-        show_dry_run(proposals)
-        print(f"\nProposals: {len(proposals)} (use --apply to perform)")
-        return
-    # apply renames; pass force flag so caller can opt into overwrites
-    apply_renames(proposals, force=args.force)
+            if progress is not None:
+                progress.finish()
+            if dependencies is not None:
+                _save_plan(proposals, dependencies)
+
+        if args.output_format == "text" and not args.output:
+            if not apply:
+                show_dry_run(proposals)
+                print(f"\nProposals: {len(proposals)} (use --apply to perform)")
+                return
+            # apply renames; pass force flag so caller can opt into overwrites
+            apply_renames(proposals, force=args.force, workers=args.rename_jobs)
+            return
+
+        try:
+            stream = open(args.output, "w", encoding="utf-8", newline="\n") if args.output else sys.stdout
+        except OSError as e:
+            print(f"Failed to open output file {args.output}: {e}")
+            raise SystemExit(2)
+        try:
+            writer = ProposalWriter(stream, args.output_format, metadata=metadata)
+            if not apply:
+                show_dry_run(proposals, writer=writer)
+                if args.output_format == "text":
+                    print(f"\nProposals: {len(proposals)} (use --apply to perform)")
+                return
+            apply_renames(proposals, force=args.force, writer=writer, workers=args.rename_jobs)
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+
+    profile_out = Path(args.profile_out) if args.profile_out else None
+    profile = None
+    stats = None
+    with contextlib.ExitStack() as stack:
+        if args.profile or profile_out is not None:
+            profile = stack.enter_context(profile_run(profile_out))
+        if args.stats:
+            stats = stack.enter_context(collect_stats(args.stats_top))
+        _execute()
+    if profile is not None:
+        print(profile.format_table(), file=sys.stderr)
+        if profile_out is not None:
+            print(f"cProfile statistics written to {profile_out}", file=sys.stderr)
+    if stats is not None:
+        import json
+
+        report = json.dumps(stats.as_dict(), indent=2) if args.stats == "json" else stats.format_text()
+        print(report, file=sys.stderr)
 
 
 if __name__ == "__main__":
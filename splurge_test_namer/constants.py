@@ -0,0 +1,41 @@
+"""Shared default values.
+
+Kept free of imports so the command-line parser can build its options
+without loading the analysis modules that define the behaviour behind them.
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+DOMAINS = ["constants"]
+
+# Default directory of the persistent analysis cache (see ``cache``).
+DEFAULT_CACHE_DIR = ".splurge_test_namer_cache"
+
+# Report formats supported by ``output.ProposalWriter``.
+OUTPUT_FORMATS = ("text", "json", "ndjson")
+
+# Slowest files kept by ``stats.RunStats``.
+DEFAULT_TOP_N = 10
+
+# Sequence numbering policies of ``namer.number_proposals``.
+NUMBERING_SEQUENTIAL = "sequential"
+NUMBERING_STABLE = "stable"
+NUMBERING_POLICIES = (NUMBERING_SEQUENTIAL, NUMBERING_STABLE)
+
+# How test files are read (see ``parser.analyze_module``): whole files, or only
+# the header before the first module-level function or class.
+READ_FULL = "full"
+READ_HEADER = "header"
+READ_MODES = (READ_FULL, READ_HEADER)
+
+# Import-discovery scopes (see ``parser.ImportPolicy``): every node including
+# dynamic import calls anywhere, statements plus statement-level dynamic
+# calls, or import statements only.
+IMPORTS_ALL = "all"
+IMPORTS_TOPLEVEL = "toplevel"
+IMPORTS_STATIC = "static"
+IMPORT_SCOPES = (IMPORTS_STATIC, IMPORTS_TOPLEVEL, IMPORTS_ALL)
+
+# Seconds between scans of ``watch.PollingWatcher`` (used where inotify is unavailable).
+DEFAULT_POLL_INTERVAL = 0.5
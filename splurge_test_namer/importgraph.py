@@ -0,0 +1,250 @@
+"""Module import graph for transitive sentinel aggregation.
+
+Aggregation normally looks one hop deep: the sentinels of the modules a test
+imports. :class:`ImportGraph` follows imports further under the import root.
+Each module file is analyzed once (sentinels and imports from a single
+parse, through the analysis cache when one is used) and becomes a node whose
+edges are the files its imports resolve to. Unlimited-depth closures are
+computed once per strongly connected component, so import cycles are handled
+and every test importing a module reuses its closure; depth-limited closures
+are memoized per ``(file, depth)``.
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+from pathlib import Path
+import logging
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from splurge_test_namer.parser import (
+    DEFAULT_IMPORT_POLICY,
+    PARSE_UNREADABLE,
+    ImportPolicy,
+    analyze_module_cached,
+    star_import_dir,
+)
+from splurge_test_namer.profiling import phase
+from splurge_test_namer.stats import incr
+from splurge_test_namer.util_helpers import resolve_module_to_paths_with_member_fallback
+
+if TYPE_CHECKING:
+    from splurge_test_namer.cache import AnalysisCache
+    from splurge_test_namer.resolver import ModuleIndex
+
+DOMAINS = ["importgraph"]
+
+LOGGER = logging.getLogger(__name__)
+
+__all__ = ["ImportGraph"]
+
+
+class ImportGraph:
+    """Lazily built graph of module files and the files they import.
+
+    Args:
+        repo_root: Repository root used to resolve imports.
+        root_import: Only imports under this package are followed.
+        sentinel_name: Sentinel variable name to collect.
+        cache: Optional analysis cache for module analyses.
+        resolver: Optional module index used to resolve names.
+        policy: Which parts of each module are searched for imports.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        root_import: str,
+        sentinel_name: str = "DOMAINS",
+        cache: Optional["AnalysisCache"] = None,
+        resolver: Optional["ModuleIndex"] = None,
+        policy: ImportPolicy = DEFAULT_IMPORT_POLICY,
+    ) -> None:
+        self.repo_root = repo_root
+        self.root_import = root_import
+        self.sentinel_name = sentinel_name
+        self.cache = cache
+        self.resolver = resolver
+        self.policy = policy
+        self._names: dict[str, tuple[Path, ...]] = {}
+        self._sentinels: dict[Path, frozenset[str]] = {}
+        self._edges: dict[Path, tuple[Path, ...]] = {}
+        # files with an import under the root that resolved to nothing
+        self._unresolved: set[Path] = set()
+        # package directories each file's star imports were expanded from
+        self._star_dirs: dict[Path, tuple[Path, ...]] = {}
+        self._scc_closure: dict[Path, frozenset[str]] = {}
+        self._limited: dict[tuple[Path, int], frozenset[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def resolve(self, module_name: str) -> tuple[Path, ...]:
+        """Resolve a dotted name (with member fallback) to files, memoized."""
+        found = self._names.get(module_name)
+        if found is None:
+            with phase("resolve"):
+                if self.resolver is not None:
+                    found = tuple(self.resolver.resolve_with_member_fallback(module_name))
+                else:
+                    found = tuple(resolve_module_to_paths_with_member_fallback(module_name, self.repo_root))
+            self._names[module_name] = found
+        return found
+
+    def _visit(self, path: Path) -> tuple[Path, ...]:
+        """Analyze ``path`` once and return the files it imports."""
+        edges = self._edges.get(path)
+        if edges is not None:
+            return edges
+        incr("graph_nodes")
+        analysis = analyze_module_cached(
+            path, self.sentinel_name, self.root_import, self.repo_root, self.cache, policy=self.policy
+        )
+        if analysis.status == PARSE_UNREADABLE:
+            self._sentinels[path] = frozenset()
+            self._edges[path] = ()
+            return ()
+        targets: list[Path] = []
+        for name in sorted(analysis.imports):
+            resolved = self.resolve(name)
+            if not resolved:
+                self._unresolved.add(path)
+            targets.extend(p for p in resolved if p != path)
+        self._sentinels[path] = frozenset(analysis.sentinels)
+        self._star_dirs[path] = tuple(star_import_dir(package, self.repo_root) for package in analysis.star_imports)
+        edges = tuple(dict.fromkeys(targets))
+        self._edges[path] = edges
+        return edges
+
+    def sentinels(self, path: Path) -> frozenset[str]:
+        """Return the sentinels declared by ``path`` itself."""
+        self._visit(path)
+        return self._sentinels[path]
+
+    def _close_scc(self, start: Path) -> None:
+        """Compute closures for every component reachable from ``start`` (iterative Tarjan)."""
+        index: dict[Path, int] = {}
+        low: dict[Path, int] = {}
+        stack: list[Path] = []
+        on_stack: set[Path] = set()
+        work: list[tuple[Path, int]] = [(start, 0)]
+        counter = 0
+        while work:
+            node, child_i = work.pop()
+            if child_i == 0:
+                if node in self._scc_closure:
+                    continue
+                index[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack.add(node)
+            children = self._visit(node)
+            advanced = False
+            while child_i < len(children):
+                child = children[child_i]
+                child_i += 1
+                if child in self._scc_closure:
+                    continue
+                if child not in index:
+                    work.append((node, child_i))
+                    work.append((child, 0))
+                    advanced = True
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            if advanced:
+                continue
+            if low[node] == index[node]:
+                members: list[Path] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    members.append(member)
+                    if member == node:
+                        break
+                # successor components were closed before this one
+                closure: set[str] = set()
+                for member in members:
+                    closure.update(self._sentinels[member])
+                    for child in self._edges[member]:
+                        if child in self._scc_closure:
+                            closure.update(self._scc_closure[child])
+                frozen = frozenset(closure)
+                for member in members:
+                    self._scc_closure[member] = frozen
+                incr("graph_components")
+            if work:
+                parent = work[-1][0]
+                if parent in low and parent not in self._scc_closure:
+                    low[parent] = min(low[parent], low[node])
+
+    def _closure(self, path: Path) -> frozenset[str]:
+        if path not in self._scc_closure:
+            self._close_scc(path)
+        return self._scc_closure[path]
+
+    def _closure_limited(self, path: Path, depth: int) -> frozenset[str]:
+        key = (path, depth)
+        found = self._limited.get(key)
+        if found is not None:
+            return found
+        # explicit stack: deep chains must not hit the recursion limit
+        pending = [key]
+        while pending:
+            node, d = pending[-1]
+            edges = self._visit(node)
+            children = edges if d > 1 else ()
+            missing = [(c, d - 1) for c in children if (c, d - 1) not in self._limited]
+            if missing:
+                pending.extend(missing)
+                continue
+            pending.pop()
+            result = set(self._sentinels[node])
+            for c in children:
+                result.update(self._limited[(c, d - 1)])
+            self._limited[(node, d)] = frozenset(result)
+        return self._limited[key]
+
+    def closure_sentinels(self, paths: Iterable[Path], depth: int = 0) -> set[str]:
+        """Return the sentinels reachable from ``paths``.
+
+        Args:
+            paths: Files imported directly (depth 1).
+            depth: Number of import hops to follow, counting the direct
+                imports as one; ``0`` follows imports without limit.
+        """
+        out: set[str] = set()
+        for p in paths:
+            self._visit(p)
+            out.update(self._closure(p) if depth == 0 else self._closure_limited(p, depth))
+        return out
+
+    def closure_files(self, paths: Iterable[Path], depth: int = 0) -> Optional[set[Path]]:
+        """Return the files reachable from ``paths`` within ``depth`` hops.
+
+        The package directories that star imports of followed files were
+        expanded from are included, since their contents decide the edges.
+        Returns None if a file whose imports were followed has an import
+        under the root that did not resolve (the result may change once that
+        module exists).
+        """
+        seen: set[Path] = set(paths)
+        level = list(seen)
+        d = 1
+        while level:
+            expand = depth == 0 or d < depth
+            nxt: list[Path] = []
+            for node in level:
+                edges = self._visit(node)
+                if not expand:
+                    continue
+                if node in self._unresolved:
+                    return None
+                seen.update(self._star_dirs.get(node, ()))
+                for child in edges:
+                    if child not in seen:
+                        seen.add(child)
+                        nxt.append(child)
+            level = nxt
+            d += 1
+        return seen
@@ -0,0 +1,251 @@
+"""Scan manifest for incremental runs.
+
+A manifest records the outcome of the previous scan of a test tree: for
+every test file its size and ``mtime_ns``, sentinels, group prefix,
+assigned name and the source files its sentinels were aggregated from.
+The next incremental run reuses the entries of files that are unchanged and
+whose dependencies are unchanged, re-analyzes only the rest, and renumbers
+only the prefix groups whose membership changed. A separate manifest is kept
+per test-root/configuration, next to the analysis cache.
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Iterable, Optional
+
+from splurge_test_namer.exceptions import FileReadError, FileWriteError
+from splurge_test_namer.stats import incr
+from splurge_test_namer.util_helpers import safe_file_reader, safe_file_writer
+
+DOMAINS = ["manifest"]
+
+MANIFEST_VERSION = 1
+
+LOGGER = logging.getLogger(__name__)
+
+__all__ = ["ManifestEntry", "ScanManifest"]
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Reusable scan result of one test file.
+
+    Attributes:
+        domains: Sentinel values used to name the file.
+        prefix: Group prefix, ``[PREFIX]_[SENTINEL-TOKENS]``.
+        deps: Files the sentinels were aggregated from, as recorded.
+    """
+
+    domains: list[str]
+    prefix: str
+    deps: Optional[list[str]] = None
+
+
+class ScanManifest:
+    """Previous-run record of a test tree used by incremental scans.
+
+    A file's entry is reused when the file's size and ``mtime_ns`` match and
+    every dependency recorded for it is unchanged. Dependencies include the
+    module locations that were probed but missing, recorded as absent, so a
+    newly created module invalidates the entries it would have changed.
+    Files with an import that resolved to nothing have no dependency list
+    and are always re-analyzed. A file renamed by an
+    applied proposal is matched to its previous entry through the assigned
+    name. All files are classified before the first :meth:`record`, so
+    dependency versions recorded during a run never hide a change from
+    another file.
+
+    Args:
+        cache_dir: Directory where manifest files are stored.
+        root: Test root the manifest describes.
+        config: Scan options that affect results (sentinel, import root,
+            repository root, excludes, prefix, fallback); a different
+            configuration uses a different manifest.
+    """
+
+    def __init__(self, cache_dir: Path, root: Path, config: dict[str, Any]) -> None:
+        self.cache_dir = cache_dir
+        key = json.dumps(
+            {"version": MANIFEST_VERSION, "root": os.path.abspath(root), **config}, sort_keys=True, default=str
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        self.manifest_file = cache_dir / f"manifest-{digest}.json"
+        # previous run (read-only) and this run
+        self._previous: dict[str, dict[str, Any]] = {}
+        self._previous_deps: dict[str, Optional[list[int]]] = {}
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._deps: dict[str, Optional[list[int]]] = {}
+        # this run's key -> previous key it was matched to (None for new files)
+        self._matched: dict[str, Optional[str]] = {}
+        self._by_name: Optional[dict[str, str]] = None
+        self._stats: dict[str, Optional[list[int]]] = {}
+
+    @classmethod
+    def load(cls, cache_dir: Path, root: Path, config: dict[str, Any]) -> "ScanManifest":
+        """Create a manifest for ``root``/``config`` and load the previous run.
+
+        A missing, unreadable or outdated manifest yields an empty one (every
+        file is analyzed); corruption never aborts a run.
+        """
+        manifest = cls(cache_dir, root, config)
+        if not manifest.manifest_file.exists():
+            return manifest
+        try:
+            data = json.loads(safe_file_reader(manifest.manifest_file))
+        except (FileReadError, ValueError) as e:
+            LOGGER.debug("ignoring unreadable scan manifest %s: %s", manifest.manifest_file, e)
+            return manifest
+        if (
+            isinstance(data, dict)
+            and data.get("version") == MANIFEST_VERSION
+            and isinstance(data.get("files"), dict)
+            and isinstance(data.get("deps"), dict)
+        ):
+            manifest._previous = data["files"]
+            manifest._previous_deps = data["deps"]
+        return manifest
+
+    def __len__(self) -> int:
+        return len(self._previous)
+
+    def _stat(self, key: str) -> Optional[list[int]]:
+        """Return ``[size, mtime_ns]`` of ``key`` (once per run), or None if missing."""
+        if key not in self._stats:
+            try:
+                st = os.stat(key)
+                self._stats[key] = [st.st_size, st.st_mtime_ns]
+            except OSError:
+                self._stats[key] = None
+        return self._stats[key]
+
+    def _previous_key(self, key: str) -> Optional[str]:
+        """Return the previous entry ``key`` corresponds to, following applied renames."""
+        if key in self._previous:
+            return key
+        if self._by_name is None:
+            self._by_name = {}
+            for prev, entry in self._previous.items():
+                name = entry.get("name")
+                if name and name != os.path.basename(prev):
+                    self._by_name[os.path.join(os.path.dirname(prev), name)] = prev
+        renamed = self._by_name.get(key)
+        # only a rename if the original path is gone
+        if renamed is not None and self._stat(renamed) is None:
+            return renamed
+        return None
+
+    def lookup(self, path: Path) -> Optional[ManifestEntry]:
+        """Return the previous result for ``path`` if it is still valid.
+
+        Reused entries are carried over into this run's manifest.
+        """
+        key = os.path.abspath(path)
+        prev = self._previous_key(key)
+        self._matched[key] = prev
+        entry = self._previous.get(prev) if prev is not None else None
+        fresh = (
+            entry is not None
+            and entry.get("deps") is not None
+            and [entry.get("size"), entry.get("mtime_ns")] == self._stat(key)
+            and all(d in self._previous_deps and self._previous_deps[d] == self._stat(d) for d in entry["deps"])
+        )
+        incr("manifest_hits" if fresh else "manifest_misses")
+        if not fresh or entry is None:
+            return None
+        self._entries[key] = dict(entry)
+        for d in entry["deps"]:
+            self._deps[d] = self._previous_deps[d]
+        return ManifestEntry(list(entry["domains"]), entry["prefix"], list(entry["deps"]))
+
+    def record(self, path: Path, domains: list[str], prefix: str, deps: Optional[Iterable[Path]]) -> None:
+        """Record the fresh analysis of ``path``.
+
+        Args:
+            path: The test file.
+            domains: Its sentinel values.
+            prefix: Its group prefix.
+            deps: Files its sentinels were aggregated from (paths that do
+                not exist are recorded as absent), or None when they are not
+                known (the file is then always re-analyzed).
+        """
+        key = os.path.abspath(path)
+        if key not in self._matched:
+            self._matched[key] = self._previous_key(key)
+        stat = self._stat(key)
+        dep_keys: Optional[list[str]] = None
+        if deps is not None:
+            dep_keys = sorted({os.path.abspath(d) for d in deps} - {key})
+            for d in dep_keys:
+                self._deps[d] = self._stat(d)
+        self._entries[key] = {
+            "size": stat[0] if stat else None,
+            "mtime_ns": stat[1] if stat else None,
+            "domains": list(domains),
+            "prefix": prefix,
+            "deps": dep_keys,
+        }
+
+    def affected_prefixes(self) -> set[str]:
+        """Return the prefix groups whose membership changed since the previous run.
+
+        A group is affected when a file joined or left it (new, deleted or
+        re-prefixed files) or a member's path changed.
+        """
+        affected: set[str] = set()
+        matched_previous: set[str] = set()
+        for key, entry in self._entries.items():
+            prev = self._matched.get(key)
+            if prev is None:
+                affected.add(entry["prefix"])
+                continue
+            matched_previous.add(prev)
+            prev_prefix = self._previous[prev].get("prefix")
+            if prev != key or prev_prefix != entry["prefix"] or not self._previous[prev].get("name"):
+                affected.add(entry["prefix"])
+                if prev_prefix is not None:
+                    affected.add(prev_prefix)
+        for prev, entry in self._previous.items():
+            prefix = entry.get("prefix")
+            if prev not in matched_previous and prefix is not None:
+                affected.add(prefix)
+        return affected
+
+    def previous_name(self, path: Path) -> Optional[str]:
+        """Return the file name assigned to ``path`` by the previous run."""
+        entry = self._previous.get(os.path.abspath(path))
+        return entry.get("name") if entry is not None else None
+
+    def assign(self, proposals: Iterable[tuple[Path, Path]]) -> None:
+        """Record the names assigned to this run's files."""
+        for orig, prop in proposals:
+            entry = self._entries.get(os.path.abspath(orig))
+            if entry is not None:
+                entry["name"] = prop.name
+
+    def save(self) -> None:
+        """Write this run's manifest; files not seen in this run are dropped.
+
+        Write failures are logged and otherwise ignored.
+        """
+        referenced = {d for entry in self._entries.values() for d in entry.get("deps") or ()}
+        payload = json.dumps(
+            {
+                "version": MANIFEST_VERSION,
+                "files": self._entries,
+                "deps": {d: v for d, v in self._deps.items() if d in referenced},
+            },
+            separators=(",", ":"),
+        )
+        tmp = self.manifest_file.with_name(f"{self.manifest_file.name}.{os.getpid()}.tmp")
+        try:
+            safe_file_writer(tmp, payload)
+            os.replace(tmp, self.manifest_file)
+        except (FileWriteError, OSError) as e:
+            LOGGER.warning("Failed to write scan manifest %s: %s", self.manifest_file, e)
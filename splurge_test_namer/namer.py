@@ -8,12 +8,49 @@ License: MIT
 """
 
 from pathlib import Path
-from splurge_test_namer.parser import read_sentinels_from_file, aggregate_sentinels_for_test
-from splurge_test_namer.util_helpers import safe_file_rglob, safe_file_renamer
-from splurge_test_namer.exceptions import FileGlobError, FileRenameError, SplurgeTestNamerError
+from splurge_test_namer.cache import AnalysisCache
+from splurge_test_namer.constants import (
+    IMPORTS_ALL,
+    NUMBERING_POLICIES,
+    NUMBERING_SEQUENTIAL,
+    READ_FULL,
+    READ_HEADER,
+    READ_MODES,
+)
+from splurge_test_namer.parser import (
+    DEFAULT_IMPORT_POLICY,
+    PARSE_UNREADABLE,
+    ImportPolicy,
+    ModuleSentinelMemo,
+    aggregate_imported_sentinels,
+    analyze_module_cached,
+    star_import_dir,
+)
+from splurge_test_namer.resolver import ModuleIndex
+from splurge_test_namer.importgraph import ImportGraph
+from splurge_test_namer.manifest import ScanManifest
+from splurge_test_namer.output import MODE_APPLY, MODE_DRY_RUN, ProposalWriter
+from splurge_test_namer.profiling import phase, timed_iter
+from splurge_test_namer.stats import RunStats, activate as activate_stats, active_stats, record_file_time
+from splurge_test_namer.renamer import (
+    RenameFailure,
+    RenameOutcome,
+    RenameStep,
+    execute_rename_plan,
+    execute_rename_plan_concurrent,
+    existing_paths,
+    plan_renames,
+)
+from splurge_test_namer.util_helpers import iter_test_files
+from splurge_test_namer.exceptions import FileGlobError, FileRenameError, SentinelReadError, SplurgeTestNamerError
 import re
-from typing import Optional
+from dataclasses import dataclass, replace
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, Optional
 import logging
+import os
+import sys
+import time
 
 DOMAINS = ["namer"]
 
@@ -87,6 +124,428 @@ def slug_sentinel_list(sentinels: list[str], fallback: str = "misc") -> str:
     return joined
 
 
+# Minimum number of test files per worker process when auto-sizing the pool;
+# below this, process start-up and pickling cost more than they save.
+FILES_PER_JOB = 256
+
+# Per-process scan context for pool workers, set once by ``_init_scan_worker``.
+_WORKER_CONTEXT: dict[str, "ScanContext"] = {}
+
+
+@dataclass
+class ScanContext:
+    """Run-scoped state shared by every file analyzed in one scan.
+
+    Create one with :func:`create_scan_context` and analyze files with
+    :func:`read_file_domains`.
+    """
+
+    sentinel: str
+    root_import: Optional[str] = None
+    repo_root: Optional[Path] = None
+    cache: Optional[AnalysisCache] = None
+    resolver: Optional[ModuleIndex] = None
+    memo: Optional[ModuleSentinelMemo] = None
+    # slowest-file count of the parent's RunStats; None when not collecting
+    stats_top_n: Optional[int] = None
+    # incremental runs: test file -> files its sentinels came from (None if
+    # an import did not resolve)
+    deps: Optional[dict[Path, Optional[list[Path]]]] = None
+    # import hops followed for aggregation (0 = unlimited); the graph is
+    # used when following more than one hop
+    follow_depth: int = 1
+    graph: Optional[ImportGraph] = None
+    # test files are analyzed from their header only (``--read-mode header``)
+    header: bool = False
+    policy: ImportPolicy = DEFAULT_IMPORT_POLICY
+
+    def attach_graph(self) -> None:
+        """Create the import graph when transitive following is enabled."""
+        if self.follow_depth != 1 and self.root_import and self.repo_root:
+            self.graph = ImportGraph(
+                self.repo_root, self.root_import, self.sentinel, self.cache, self.resolver, self.policy
+            )
+
+
+def create_scan_context(
+    sentinel: str,
+    root_import: Optional[str] = None,
+    repo_root: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+    memo: Optional[ModuleSentinelMemo] = None,
+    follow_depth: int = 1,
+    read_mode: str = READ_FULL,
+    imports: str = IMPORTS_ALL,
+    skip_type_checking: bool = False,
+    skip_local_imports: bool = False,
+    dependencies: Optional[dict[Path, Optional[list[Path]]]] = None,
+) -> ScanContext:
+    """Create the run-scoped state for analyzing test files.
+
+    Arguments have the same meaning as for :func:`build_proposals`. The
+    analysis cache is loaded from ``cache_dir`` but not saved; callers save
+    ``ctx.cache`` when they are done.
+
+    Raises:
+        SplurgeTestNamerError: If an option value is unsupported.
+    """
+    if read_mode not in READ_MODES:
+        raise SplurgeTestNamerError(f"Unsupported read mode: {read_mode!r}")
+    if follow_depth < 0:
+        raise SplurgeTestNamerError(f"follow_depth must be zero or a positive integer: {follow_depth!r}")
+    ctx = ScanContext(
+        sentinel,
+        header=read_mode == READ_HEADER,
+        policy=ImportPolicy(imports, skip_type_checking, skip_local_imports),
+        deps=dependencies,
+        follow_depth=follow_depth,
+    )
+    if root_import and repo_root:
+        ctx.root_import = root_import
+        ctx.repo_root = repo_root
+        # One index and one memo per run: the repository is walked at most
+        # once, and every imported module is resolved and parsed at most
+        # once across all test files.
+        ctx.resolver = ModuleIndex(repo_root)
+        ctx.memo = memo if memo is not None else ModuleSentinelMemo(sentinel)
+    if cache_dir is not None:
+        ctx.cache = AnalysisCache.load(
+            cache_dir,
+            sentinel,
+            root_import=ctx.root_import,
+            repo_root=ctx.repo_root,
+            header=ctx.header,
+            policy=ctx.policy,
+        )
+    ctx.attach_graph()
+    return ctx
+
+
+def _resolve_jobs(jobs: Optional[int], n_files: int) -> int:
+    """Return the number of worker processes to use for ``n_files`` files."""
+    if jobs is None:
+        return max(1, min(os.cpu_count() or 1, n_files // FILES_PER_JOB))
+    if jobs < 1:
+        raise SplurgeTestNamerError(f"jobs must be a positive integer: {jobs!r}")
+    return max(1, min(jobs, n_files))
+
+
+def read_file_domains(f: Path, ctx: ScanContext) -> list[str]:
+    """Return the sentinel values used to name test file ``f``.
+
+    With ``ctx.deps`` set, the files the sentinels were aggregated from are
+    recorded there under ``f``.
+
+    The file is read and parsed once; its imports and its own sentinel list
+    both come from the same analysis. The analysis time is recorded for
+    run statistics.
+
+    Raises:
+        SentinelReadError: If the test file cannot be read.
+    """
+    start = time.perf_counter()
+    try:
+        return _domains_for(f, ctx)
+    finally:
+        record_file_time(str(f), time.perf_counter() - start)
+
+
+def _domains_for(f: Path, ctx: ScanContext) -> list[str]:
+    analysis = analyze_module_cached(f, ctx.sentinel, ctx.root_import, ctx.repo_root, ctx.cache, ctx.header, ctx.policy)
+    if analysis.status == PARSE_UNREADABLE:
+        raise SentinelReadError(f"Failed to extract sentinels from {f}")
+    if ctx.root_import and ctx.repo_root:
+        graph = ctx.graph
+        if graph is not None:
+            direct = list(dict.fromkeys(p for mod in sorted(analysis.imports) for p in graph.resolve(mod)))
+            domains = sorted(graph.closure_sentinels(direct, ctx.follow_depth))
+        else:
+            domains = aggregate_imported_sentinels(
+                analysis.imports, ctx.repo_root, ctx.sentinel, ctx.cache, ctx.resolver, ctx.memo
+            )
+        # If aggregation via imports yielded nothing, fall back to the
+        # module's own sentinel assignment so in-file DOMAINS are not
+        # silently ignored. This covers cases where tests reference the
+        # import-root but imported modules have no sentinels.
+        if not domains:
+            logging.getLogger(__name__).debug("aggregation returned empty for %s; falling back to in-file sentinel", f)
+            domains = analysis.sentinels
+        if ctx.deps is not None:
+            deps = _dependencies(analysis.imports, ctx, analysis.star_imports)
+            if deps is not None and graph is not None:
+                reached = graph.closure_files(direct, ctx.follow_depth)
+                deps = None if reached is None else deps + sorted(reached)
+            ctx.deps[f] = deps
+        return domains
+    if ctx.deps is not None:
+        ctx.deps[f] = []
+    return analysis.sentinels
+
+
+def _dependencies(imports: Iterable[str], ctx: ScanContext, star_imports: Iterable[str] = ()) -> Optional[list[Path]]:
+    """Return the files the memoized ``imports`` depend on, or None if one did not resolve.
+
+    Besides the resolved files, the module and package locations probed for
+    names that only resolved after stripping trailing components are
+    included (they do not exist yet), so creating such a module is noticed.
+    The directories of ``star_imports`` packages are included as well: adding
+    or removing a submodule changes what ``from package import *`` imports.
+    """
+    graph, memo, repo_root = ctx.graph, ctx.memo, ctx.repo_root
+    if repo_root is None or (memo is None and graph is None):
+        return None
+    deps: list[Path] = []
+    for mod in imports:
+        if graph is not None:
+            paths: Optional[tuple[Path, ...]] = graph.resolve(mod)
+        else:
+            paths = memo.module_paths(mod, repo_root) if memo is not None else None
+        if not paths:
+            return None
+        deps.extend(paths)
+        base = mod
+        while base:
+            module_file = repo_root.joinpath(*base.split(".")).with_suffix(".py")
+            package_init = repo_root.joinpath(*base.split("."), "__init__.py")
+            if module_file in paths or package_init in paths:
+                break
+            deps.extend((module_file, package_init))
+            base = base.rpartition(".")[0]
+    deps.extend(star_import_dir(package, repo_root) for package in star_imports)
+    return deps
+
+
+def _init_scan_worker(ctx: ScanContext, cache_dir: Optional[Path]) -> None:
+    """Initialize the per-process scan context in a pool worker.
+
+    Each worker loads its own view of the on-disk cache; the resolver index
+    and memo arrive pickled from the parent.
+    """
+    if cache_dir is not None:
+        ctx.cache = AnalysisCache.load(
+            cache_dir,
+            ctx.sentinel,
+            root_import=ctx.root_import,
+            repo_root=ctx.repo_root,
+            header=ctx.header,
+            policy=ctx.policy,
+        )
+    ctx.attach_graph()
+    # Forked workers inherit the parent's collector; always start fresh.
+    activate_stats(RunStats(ctx.stats_top_n) if ctx.stats_top_n is not None else None)
+    _WORKER_CONTEXT["ctx"] = ctx
+
+
+def _scan_in_worker(
+    f: Path,
+) -> tuple[list[str], dict[str, dict[str, Any]], Optional[dict[str, Any]], Optional[list[Path]]]:
+    """Read the domains of ``f`` in a pool worker.
+
+    Returns the domains plus the cache entries, run statistics and (for
+    incremental runs) dependencies produced while doing so, so the parent
+    can merge them into its own.
+    """
+    ctx = _WORKER_CONTEXT["ctx"]
+    domains = read_file_domains(f, ctx)
+    stats = active_stats()
+    return (
+        domains,
+        (ctx.cache.take_updates() if ctx.cache is not None else {}),
+        (stats.take() if stats is not None else None),
+        (ctx.deps.pop(f, None) if ctx.deps is not None else None),
+    )
+
+
+def _iter_domains_parallel(
+    files: Iterator[Path], workers: int, ctx: ScanContext, cache_dir: Optional[Path]
+) -> Iterator[tuple[Path, list[str]]]:
+    """Yield ``(path, domains)`` for ``files`` using a process pool, in input order.
+
+    Files are submitted in bounded batches so results stream out while the
+    walk continues and memory stays proportional to the batch size.
+    """
+    # imported here: process pools pull in multiprocessing, which serial
+    # runs never need
+    from concurrent.futures import ProcessPoolExecutor
+
+    if ctx.resolver is not None:
+        # Walk the repository once here instead of once per worker.
+        ctx.resolver.build()
+    batch_size = workers * FILES_PER_JOB
+    parent_stats = active_stats()
+    worker_ctx = replace(
+        ctx, cache=None, graph=None, stats_top_n=parent_stats.top_n if parent_stats is not None else None
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_scan_worker,
+        initargs=(worker_ctx, cache_dir),
+    ) as pool:
+        while True:
+            batch = list(islice(files, batch_size))
+            if not batch:
+                break
+            # A few chunks per worker balances load without per-file IPC overhead.
+            chunksize = max(1, len(batch) // (workers * 4))
+            for f, (domains, updates, worker_stats, deps) in zip(
+                batch, pool.map(_scan_in_worker, batch, chunksize=chunksize)
+            ):
+                if ctx.cache is not None and updates:
+                    ctx.cache.merge(updates)
+                if ctx.deps is not None:
+                    ctx.deps[f] = deps
+                if parent_stats is not None and worker_stats is not None:
+                    parent_stats.merge(worker_stats)
+                yield f, domains
+
+
+def _iter_domains(
+    files: Iterator[Path], ctx: ScanContext, jobs: Optional[int], cache_dir: Optional[Path]
+) -> Iterator[tuple[Path, list[str]]]:
+    """Yield ``(path, domains)`` for ``files`` serially or with a process pool.
+
+    The walk is lazy, so when auto-sizing only a bounded head of the file
+    stream is buffered to decide whether a pool is worth starting.
+    """
+    cap = FILES_PER_JOB * (os.cpu_count() or 1)
+    head = list(islice(files, cap))
+    # a full head means at least ``cap`` files: enough for every CPU
+    n_hint = len(head) if len(head) < cap else cap
+    workers = _resolve_jobs(jobs, n_hint)
+    stream = chain(head, files)
+    if workers > 1:
+        yield from _iter_domains_parallel(stream, workers, ctx, cache_dir)
+    else:
+        for f in stream:
+            yield f, read_file_domains(f, ctx)
+
+
+@dataclass(frozen=True)
+class FileProposal:
+    """Per-file result of the streaming scan, before sequence numbering.
+
+    Attributes:
+        path: The test file.
+        domains: Sentinel values used to name the file.
+        prefix: Proposed base name, ``[PREFIX]_[SENTINEL-TOKENS]``.
+    """
+
+    path: Path
+    domains: list[str]
+    prefix: str
+
+
+def iter_proposals(
+    root: Path,
+    sentinel: str,
+    root_import: Optional[str] = None,
+    repo_root: Optional[Path] = None,
+    excludes: Optional[list[str]] = None,
+    fallback: str = "misc",
+    prefix: str = "test",
+    cache_dir: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    memo: Optional[ModuleSentinelMemo] = None,
+    manifest: Optional[ScanManifest] = None,
+    follow_depth: int = 1,
+    read_mode: str = READ_FULL,
+    imports: str = IMPORTS_ALL,
+    skip_type_checking: bool = False,
+    skip_local_imports: bool = False,
+    dependencies: Optional[dict[Path, Optional[list[Path]]]] = None,
+) -> Iterator[FileProposal]:
+    """Stream per-file analysis results as test files are walked and analyzed.
+
+    This is the first phase of :func:`build_proposals`: it yields a
+    :class:`FileProposal` for every test file as soon as it is analyzed, in
+    sorted path order. Sequence numbers need every file of a prefix group,
+    so they are assigned afterwards by :func:`number_proposals`, which only
+    needs the lightweight ``(prefix, path)`` pairs. Arguments have the same
+    meaning as for :func:`build_proposals`. The analysis cache is saved when
+    the generator finishes or is closed.
+
+    With a ``manifest`` (incremental mode), the file list is collected first
+    and only files the manifest cannot vouch for are analyzed; every result
+    is recorded in the manifest. The caller saves the manifest.
+
+    ``dependencies``, if given, is filled with the files each test file's
+    sentinels were aggregated from (see :func:`build_proposals`).
+
+    Raises:
+        SplurgeTestNamerError: If test files cannot be discovered, a
+            sentinel token is invalid or an option value is unsupported.
+    """
+    ctx = create_scan_context(
+        sentinel,
+        root_import=root_import,
+        repo_root=repo_root,
+        cache_dir=cache_dir,
+        memo=memo,
+        follow_depth=follow_depth,
+        read_mode=read_mode,
+        imports=imports,
+        skip_type_checking=skip_type_checking,
+        skip_local_imports=skip_local_imports,
+        dependencies=dependencies,
+    )
+
+    try:
+        # helpers directories and any explicitly excluded directory names
+        # are pruned during the walk, so excluded trees are never traversed.
+        files = timed_iter(iter_test_files(root, excludes), "glob")
+        if manifest is not None:
+            yield from _iter_incremental(files, manifest, ctx, jobs, cache_dir, prefix, fallback)
+            return
+        for f, domains in _iter_domains(files, ctx, jobs, cache_dir):
+            # Sequences are assigned globally per prefix across the entire
+            # provided root. This requires that the base name (prefix + slug)
+            # is unique across test-root.
+            with phase("naming"):
+                file_prefix = f"{prefix}_" + slug_sentinel_list(domains, fallback=fallback)
+            yield FileProposal(f, domains, file_prefix)
+    except FileGlobError as e:
+        raise SplurgeTestNamerError(f"Failed to glob test files in {root}") from e
+    finally:
+        if ctx.cache is not None:
+            ctx.cache.save()
+
+
+def _iter_incremental(
+    files: Iterator[Path],
+    manifest: ScanManifest,
+    ctx: ScanContext,
+    jobs: Optional[int],
+    cache_dir: Optional[Path],
+    prefix: str,
+    fallback: str,
+) -> Iterator[FileProposal]:
+    """Yield proposals for ``files``, analyzing only those ``manifest`` cannot reuse."""
+    reused = {}
+    all_files = []
+    # classify every file before anything is recorded (see ScanManifest)
+    for f in files:
+        all_files.append(f)
+        entry = manifest.lookup(f)
+        if entry is not None:
+            reused[f] = entry
+    if ctx.deps is None:
+        ctx.deps = {}
+    for f, entry in reused.items():
+        ctx.deps[f] = [Path(d) for d in entry.deps] if entry.deps is not None else None
+    dirty = (f for f in all_files if f not in reused)
+    fresh = dict(_iter_domains(dirty, ctx, jobs, cache_dir))
+    for f in all_files:
+        entry = reused.get(f)
+        if entry is not None:
+            yield FileProposal(f, entry.domains, entry.prefix)
+            continue
+        domains = fresh[f]
+        with phase("naming"):
+            file_prefix = f"{prefix}_" + slug_sentinel_list(domains, fallback=fallback)
+        manifest.record(f, domains, file_prefix, ctx.deps.get(f))
+        yield FileProposal(f, domains, file_prefix)
+
+
 def build_proposals(
     root: Path,
     sentinel: str,
@@ -95,56 +554,200 @@ def build_proposals(
     excludes: Optional[list[str]] = None,
     fallback: str = "misc",
     prefix: str = "test",
+    cache_dir: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    memo: Optional[ModuleSentinelMemo] = None,
+    on_result: Optional[Callable[[FileProposal], None]] = None,
+    incremental: bool = False,
+    numbering: str = NUMBERING_SEQUENTIAL,
+    follow_depth: int = 1,
+    read_mode: str = READ_FULL,
+    imports: str = IMPORTS_ALL,
+    skip_type_checking: bool = False,
+    skip_local_imports: bool = False,
+    dependencies: Optional[dict[Path, Optional[list[Path]]]] = None,
 ) -> list[tuple[Path, Path]]:
     """Scan test files and return a list of (original_path, proposed_path).
 
     If root_import and repo_root are provided, aggregate sentinels from imported
     modules under that root when building prefixes.
+
+    If cache_dir is provided, per-file sentinel and import extraction results
+    are persisted there so later runs only re-parse files that changed.
+
+    jobs controls how many worker processes analyze files: ``1`` keeps the
+    scan serial and ``None`` sizes the pool from the CPU count and the number
+    of files. Results are identical regardless of the worker count.
+
+    memo memoizes the sentinels of imported modules across all test files; a
+    fresh one is used per call unless the caller passes one to reuse across
+    calls (only valid while the source modules are unchanged).
+
+    on_result, if given, is called with each :class:`FileProposal` as soon as
+    the file is analyzed, e.g. to report progress. Only ``(prefix, path)``
+    pairs are retained until numbering.
+
+    incremental keeps a :class:`~splurge_test_namer.manifest.ScanManifest`
+    of the run in ``cache_dir``: the next incremental run only re-analyzes
+    test files that are new or changed or whose imported source files
+    changed, and only renumbers prefix groups whose membership changed.
+    Results are identical to a full run.
+
+    numbering selects the sequence numbering policy (see
+    :func:`number_proposals`): ``sequential`` renumbers every group from
+    ``0001``; ``stable`` keeps existing numbers so only new files and files
+    whose prefix changed are renamed.
+
+    follow_depth sets how many import hops are followed when aggregating
+    sentinels under ``root_import``: ``1`` (default) uses the modules a test
+    imports directly, larger values also follow their imports, and ``0``
+    follows imports without limit. Transitive following uses one
+    :class:`~splurge_test_namer.importgraph.ImportGraph` per run, so each
+    module is parsed once however many tests reach it.
+
+    read_mode ``header`` reads each test file only up to its first
+    module-level function or class (see
+    :func:`~splurge_test_namer.parser.analyze_module`), so imports made
+    inside test functions are not followed; ``full`` (default) reads whole
+    files.
+
+    imports, skip_type_checking and skip_local_imports form the
+    :class:`~splurge_test_namer.parser.ImportPolicy` used to find imports:
+    ``all`` (default) walks every node, ``toplevel`` and ``static`` visit
+    statements only and trade dynamic-import coverage for speed on large
+    files; the switches ignore ``if TYPE_CHECKING:`` blocks and imports made
+    inside functions.
+
+    dependencies, if given, is filled with test file -> files its sentinels
+    were aggregated from (the imported modules, plus module locations that
+    were probed but do not exist), or None when an import did not resolve.
+    :func:`~splurge_test_namer.plan.write_plan` fingerprints these files.
+
+    Raises:
+        SplurgeTestNamerError: If ``incremental`` is set without ``cache_dir``,
+            ``numbering``, ``read_mode`` or ``imports`` is not supported or
+            ``follow_depth`` is negative.
     """
-    try:
-        files: list[Path] = sorted(safe_file_rglob(root, "*.py"))
-    except FileGlobError as e:
-        raise SplurgeTestNamerError(f"Failed to glob test files in {root}") from e
+    if numbering not in NUMBERING_POLICIES:
+        raise SplurgeTestNamerError(f"Unsupported numbering policy: {numbering!r}")
+    manifest: Optional[ScanManifest] = None
+    if incremental:
+        if cache_dir is None:
+            raise SplurgeTestNamerError("Incremental mode requires a cache directory")
+        manifest = ScanManifest.load(
+            cache_dir,
+            root,
+            {
+                "sentinel": sentinel,
+                "root_import": root_import if root_import and repo_root else None,
+                "repo_root": os.path.abspath(repo_root) if root_import and repo_root else None,
+                "excludes": sorted(excludes or []),
+                "fallback": fallback,
+                "prefix": prefix,
+                "numbering": numbering,
+                "follow_depth": follow_depth,
+                "read_mode": read_mode,
+                "imports": [imports, skip_type_checking, skip_local_imports],
+            },
+        )
+    pairs: list[tuple[str, Path]] = []
+    for result in iter_proposals(
+        root,
+        sentinel,
+        root_import=root_import,
+        repo_root=repo_root,
+        excludes=excludes,
+        fallback=fallback,
+        prefix=prefix,
+        cache_dir=cache_dir,
+        jobs=jobs,
+        memo=memo,
+        manifest=manifest,
+        follow_depth=follow_depth,
+        read_mode=read_mode,
+        imports=imports,
+        skip_type_checking=skip_type_checking,
+        skip_local_imports=skip_local_imports,
+        dependencies=dependencies,
+    ):
+        if on_result is not None:
+            on_result(result)
+        pairs.append((result.prefix, result.path))
+    if manifest is None:
+        return number_proposals(pairs, numbering)
+    with phase("naming"):
+        proposals = _number_incremental(pairs, manifest, numbering)
+    manifest.assign(proposals)
+    manifest.save()
+    return proposals
+
+
+def number_proposals(
+    pairs: Iterable[tuple[str, Path]], numbering: str = NUMBERING_SEQUENTIAL
+) -> list[tuple[Path, Path]]:
+    """Assign sequence numbers to ``(prefix, path)`` pairs.
+
+    Files are grouped by prefix; groups are emitted in sorted prefix order
+    and files in case-insensitive path order within a group. With the
+    ``sequential`` policy each group is numbered ``0001``, ``0002``, ... With
+    the ``stable`` policy files already named ``<prefix>_NNNN.py`` keep their
+    number (the first in path order wins if two share one) and the other
+    files get the numbers after the group's highest, so adding or moving a
+    file never renames its neighbours. This is the second phase of
+    :func:`build_proposals`.
+
+    Args:
+        pairs: ``(prefix, path)`` pairs.
+        numbering: One of :data:`NUMBERING_POLICIES`.
+
+    Returns:
+        A list of (original_path, proposed_path) tuples.
+
+    Raises:
+        SplurgeTestNamerError: If the policy is unknown or a proposed filename
+            is too long or does not match the allowed pattern.
+    """
+    with phase("naming"):
+        return _number_proposals(pairs, numbering)
+
+
+def _group_names(prefix: str, flist_sorted: list[Path], numbering: str) -> list[str]:
+    """Return the proposed names for the sorted members of one prefix group."""
+    if numbering == NUMBERING_SEQUENTIAL:
+        return [f"{prefix}_{idx:04d}.py" for idx in range(1, len(flist_sorted) + 1)]
+    numbered = re.compile(rf"^{re.escape(prefix)}_(\d{{4,}})\.py$")
+    names: dict[Path, str] = {}
+    taken: set[int] = set()
+    for f in flist_sorted:
+        m = numbered.match(f.name)
+        if m is not None and int(m.group(1)) > 0 and int(m.group(1)) not in taken:
+            taken.add(int(m.group(1)))
+            names[f] = f.name
+    next_seq = max(taken, default=0) + 1
+    for f in flist_sorted:
+        if f not in names:
+            names[f] = f"{prefix}_{next_seq:04d}.py"
+            next_seq += 1
+    return [names[f] for f in flist_sorted]
+
+
+def _number_proposals(
+    pairs: Iterable[tuple[str, Path]], numbering: str = NUMBERING_SEQUENTIAL
+) -> list[tuple[Path, Path]]:
+    if numbering not in NUMBERING_POLICIES:
+        raise SplurgeTestNamerError(f"Unsupported numbering policy: {numbering!r}")
     # Group proposals by file_prefix only so sequence numbers are global
     # across the provided root. The base name [PREFIX]_[SENTINEL-TOKENS]
     # must be unique across the test-root to avoid collisions.
     groups: dict[str, list[Path]] = {}
-    mapping: dict[Path, str] = {}
-    exclude_set = {e.lower() for e in (excludes or [])}
-    for f in files:
-        # skip helpers directories and any explicitly excluded directory names
-        if any(part.lower() == "helpers" for part in f.parts):
-            continue
-        if exclude_set and any(part.lower() in exclude_set for part in f.parts):
-            continue
-        if not f.name.startswith("test_"):
-            continue
-        if root_import and repo_root:
-            domains = aggregate_sentinels_for_test(f, root_import, repo_root, sentinel)
-            # If aggregation via imports yielded nothing, fall back to reading
-            # the module's own sentinel assignment so in-file DOMAINS are not
-            # silently ignored. This covers cases where tests reference the
-            # import-root but imported modules have no sentinels.
-            logger = logging.getLogger(__name__)
-            if not domains:
-                logger.debug("aggregation returned empty for %s; falling back to in-file sentinel", f)
-                domains = read_sentinels_from_file(f, sentinel)
-        else:
-            domains = read_sentinels_from_file(f, sentinel)
-        # Compute prefix for this file and group it. Sequences are assigned
-        # globally per prefix across the entire provided root. This requires
-        # that the base name (prefix + slug) is unique across test-root.
-        file_prefix = f"{prefix}_" + slug_sentinel_list(domains, fallback=fallback)
-        mapping[f] = file_prefix
+    for file_prefix, f in pairs:
         groups.setdefault(file_prefix, []).append(f)
 
     proposals: list[tuple[Path, Path]] = []
     # Sort by prefix to produce deterministic ordering.
     for prefix, flist in sorted(groups.items(), key=lambda kv: kv[0]):
         flist_sorted = sorted(flist, key=lambda p: str(p).lower())
-        for idx, f in enumerate(flist_sorted, start=1):
-            seq = f"{idx:04d}"
-            new_name = f"{prefix}_{seq}.py"
+        for f, new_name in zip(flist_sorted, _group_names(prefix, flist_sorted, numbering)):
             # sanity check: prevent generating absurdly long filenames
             if len(new_name) > 240:
                 raise SplurgeTestNamerError(
@@ -160,32 +763,79 @@ def build_proposals(
     return proposals
 
 
-def show_dry_run(proposals: list[tuple[Path, Path]]) -> None:
+def _number_incremental(
+    pairs: list[tuple[str, Path]], manifest: ScanManifest, numbering: str = NUMBERING_SEQUENTIAL
+) -> list[tuple[Path, Path]]:
+    """Number ``pairs`` like :func:`number_proposals`, renumbering only affected groups.
+
+    Groups whose membership is unchanged since the manifest's run keep the
+    names assigned then, which are exactly what renumbering would produce.
+    """
+    affected = manifest.affected_prefixes()
+    groups: dict[str, list[Path]] = {}
+    for file_prefix, f in pairs:
+        groups.setdefault(file_prefix, []).append(f)
+    proposals: list[tuple[Path, Path]] = []
+    for file_prefix, flist in sorted(groups.items(), key=lambda kv: kv[0]):
+        names = None if file_prefix in affected else [manifest.previous_name(f) for f in flist]
+        if names is None or None in names:
+            proposals.extend(_number_proposals(((file_prefix, f) for f in flist), numbering))
+            continue
+        reused = sorted(zip(flist, names), key=lambda fn: str(fn[0]).lower())
+        proposals.extend((f, f.with_name(name)) for f, name in reused if name is not None)
+    return proposals
+
+
+def show_dry_run(proposals: list[tuple[Path, Path]], writer: Optional[ProposalWriter] = None) -> None:
     """Pretty-print a dry-run of rename proposals.
 
     Args:
         proposals: List of tuples (original_path, proposed_path).
+        writer: Report writer; defaults to text on stdout.
     """
-    print("DRY RUN - original | proposed")
+    if writer is None:
+        writer = ProposalWriter(sys.stdout)
+    writer.begin(MODE_DRY_RUN)
     for orig, prop in proposals:
-        print(f"{orig} | {prop.name}")
+        writer.proposal(orig, prop)
+    writer.end()
 
 
-def apply_renames(proposals: list[tuple[Path, Path]], force: bool = False) -> None:
+def apply_renames(
+    proposals: list[tuple[Path, Path]],
+    force: bool = False,
+    writer: Optional[ProposalWriter] = None,
+    workers: int = 1,
+) -> None:
     """Apply rename proposals to the filesystem.
 
-    This function validates the proposals list for conflicts and uses
-    ``safe_file_renamer`` which performs pre-flight checks and avoids
-    accidental overwrites by default.
+    This function validates the proposals list for conflicts, refuses to
+    overwrite files outside the batch unless ``force`` is set, and executes
+    the batch with :func:`~splurge_test_namer.renamer.plan_renames`, so
+    renames whose targets are other proposals' sources (including swaps and
+    longer cycles) complete in a single pass. No-op proposals are skipped.
+
+    With ``workers > 1`` the existence checks and the independent chains
+    and cycles of the plan run in a thread pool of that size (see
+    :func:`~splurge_test_namer.renamer.execute_rename_plan_concurrent`).
+    Completed renames are then reported in plan order, independent of
+    thread scheduling; after a failure no further chain is started and the
+    error lists every failed rename. On either path the error also names
+    any file a broken rename cycle left at its temporary name.
 
     Args:
         proposals: List of (original_path, proposed_path) tuples.
+        force: Allow overwriting existing files that are not being renamed.
+        writer: Report writer for applied renames; defaults to text on stdout.
+        workers: Number of threads executing renames (``1`` = serial).
 
     Raises:
         SplurgeTestNamerError: On validation failures or rename errors.
     """
     if not isinstance(proposals, list):
         raise SplurgeTestNamerError("Proposals must be a list")
+    if workers < 1:
+        raise SplurgeTestNamerError(f"workers must be a positive integer: {workers!r}")
 
     # Validate proposal structure early to avoid attribute errors when
     # consumers pass incorrect types (e.g., strings). Each proposal must be
@@ -197,34 +847,65 @@ def apply_renames(proposals: list[tuple[Path, Path]], force: bool = False) -> No
         if not isinstance(o, Path) or not isinstance(p, Path):
             raise SplurgeTestNamerError("Invalid proposal paths; expected Path objects")
 
-    targets = {p for _, p in proposals}
-    origins = {o for o, _ in proposals}
-    for t in targets:
-        if t.exists() and t not in origins:
-            if not force:
-                raise SplurgeTestNamerError(f"Target exists and is not being renamed: {t}")
-            # If force is enabled, allow overwriting existing targets that are
-            # not part of the current origins. The underlying safe_file_renamer
-            # will be invoked with overwrite=True when performing the rename.
-            continue
+    # Targets that are moved by the plan are vacated before use; every other
+    # existing target, including a file a no-op proposal keeps in place,
+    # needs a filesystem check. If force is enabled, existing targets outside
+    # the batch are replaced by the rename (plan_renames still refuses to
+    # overwrite a file the batch keeps).
+    targets = {p for o, p in proposals if o != p}
+    origins = {o for o, p in proposals if o != p}
+    if not force:
+        for t in existing_paths((t for t in targets if t not in origins), workers):
+            raise SplurgeTestNamerError(f"Target exists and is not being renamed: {t}")
 
     for orig, prop in proposals:
-        if not isinstance(orig, Path) or not isinstance(prop, Path):
-            raise SplurgeTestNamerError("Invalid proposal paths; expected Path objects")
         if orig == prop:
             continue
-
         # Prevent accidental rename across different drives on Windows
         try:
             if hasattr(orig, "drive") and hasattr(prop, "drive") and orig.drive != prop.drive:
                 raise SplurgeTestNamerError(f"Source and destination are on different drives: {orig} -> {prop}")
+        except SplurgeTestNamerError:
+            raise
         except Exception:
             # Best effort; continue if drive checks aren't applicable
             pass
 
-        print(f"[{orig}] -> [{prop}]")
+    # Order the renames so a target that is another proposal's source is
+    # moved out of the way first; cycles (e.g. swapped sequence numbers)
+    # go through a temporary name. Existing targets were checked above.
+    with phase("rename"):
+        steps = plan_renames(proposals)
+    if writer is None:
+        writer = ProposalWriter(sys.stdout)
+    ensured_dirs: set[Path] = set()
+    if workers > 1:
+        with phase("rename"):
+            outcome = execute_rename_plan_concurrent(steps, workers, ensured_dirs, overwrite=force)
+        writer.begin(MODE_APPLY)
         try:
-            # honor force flag
-            safe_file_renamer(orig, prop, overwrite=force)
-        except FileRenameError as e:
-            raise SplurgeTestNamerError(f"Failed to rename {orig} to {prop}") from e
+            for step in outcome.done:
+                if step.final:
+                    writer.rename(step.orig, step.dst)
+        finally:
+            writer.end()
+        if outcome.failures:
+            raise SplurgeTestNamerError(outcome.describe()) from outcome.failures[0].error
+        return
+    done: list[RenameStep] = []
+    writer.begin(MODE_APPLY)
+    try:
+        for n, step in enumerate(steps):
+            if step.final:
+                writer.rename(step.orig, step.dst)
+            try:
+                with phase("rename"):
+                    execute_rename_plan([step], ensured_dirs, overwrite=force)
+            except FileRenameError as e:
+                # same report as the concurrent path, including a file left at a temporary name
+                outcome = RenameOutcome(done, [RenameFailure(step, e)], steps[n + 1 :])
+                raise SplurgeTestNamerError(outcome.describe()) from e
+            done.append(step)
+    finally:
+        # report what was attempted even when a rename fails part-way
+        writer.end()
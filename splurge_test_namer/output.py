@@ -0,0 +1,136 @@
+"""Buffered writers for proposal and rename reports.
+
+Dry-run proposals and applied renames are reported through a
+:class:`ProposalWriter`, which renders each entry in one of
+:data:`OUTPUT_FORMATS` and hands lines to the underlying stream in large
+batches instead of one ``print`` per line. The ``json`` and ``ndjson``
+formats carry the group prefix and sentinels of each entry so tools can
+consume results without parsing the human-readable text.
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+from pathlib import Path
+import json
+from typing import TYPE_CHECKING, Mapping, Optional, TextIO
+
+from splurge_test_namer.constants import OUTPUT_FORMATS
+from splurge_test_namer.exceptions import SplurgeTestNamerError
+from splurge_test_namer.profiling import phase
+
+if TYPE_CHECKING:
+    from splurge_test_namer.namer import FileProposal
+
+DOMAINS = ["output"]
+
+# Number of rendered lines collected before a single write to the stream.
+FLUSH_LINES = 1024
+
+MODE_DRY_RUN = "dry-run"
+MODE_APPLY = "apply"
+MODE_WATCH = "watch"
+
+__all__ = ["OUTPUT_FORMATS", "ProposalWriter", "group_prefix"]
+
+
+def group_prefix(proposed: Path) -> str:
+    """Return the group prefix of a proposed name (``test_core_0001.py`` -> ``test_core``)."""
+    return proposed.stem.rsplit("_", 1)[0]
+
+
+class ProposalWriter:
+    """Render proposals or applied renames to a text stream in batches.
+
+    Call :meth:`begin` once, then :meth:`proposal` or :meth:`rename` per
+    entry, then :meth:`end`. ``json`` output is a single document
+    ``{"mode": ..., "entries": [...], "count": N}`` written incrementally;
+    ``ndjson`` writes one object per entry followed by a summary object.
+
+    Args:
+        stream: Destination stream.
+        fmt: One of :data:`OUTPUT_FORMATS`.
+        metadata: Optional mapping of original path to its
+            :class:`~splurge_test_namer.namer.FileProposal`, used to report
+            sentinels; entries without metadata report ``null`` sentinels.
+
+    Raises:
+        SplurgeTestNamerError: If ``fmt`` is not a supported format.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        fmt: str = "text",
+        metadata: Optional[Mapping[Path, "FileProposal"]] = None,
+    ) -> None:
+        if fmt not in OUTPUT_FORMATS:
+            raise SplurgeTestNamerError(f"Unsupported output format: {fmt!r}")
+        self.stream = stream
+        self.fmt = fmt
+        self.metadata = metadata
+        self.mode = MODE_DRY_RUN
+        self.count = 0
+        self._buf: list[str] = []
+
+    def _emit(self, line: str) -> None:
+        self._buf.append(line)
+        if len(self._buf) >= FLUSH_LINES:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered lines to the stream."""
+        with phase("output"):
+            if self._buf:
+                self.stream.write("\n".join(self._buf) + "\n")
+                self._buf = []
+            self.stream.flush()
+
+    def _record(self, event: str, orig: Path, prop: Optional[Path]) -> dict:
+        meta = self.metadata.get(orig) if self.metadata is not None else None
+        return {
+            "event": event,
+            "original": str(orig),
+            "proposed": str(prop) if prop is not None else None,
+            "prefix": group_prefix(prop) if prop is not None else None,
+            "sentinels": list(meta.domains) if meta is not None else None,
+        }
+
+    def _entry(self, event: str, orig: Path, prop: Optional[Path], text: str) -> None:
+        if self.fmt == "text":
+            self._emit(text)
+        else:
+            rendered = json.dumps(self._record(event, orig, prop))
+            if self.fmt == "json":
+                rendered = ("  " if self.count == 0 else ", ") + rendered
+            self._emit(rendered)
+        self.count += 1
+
+    def begin(self, mode: str = MODE_DRY_RUN) -> None:
+        """Start a report for ``mode`` (``dry-run``, ``apply`` or ``watch``)."""
+        self.mode = mode
+        self.count = 0
+        if self.fmt == "json":
+            self._emit(f'{{"mode": {json.dumps(mode)}, "entries": [')
+        elif self.fmt == "text" and mode == MODE_DRY_RUN:
+            self._emit("DRY RUN - original | proposed")
+
+    def proposal(self, orig: Path, prop: Path) -> None:
+        """Report a dry-run proposal."""
+        self._entry("proposal", orig, prop, f"{orig} | {prop.name}")
+
+    def rename(self, orig: Path, prop: Path) -> None:
+        """Report a rename that is being applied."""
+        self._entry("rename", orig, prop, f"[{orig}] -> [{prop}]")
+
+    def removal(self, orig: Path) -> None:
+        """Report that ``orig`` no longer has a proposal (watch mode)."""
+        self._entry("removed", orig, None, f"{orig} | (removed)")
+
+    def end(self) -> None:
+        """Finish the report and flush it to the stream."""
+        if self.fmt == "json":
+            self._emit(f'], "count": {self.count}}}')
+        elif self.fmt == "ndjson":
+            self._emit(json.dumps({"event": "summary", "mode": self.mode, "count": self.count}))
+        self.flush()
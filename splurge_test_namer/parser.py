@@ -10,21 +10,109 @@ License: MIT
 
 import ast
 import logging
+import os
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Set, Optional
+from typing import Iterable, Iterator, Set, Optional, TYPE_CHECKING
+
+from splurge_test_namer.constants import IMPORT_SCOPES, IMPORTS_ALL, IMPORTS_STATIC, IMPORTS_TOPLEVEL
 
 from splurge_test_namer.util_helpers import (
+    safe_file_contains,
     safe_file_reader,
+    safe_header_reader,
+    safe_tail_reader,
     resolve_module_to_paths,
     resolve_module_to_paths_with_member_fallback,
 )
-from splurge_test_namer.exceptions import FileReadError, SentinelReadError
+from splurge_test_namer.exceptions import FileReadError, SentinelReadError, SplurgeTestNamerError
+from splurge_test_namer.profiling import phase
+from splurge_test_namer.stats import incr
+
+if TYPE_CHECKING:
+    from splurge_test_namer.cache import AnalysisCache
+    from splurge_test_namer.importgraph import ImportGraph
+    from splurge_test_namer.resolver import ModuleIndex
 
 DOMAINS = ["parser"]
 
 __all__ = ["resolve_module_to_paths"]
 
+PARSE_OK = "ok"
+PARSE_SYNTAX_ERROR = "syntax_error"
+PARSE_UNREADABLE = "unreadable"
+
+
+@dataclass(frozen=True)
+class ModuleAnalysis:
+    """Result of analyzing one module with a single read and parse.
+
+    Attributes:
+        path: The analyzed file.
+        status: ``PARSE_OK``, ``PARSE_SYNTAX_ERROR`` (sentinels came from the
+            source-level fallback and no imports were found) or
+            ``PARSE_UNREADABLE`` (the file could not be read). Sentinel-only
+            analyses may be answered from a prefix of the module, in which
+            case ``PARSE_OK`` covers only the parsed prefix.
+        sentinels: Values of the module-level sentinel assignment.
+        static_imports: Names from import statements under the import-root.
+        dynamic_imports: Names from recognized dynamic import calls.
+        imports_scanned: Whether imports were collected for this result.
+        star_imports: Package -> submodule names listed to expand its
+            ``from package import *``. The listing comes from the package
+            directory rather than the analyzed file, so results reused from
+            a cache are only valid while it is unchanged.
+    """
+
+    path: Path
+    status: str
+    sentinels: list[str] = field(default_factory=list)
+    static_imports: frozenset[str] = frozenset()
+    dynamic_imports: frozenset[str] = frozenset()
+    imports_scanned: bool = False
+    star_imports: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def imports(self) -> Set[str]:
+        """All imports found in the module, static and dynamic."""
+        return set(self.static_imports | self.dynamic_imports)
+
+
+@dataclass(frozen=True)
+class ImportPolicy:
+    """Which parts of a module are searched for imports.
+
+    Attributes:
+        scope: ``all`` visits every node, so dynamic import calls are found
+            anywhere; ``toplevel`` visits statements only and recognizes a
+            dynamic import call only when it is a whole expression statement
+            or assigned value; ``static`` visits statements only and finds
+            import statements alone. The statement-only scopes never walk
+            expression subtrees.
+        skip_type_checking: Ignore the body of ``if TYPE_CHECKING:`` blocks.
+        skip_local: Ignore everything inside function bodies.
+
+    Raises:
+        SplurgeTestNamerError: If ``scope`` is not one of the supported scopes.
+    """
+
+    scope: str = IMPORTS_ALL
+    skip_type_checking: bool = False
+    skip_local: bool = False
+
+    def __post_init__(self) -> None:
+        if self.scope not in IMPORT_SCOPES:
+            raise SplurgeTestNamerError(f"Unsupported import scope: {self.scope!r}")
+
+    @property
+    def is_default(self) -> bool:
+        """Whether this is the full ``ast.walk`` policy."""
+        return self == DEFAULT_IMPORT_POLICY
+
+
+DEFAULT_IMPORT_POLICY = ImportPolicy()
+
 
 def _eval_constant_string_binop(node: ast.AST, const_map: Optional[dict[str, str]] = None) -> Optional[str]:
     """Evaluate simple string concatenation BinOp nodes composed of Constant strings.
@@ -52,13 +140,242 @@ def _eval_constant_string_binop(node: ast.AST, const_map: Optional[dict[str, str
     return eval_node(node)
 
 
+def _parse_source(src: str) -> Optional[ast.Module]:
+    """Parse module source, returning None when it is not valid Python."""
+    incr("parses")
+    try:
+        return ast.parse(src)
+    except Exception:
+        incr("parse_failures")
+        return None
+
+
+def _sentinels_from_tree(tree: ast.Module, sentinel: str) -> Optional[list[str]]:
+    """Return the values of a top-level ``sentinel`` assignment in ``tree``.
+
+    Returns None when the module has no such assignment so callers can fall
+    back to the source-level scan.
+    """
+    for node in tree.body:
+        # Handle simple assignments: SENTINEL = ['a', 'b']
+        if isinstance(node, ast.Assign):
+            for t in node.targets:
+                if isinstance(t, ast.Name) and t.id == sentinel:
+                    val = node.value
+                    if isinstance(val, (ast.List, ast.Tuple)):
+                        out: list[str] = []
+                        for el in val.elts:
+                            if isinstance(el, ast.Constant) and isinstance(el.value, str):
+                                out.append(el.value)
+                        return out
+                    return []
+
+        # Handle annotated assignments (PEP 526): SENTINEL: list[str] = ['a']
+        if isinstance(node, ast.AnnAssign):
+            target = node.target
+            if isinstance(target, ast.Name) and target.id == sentinel:
+                # value may be None if only annotation provided; we only
+                # accept cases with an explicit value that's a list/tuple
+                ann_val = node.value
+                if isinstance(ann_val, (ast.List, ast.Tuple)):
+                    out_items: list[str] = []
+                    for el in ann_val.elts:
+                        if isinstance(el, ast.Constant) and isinstance(el.value, str):
+                            out_items.append(el.value)
+                    return out_items
+                return []
+    return None
+
+
+# Runs used by ``_sentinels_from_source``; each is a single character-class
+# repetition, so matching at a position is linear in the run length.
+_WS_RUN = re.compile(r"\s*")
+_ANNOTATION_RUN = re.compile(r"[A-Za-z0-9_\[\],\. ]*")
+_QUOTED = re.compile(r"['\"]([^'\"\n]*)['\"]")
+
+
+def _run_end(pattern: "re.Pattern[str]", src: str, pos: int) -> int:
+    """Return the end of the run of ``pattern`` starting at ``pos`` (``pos`` if there is none)."""
+    m = pattern.match(src, pos)
+    return m.end() if m is not None else pos
+
+
+def _sentinels_from_source(src: str, sentinel: str) -> list[str]:
+    """Locate a bracketed ``sentinel`` list in raw source text.
+
+    Used when the module cannot be parsed or has no top-level assignment.
+    Accepts ``NAME = [...]`` and ``NAME: annotation = [...]`` at the start of
+    any line, indented or not, and returns the quoted strings between the
+    ``[`` and the first ``]`` after it.
+
+    A single left-to-right pass in linear time: occurrences of ``sentinel``
+    are found with :meth:`str.find` and matched literally, the forward check
+    of each only covers its own whitespace and annotation runs, and the
+    search stops at the first candidate without a closing bracket, since no
+    later candidate can have one either.
+    """
+    if not sentinel:
+        return []
+    n = len(src)
+    pos = 0
+    line_start = 0
+    scanned_to = 0
+    indent_end = -1
+    indent_line = -1
+    while True:
+        i = src.find(sentinel, pos)
+        if i == -1:
+            return []
+        pos = i + 1
+        nl = src.rfind("\n", scanned_to, i)
+        if nl != -1:
+            line_start = nl + 1
+        scanned_to = i
+        if indent_line != line_start:
+            indent_line = line_start
+            indent_end = _run_end(_WS_RUN, src, line_start)
+        if i != indent_end:
+            continue
+        j = _run_end(_WS_RUN, src, i + len(sentinel))
+        if j < n and src[j] == ":":
+            j = _run_end(_WS_RUN, src, j + 1)
+            k = _run_end(_ANNOTATION_RUN, src, j)
+            if k == j:
+                continue
+            j = _run_end(_WS_RUN, src, k)
+        if j >= n or src[j] != "=":
+            continue
+        j = _run_end(_WS_RUN, src, j + 1)
+        if j >= n or src[j] != "[":
+            continue
+        close = src.find("]", j + 1)
+        if close == -1:
+            return []
+        return _QUOTED.findall(src, j + 1, close)
+
+
+def _bracket_end(src: str, open_idx: int) -> Optional[int]:
+    """Return the index just past the bracket that closes ``src[open_idx]``.
+
+    A minimal lexer: tracks ``()[]{}`` nesting and skips string literals
+    (including triple-quoted strings and backslash escapes) and comments.
+    Returns None if the bracket is never closed.
+    """
+    depth = 0
+    i = open_idx
+    n = len(src)
+    while i < n:
+        ch = src[i]
+        if ch in "([{":
+            depth += 1
+        elif ch in ")]}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        elif ch == "#":
+            nl = src.find("\n", i)
+            if nl == -1:
+                return None
+            i = nl
+        elif ch in "'\"":
+            quote = src[i : i + 3] if src[i : i + 3] in ("'''", '"""') else ch
+            i += len(quote)
+            while i < n:
+                if src[i] == "\\":
+                    i += 2
+                    continue
+                if src.startswith(quote, i):
+                    break
+                if len(quote) == 1 and src[i] == "\n":
+                    # unterminated single-quoted string
+                    return None
+                i += 1
+            else:
+                return None
+            i += len(quote)
+            continue
+        i += 1
+    return None
+
+
+def _fast_sentinels(src: str, sentinel: str) -> Optional[list[str]]:
+    """Extract sentinels without parsing the whole module.
+
+    Sources that never mention ``sentinel`` have no assignment and yield an
+    empty list. Otherwise the first column-0 ``NAME [: annotation] = [`` or
+    ``= (`` candidate is located with a regex, its closing bracket found with
+    :func:`_bracket_end`, and only the module prefix up to the end of that
+    line is parsed. A successful prefix parse proves the candidate is a real
+    top-level statement (it would otherwise sit inside an unterminated string
+    or bracket), and the first top-level assignment in the prefix wins just
+    as it does for the full AST.
+
+    Returns:
+        The sentinel values, or None when the fast path is ambiguous and the
+        caller must parse the full module.
+    """
+    if not sentinel.isidentifier():
+        return None
+    if sentinel not in src:
+        return []
+    m = re.search(rf"^{sentinel}[ \t]*(?::[^=\n]*)?=[ \t]*[\[(]", src, re.M)
+    if m is None:
+        return None
+    end = _bracket_end(src, m.end() - 1)
+    if end is None:
+        return None
+    nl = src.find("\n", end)
+    prefix = src if nl == -1 else src[: nl + 1]
+    tree = _parse_source(prefix)
+    if tree is None:
+        return None
+    return _sentinels_from_tree(tree, sentinel)
+
+
+# Byte-level prefilter (see ``_may_contain``). Identifiers are NFKC-normalized
+# by the parser, so a file with non-ASCII bytes could spell a name without
+# the bytes searched for; such files are always analyzed.
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+# relative imports resolve to names under the import root without naming it
+_RELATIVE_IMPORT = re.compile(rb"\bfrom[\s\\]*\.")
+_DYNAMIC_IMPORT_CALLS = (b"import_module", b"__import__", b"load_module")
+
+
+def _may_contain(path: Path, sentinel: Optional[str], root_import: Optional[str] = None, dynamic: bool = True) -> bool:
+    """Return False when ``path`` provably has no sentinels and no imports to report.
+
+    A raw byte search of the memory-mapped file for the sentinel name (when
+    given) and, with ``root_import``, for the import root, relative imports
+    and (unless ``dynamic`` is False) the dynamic import functions. Skipped
+    files are counted as ``prefilter_skips``.
+
+    Raises:
+        FileReadError: If the file cannot be read.
+    """
+    needles = [sentinel.encode("utf-8")] if sentinel is not None else []
+    patterns = [_NON_ASCII]
+    if root_import is not None:
+        needles.append(root_import.encode("utf-8"))
+        if dynamic:
+            needles.extend(_DYNAMIC_IMPORT_CALLS)
+        patterns.append(_RELATIVE_IMPORT)
+    with phase("prefilter"):
+        found = safe_file_contains(path, needles, patterns)
+    if not found:
+        incr("prefilter_skips")
+    return found
+
+
 def read_sentinels_from_file(path: Path, sentinel: str) -> list[str]:
     """Extract a module-level sentinel list from a Python source file.
 
-    The function first tries to parse the module AST to find a top-level
-    assignment named ``sentinel`` with a list or tuple of string constants.
-    If AST parsing fails or no assignment is found, a permissive regex
-    fallback is used to locate a bracketed list in the source.
+    Files whose bytes never contain the sentinel name are not decoded. The
+    function then tries a fast path that parses only the module prefix
+    up to the sentinel assignment (or skips parsing entirely when the name
+    never appears). When that is ambiguous it parses the module AST to find a
+    top-level assignment named ``sentinel`` with a list or tuple of string
+    constants. If AST parsing fails or no assignment is found, a permissive
+    regex fallback is used to locate a bracketed list in the source.
 
     Args:
         path: Filesystem path to the Python module.
@@ -71,60 +388,28 @@ def read_sentinels_from_file(path: Path, sentinel: str) -> list[str]:
     Raises:
         SentinelReadError: If reading the file contents fails.
     """
-    try:
-        src = safe_file_reader(path)
-    except FileReadError as e:
-        raise SentinelReadError(f"Failed to extract sentinels from {path}") from e
+    with phase("sentinels"):
+        try:
+            if not _may_contain(path, sentinel):
+                return []
+            src = safe_file_reader(path)
+        except FileReadError as e:
+            raise SentinelReadError(f"Failed to extract sentinels from {path}") from e
 
-    try:
-        tree = ast.parse(src)
-    except Exception:
-        tree = None
-
-    if tree is not None:
-        for node in tree.body:
-            # Handle simple assignments: SENTINEL = ['a', 'b']
-            if isinstance(node, ast.Assign):
-                for t in node.targets:
-                    if isinstance(t, ast.Name) and t.id == sentinel:
-                        val = node.value
-                        if isinstance(val, (ast.List, ast.Tuple)):
-                            out: list[str] = []
-                            for el in val.elts:
-                                if isinstance(el, ast.Constant) and isinstance(el.value, str):
-                                    out.append(el.value)
-                            return out
-                        return []
-
-            # Handle annotated assignments (PEP 526): SENTINEL: list[str] = ['a']
-            if isinstance(node, ast.AnnAssign):
-                target = node.target
-                if isinstance(target, ast.Name) and target.id == sentinel:
-                    # value may be None if only annotation provided; we only
-                    # accept cases with an explicit value that's a list/tuple
-                    ann_val = node.value
-                    if isinstance(ann_val, (ast.List, ast.Tuple)):
-                        out_items: list[str] = []
-                        for el in ann_val.elts:
-                            if isinstance(el, ast.Constant) and isinstance(el.value, str):
-                                out_items.append(el.value)
-                        return out_items
-                    return []
-
-    # fallback: regex
-    # allow leading whitespace before the sentinel so indented assignments (e.g. inside blocks)
-    # Regex fallback: accept optional type annotation between the name and '='
-    # Examples matched:
-    #  DOMAINS = ['a']
-    #  DOMAINS: list[str] = ['a']
-    m = re.search(rf"^\s*{sentinel}(?:\s*:\s*[A-Za-z0-9_\[\],\. ]+)?\s*=\s*\[(.*?)\]", src, re.S | re.M)
-    if m:
-        items = re.findall(r"['\"](.*?)['\"]", m.group(1))
-        return items
-    return []
+        fast = _fast_sentinels(src, sentinel)
+        if fast is not None:
+            return fast
+        tree = _parse_source(src)
+        if tree is not None:
+            items = _sentinels_from_tree(tree, sentinel)
+            if items is not None:
+                return items
+        return _sentinels_from_source(src, sentinel)
 
 
-def find_imports_in_file(path: Path, root_import: str, repo_root: Optional[Path] = None) -> Set[str]:
+def find_imports_in_file(
+    path: Path, root_import: str, repo_root: Optional[Path] = None, policy: ImportPolicy = DEFAULT_IMPORT_POLICY
+) -> Set[str]:
     """Return dotted module names imported in `path` that start with `root_import`.
 
     Handles `import X`, `import X as Y`, `from X import Y`, and `from X.Y import Z`.
@@ -132,21 +417,316 @@ def find_imports_in_file(path: Path, root_import: str, repo_root: Optional[Path]
     string literal: importlib.import_module('pkg.mod'), __import__('pkg.mod'),
     or loader.load_module('pkg.mod') where the loader variable was created via
     importlib.machinery.SourceFileLoader(...).
+
+    Files whose bytes mention neither ``root_import`` nor a relative or
+    dynamic import are not parsed. ``policy`` limits which parts of the
+    module are searched (see :class:`ImportPolicy`).
     """
-    logger = logging.getLogger(__name__)
+    with phase("imports"):
+        try:
+            if not _may_contain(path, None, root_import, policy.scope != IMPORTS_STATIC):
+                return set()
+            src = safe_file_reader(path)
+        except FileReadError:
+            return set()
+        if not src:
+            return set()
+        tree = _parse_source(src)
+        if tree is None:
+            return set()
+        static, dynamic, _ = _imports_from_tree(tree, path, root_import, repo_root, policy)
+        return static | dynamic
+
+
+# First module-level line that ends the header read in header mode: a
+# function, class or decorator at column 0.
+_HEADER_END = re.compile(rb"^(?:(?:async[ \t]+)?def[ \t]|class[ \t]|@)", re.M)
+
+
+def analyze_module(
+    path: Path,
+    sentinel: str,
+    root_import: Optional[str] = None,
+    repo_root: Optional[Path] = None,
+    header: bool = False,
+    policy: ImportPolicy = DEFAULT_IMPORT_POLICY,
+) -> ModuleAnalysis:
+    """Read and parse ``path`` once and extract sentinels and imports.
+
+    Produces the same sentinels as :func:`read_sentinels_from_file` and, when
+    ``root_import`` is given, the same imports as :func:`find_imports_in_file`,
+    but pays for a single read and a single parse. Read failures are reported
+    through the ``status`` field instead of raising. A file whose raw bytes
+    contain neither the sentinel name nor anything that could produce an
+    import (see :func:`_may_contain`) is reported as ``ok`` and empty without
+    being decoded or parsed.
+
+    With ``header`` the file is read in chunks only up to its first
+    module-level ``def``, ``class`` or decorator, and only that header is
+    parsed; imports made inside the functions and classes below it are not
+    seen. The whole module is analyzed instead when imports are scanned
+    with a ``policy`` that finds dynamic import calls (they usually sit in
+    the functions below the header), when the header has no sentinel
+    assignment and the rest of the file mentions the sentinel, or when the
+    header does not parse.
 
+    Args:
+        path: Filesystem path to the Python module.
+        sentinel: Variable name to search for (e.g. "DOMAINS").
+        root_import: Import-root to collect imports for; imports are not
+            scanned when omitted.
+        repo_root: Repository root used to resolve relative and star imports.
+        header: Analyze only the module header.
+        policy: Which parts of the module are searched for imports.
+
+    Returns:
+        The structured analysis result.
+    """
     try:
-        src = safe_file_reader(path)
+        if not _may_contain(path, sentinel, root_import, policy.scope != IMPORTS_STATIC):
+            return ModuleAnalysis(path, PARSE_OK, imports_scanned=root_import is not None)
+        if header and root_import is not None and policy.scope != IMPORTS_STATIC:
+            # dynamic import calls anywhere in the module must be found
+            incr("header_fallbacks")
+            src = safe_file_reader(path)
+        elif header:
+            head, offset = safe_header_reader(path, _HEADER_END)
+            if offset < 0:
+                src = head
+            else:
+                analysis, tail = _analyze_header(path, head, offset, sentinel, root_import, repo_root, policy)
+                if analysis is not None:
+                    incr("header_reads")
+                    return analysis
+                incr("header_fallbacks")
+                src = head + (tail if tail is not None else safe_tail_reader(path, offset))
+        else:
+            src = safe_file_reader(path)
     except FileReadError:
-        return set()
-    if not src:
-        return set()
+        return ModuleAnalysis(path, PARSE_UNREADABLE, imports_scanned=root_import is not None)
+    return _analyze_source(path, src, sentinel, root_import, repo_root, policy)
+
+
+def _analyze_header(
+    path: Path,
+    head: str,
+    offset: int,
+    sentinel: str,
+    root_import: Optional[str],
+    repo_root: Optional[Path],
+    policy: ImportPolicy,
+) -> tuple[Optional[ModuleAnalysis], Optional[str]]:
+    """Analyze a module from its header ``head``, which ends at byte ``offset``.
+
+    The rest of the file is read (but not parsed) when the header has no
+    sentinel assignment, to check that the sentinel is not assigned later.
+
+    Returns:
+        The analysis, or None when the whole module must be analyzed, and
+        the rest of the file if it was read.
+
+    Raises:
+        FileReadError: If the rest of the file must be read and cannot be.
+    """
+    tree = _parse_source(head)
+    if tree is None:
+        return None, None
+    sentinels = _sentinels_from_tree(tree, sentinel)
+    if sentinels is None:
+        tail = safe_tail_reader(path, offset)
+        if sentinel in tail:
+            return None, tail
+        sentinels = _sentinels_from_source(head, sentinel)
+    static: Set[str] = set()
+    dynamic: Set[str] = set()
+    stars: dict[str, list[str]] = {}
+    if root_import is not None:
+        with phase("imports"):
+            static, dynamic, stars = _imports_from_tree(tree, path, root_import, repo_root, policy)
+    analysis = ModuleAnalysis(
+        path,
+        PARSE_OK,
+        sentinels=sentinels,
+        static_imports=frozenset(static),
+        dynamic_imports=frozenset(dynamic),
+        imports_scanned=root_import is not None,
+        star_imports=stars,
+    )
+    return analysis, None
+
+
+def _analyze_source(
+    path: Path,
+    src: str,
+    sentinel: str,
+    root_import: Optional[str],
+    repo_root: Optional[Path],
+    policy: ImportPolicy = DEFAULT_IMPORT_POLICY,
+) -> ModuleAnalysis:
+    """Analyze the full source ``src`` of ``path`` (see :func:`analyze_module`)."""
+    if root_import is None:
+        # Only sentinels are needed: avoid building the full AST when the
+        # fast path can answer from a prefix of the module.
+        fast = _fast_sentinels(src, sentinel)
+        if fast is not None:
+            return ModuleAnalysis(path, PARSE_OK, sentinels=fast)
+
+    tree = _parse_source(src)
+    if tree is None:
+        return ModuleAnalysis(
+            path,
+            PARSE_SYNTAX_ERROR,
+            sentinels=_sentinels_from_source(src, sentinel),
+            imports_scanned=root_import is not None,
+        )
+
+    sentinels = _sentinels_from_tree(tree, sentinel)
+    if sentinels is None:
+        sentinels = _sentinels_from_source(src, sentinel)
+    static: Set[str] = set()
+    dynamic: Set[str] = set()
+    stars: dict[str, list[str]] = {}
+    if root_import is not None:
+        with phase("imports"):
+            static, dynamic, stars = _imports_from_tree(tree, path, root_import, repo_root, policy)
+    return ModuleAnalysis(
+        path,
+        PARSE_OK,
+        sentinels=sentinels,
+        static_imports=frozenset(static),
+        dynamic_imports=frozenset(dynamic),
+        imports_scanned=root_import is not None,
+        star_imports=stars,
+    )
+
+
+def analyze_module_cached(
+    path: Path,
+    sentinel: str,
+    root_import: Optional[str] = None,
+    repo_root: Optional[Path] = None,
+    cache: Optional["AnalysisCache"] = None,
+    header: bool = False,
+    policy: ImportPolicy = DEFAULT_IMPORT_POLICY,
+) -> ModuleAnalysis:
+    """Return :func:`analyze_module` results, consulting ``cache`` when given.
+
+    Unchanged files are served from the cache without being read; fresh
+    results are stored back. Unreadable files are never cached. A cache
+    used with ``header`` or a non-default ``policy`` must have been created
+    with the same settings.
+    """
+    with phase("sentinels"):
+        if cache is None:
+            return analyze_module(path, sentinel, root_import, repo_root, header, policy)
+        analysis = cache.get_analysis(path, need_imports=root_import is not None)
+        if analysis is None:
+            analysis = analyze_module(path, sentinel, root_import, repo_root, header, policy)
+            if analysis.status != PARSE_UNREADABLE:
+                cache.put_analysis(path, analysis)
+        return analysis
+
+
+def star_import_dir(package: str, repo_root: Path) -> Path:
+    """Return the directory ``from package import *`` is expanded from."""
+    return repo_root.joinpath(*package.split("."))
+
+
+def star_import_listing(package: str, repo_root: Path) -> list[str]:
+    """Return the sorted submodule names ``from package import *`` expands to.
+
+    The submodules are the ``.py`` files (other than ``__init__.py``) in the
+    package directory under ``repo_root``; a missing directory has none.
+    """
+    pkg_dir = star_import_dir(package, repo_root)
     try:
-        tree = ast.parse(src)
-    except Exception:
-        return set()
+        if not pkg_dir.is_dir():
+            return []
+        children = pkg_dir.iterdir()
+        return sorted(child.stem for child in children if child.suffix == ".py" and child.name != "__init__.py")
+    except OSError:
+        return []
+
+
+def _expand_star_import(
+    package: str, repo_root: Path, root_import: str, found: Set[str], stars: dict[str, list[str]]
+) -> None:
+    """Add the submodules of ``package`` under ``root_import`` to ``found`` and record the listing in ``stars``."""
+    listing = star_import_listing(package, repo_root)
+    stars[package] = listing
+    for stem in listing:
+        candidate = f"{package}.{stem}"
+        if candidate.startswith(root_import):
+            logging.getLogger(__name__).debug("star-import expansion candidate: %s", candidate)
+            found.add(candidate)
 
+
+def _is_type_checking(test: ast.expr) -> bool:
+    """Whether an ``if`` test is ``TYPE_CHECKING`` or ``<module>.TYPE_CHECKING``."""
+    if isinstance(test, ast.Name):
+        return test.id == "TYPE_CHECKING"
+    return isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING"
+
+
+def _import_nodes(tree: ast.Module, policy: ImportPolicy) -> Iterator[ast.AST]:
+    """Yield the nodes searched for imports under ``policy``.
+
+    The default policy is a plain :func:`ast.walk`. Otherwise statements are
+    visited depth-first, pruning function bodies (``skip_local``) and the
+    body of ``if TYPE_CHECKING:`` blocks (``skip_type_checking``). Scope
+    ``all`` also walks the expressions of every visited statement,
+    ``toplevel`` only yields a call that is a whole expression statement or
+    assigned value, and ``static`` yields import statements alone.
+    """
+    if policy.is_default:
+        yield from ast.walk(tree)
+        return
+    stack: list[ast.AST] = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+            continue
+        if policy.skip_local and isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if policy.skip_type_checking and isinstance(node, ast.If) and _is_type_checking(node.test):
+            stack.extend(reversed(node.orelse))
+            continue
+        if policy.scope == IMPORTS_TOPLEVEL and isinstance(node, (ast.Expr, ast.Assign, ast.AnnAssign)):
+            if isinstance(node.value, ast.Call):
+                yield node.value
+        blocks: list[ast.AST] = []
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+                blocks.append(child)
+            elif policy.scope == IMPORTS_ALL:
+                yield from ast.walk(child)
+        stack.extend(reversed(blocks))
+
+
+def _imports_from_tree(
+    tree: ast.Module,
+    path: Path,
+    root_import: str,
+    repo_root: Optional[Path] = None,
+    policy: ImportPolicy = DEFAULT_IMPORT_POLICY,
+) -> tuple[Set[str], Set[str], dict[str, list[str]]]:
+    """Collect imports under ``root_import`` from a parsed module.
+
+    ``policy`` selects the nodes that are searched (see :func:`_import_nodes`);
+    module-level constant and loader assignments used to resolve dynamic
+    import arguments are always read.
+
+    Returns:
+        A ``(static, dynamic, star_imports)`` triple: names from import
+        statements, names from recognized dynamic import calls and the
+        package listings used to expand star imports (see
+        :attr:`ModuleAnalysis.star_imports`).
+    """
+    logger = logging.getLogger(__name__)
     found: Set[str] = set()
+    dynamic: Set[str] = set()
+    stars: dict[str, list[str]] = {}
     # Map variable names that are assigned to importlib SourceFileLoader(...) so
     # we can recognize subsequent loader.load_module(...) calls as dynamic imports.
     loader_vars: set[str] = set()
@@ -211,7 +791,7 @@ def find_imports_in_file(path: Path, root_import: str, repo_root: Optional[Path]
     except Exception:
         base_module = None
 
-    for n in ast.walk(tree):
+    for n in _import_nodes(tree, policy):
         if isinstance(n, ast.Import):
             for alias in n.names:
                 name = alias.name
@@ -246,17 +826,7 @@ def find_imports_in_file(path: Path, root_import: str, repo_root: Optional[Path]
                         # Expand star imports by listing submodules under the
                         # package directory when repo_root is available.
                         if repo_root is not None and mod:
-                            try:
-                                pkg_dir = repo_root.joinpath(*mod.split("."))
-                                if pkg_dir.exists() and pkg_dir.is_dir():
-                                    for child in pkg_dir.iterdir():
-                                        if child.suffix == ".py" and child.name != "__init__.py":
-                                            candidate = f"{mod}.{child.stem}"
-                                            if candidate.startswith(root_import):
-                                                logger.debug("star-import expansion candidate: %s", candidate)
-                                                found.add(candidate)
-                            except Exception:
-                                pass
+                            _expand_star_import(mod, repo_root, root_import, found, stars)
                         # also keep the module or parent so __init__ can be inspected
                         logger.debug("from-import star keep module: %s", mod or full_mod)
                         if mod:
@@ -277,17 +847,7 @@ def find_imports_in_file(path: Path, root_import: str, repo_root: Optional[Path]
                 for alias in n.names:
                     if alias.name == "*":
                         if repo_root is not None and mod:
-                            try:
-                                pkg_dir = repo_root.joinpath(*mod.split("."))
-                                if pkg_dir.exists() and pkg_dir.is_dir():
-                                    for child in pkg_dir.iterdir():
-                                        if child.suffix == ".py" and child.name != "__init__.py":
-                                            candidate = f"{mod}.{child.stem}"
-                                            if candidate.startswith(root_import):
-                                                logger.debug("star-import expansion candidate: %s", candidate)
-                                                found.add(candidate)
-                            except Exception:
-                                pass
+                            _expand_star_import(mod, repo_root, root_import, found, stars)
                         logger.debug("from-import star keep module: %s", mod)
                         if mod:
                             found.add(mod)
@@ -374,32 +934,164 @@ def find_imports_in_file(path: Path, root_import: str, repo_root: Optional[Path]
                 if modname:
                     if modname.startswith(root_import):
                         logger.debug("dynamic import detected (literal/const): %s", modname)
-                        found.add(modname)
+                        dynamic.add(modname)
                     lead = modname.split(".")[0]
                     if lead.startswith(root_import):
                         logger.debug("dynamic import detected by leading component: %s", modname)
-                        found.add(modname)
-    return found
+                        dynamic.add(modname)
+    return found, dynamic, stars
 
 
-def aggregate_sentinels_for_test(
-    test_path: Path, root_import: str, repo_root: Path, sentinel_name: str = "DOMAINS"
+class ModuleSentinelMemo:
+    """Memo of the sentinels contributed by imported modules.
+
+    Maps each dotted module name to the combined sentinels of the files it
+    resolves to, and each resolved file to its sentinel list, so a module
+    imported by thousands of tests is resolved and parsed once. A memo is
+    bound to one sentinel name; ``build_proposals`` creates one per run, and
+    library callers may pass the same memo to several calls as long as the
+    source modules do not change in between.
+
+    Args:
+        sentinel_name: Sentinel variable name the memo was built for.
+    """
+
+    def __init__(self, sentinel_name: str = "DOMAINS") -> None:
+        self.sentinel_name = sentinel_name
+        self._modules: dict[tuple[Path, str], tuple[str, ...]] = {}
+        self._resolved: dict[tuple[Path, str], tuple[Path, ...]] = {}
+        self._paths: dict[Path, tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def clear(self) -> None:
+        """Forget all memoized modules and files."""
+        self._modules.clear()
+        self._resolved.clear()
+        self._paths.clear()
+
+    def invalidate(self, paths: Iterable[Path]) -> None:
+        """Forget the given files and every module that resolved to one of them.
+
+        Paths are compared in absolute form, whichever form the resolver used.
+        """
+        stale = {os.path.abspath(p) for p in paths}
+        if not stale:
+            return
+        for p in [p for p in self._paths if os.path.abspath(p) in stale]:
+            del self._paths[p]
+        for key in [k for k, resolved in self._resolved.items() if any(os.path.abspath(r) in stale for r in resolved)]:
+            self._modules.pop(key, None)
+            del self._resolved[key]
+
+    def module_paths(self, module_name: str, repo_root: Path) -> Optional[tuple[Path, ...]]:
+        """Return the files a memoized ``module_name`` resolved to.
+
+        Returns None when the module has not been looked up through this memo.
+        """
+        return self._resolved.get((repo_root, module_name))
+
+    def module_sentinels(
+        self,
+        module_name: str,
+        repo_root: Path,
+        cache: Optional["AnalysisCache"] = None,
+        resolver: Optional["ModuleIndex"] = None,
+    ) -> tuple[str, ...]:
+        """Return the sentinels of the files ``module_name`` resolves to.
+
+        Names are resolved with the member-fallback resolver (through
+        ``resolver`` when provided). Unreadable modules contribute nothing.
+        """
+        key = (repo_root, module_name)
+        hit = self._modules.get(key)
+        incr("memo_hits" if hit is not None else "memo_misses")
+        if hit is not None:
+            return hit
+        # Use the member-fallback resolver so dotted member names like
+        # 'pkg.module.Class' will resolve to 'pkg.module' when possible.
+        with phase("resolve"):
+            if resolver is not None:
+                paths = resolver.resolve_with_member_fallback(module_name)
+            else:
+                paths = resolve_module_to_paths_with_member_fallback(module_name, repo_root)
+        items: list[str] = []
+        for p in paths:
+            found = self._paths.get(p)
+            if found is None:
+                found = tuple(analyze_module_cached(p, self.sentinel_name, cache=cache).sentinels)
+                self._paths[p] = found
+            items.extend(found)
+        result = tuple(items)
+        self._modules[key] = result
+        self._resolved[key] = tuple(paths)
+        return result
+
+
+def aggregate_imported_sentinels(
+    imports: Set[str],
+    repo_root: Path,
+    sentinel_name: str = "DOMAINS",
+    cache: Optional["AnalysisCache"] = None,
+    resolver: Optional["ModuleIndex"] = None,
+    memo: Optional[ModuleSentinelMemo] = None,
 ) -> list[str]:
-    """Aggregate sentinel lists from modules imported by `test_path` under `root_import`.
+    """Aggregate sentinel lists from the modules named in ``imports``.
+
+    Module sentinels are looked up through ``memo`` so modules shared by many
+    tests are only resolved and parsed once; a private memo is used when none
+    is given.
 
     Returns a sorted list of unique sentinel strings.
+
+    Raises:
+        SplurgeTestNamerError: If ``memo`` was built for another sentinel name.
     """
-    imports = find_imports_in_file(test_path, root_import, repo_root)
+    if memo is None:
+        memo = ModuleSentinelMemo(sentinel_name)
+    elif memo.sentinel_name != sentinel_name:
+        raise SplurgeTestNamerError(f"Sentinel memo was built for {memo.sentinel_name!r}, not {sentinel_name!r}")
     sentinels: Set[str] = set()
     for mod in sorted(imports):
-        # Use the member-fallback resolver so dotted member names like
-        # 'pkg.module.Class' will resolve to 'pkg.module' when possible.
-        paths = resolve_module_to_paths_with_member_fallback(mod, repo_root)
-        for p in paths:
-            try:
-                items = read_sentinels_from_file(p, sentinel_name)
-            except SentinelReadError:
-                items = []
-            for it in items:
-                sentinels.add(it)
+        sentinels.update(memo.module_sentinels(mod, repo_root, cache, resolver))
     return sorted(sentinels)
+
+
+def aggregate_sentinels_for_test(
+    test_path: Path,
+    root_import: str,
+    repo_root: Path,
+    sentinel_name: str = "DOMAINS",
+    cache: Optional["AnalysisCache"] = None,
+    resolver: Optional["ModuleIndex"] = None,
+    memo: Optional[ModuleSentinelMemo] = None,
+    follow_depth: int = 1,
+    graph: Optional["ImportGraph"] = None,
+) -> list[str]:
+    """Aggregate sentinel lists from modules imported by `test_path` under `root_import`.
+
+    When ``cache`` is provided, per-file analysis results are read from and
+    stored in it. When ``resolver`` is provided, module names are resolved
+    through its prebuilt index instead of probing the filesystem for every
+    name. Passing the same ``memo`` for many tests resolves and parses each
+    imported module only once.
+
+    ``follow_depth`` other than ``1`` also follows the imports of imported
+    modules under ``root_import`` (``0`` without limit) through an
+    :class:`~splurge_test_namer.importgraph.ImportGraph`; pass the same
+    ``graph`` for many tests so every module is parsed once.
+
+    Returns a sorted list of unique sentinel strings.
+    """
+    analysis = analyze_module_cached(test_path, sentinel_name, root_import, repo_root, cache)
+    if follow_depth == 1:
+        return aggregate_imported_sentinels(analysis.imports, repo_root, sentinel_name, cache, resolver, memo)
+    if follow_depth < 0:
+        raise SplurgeTestNamerError(f"follow_depth must be zero or a positive integer: {follow_depth!r}")
+    if graph is None:
+        from splurge_test_namer.importgraph import ImportGraph
+
+        graph = ImportGraph(repo_root, root_import, sentinel_name, cache, resolver)
+    direct = dict.fromkeys(p for mod in sorted(analysis.imports) for p in graph.resolve(mod))
+    return sorted(graph.closure_sentinels(direct, follow_depth))
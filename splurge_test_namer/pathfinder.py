@@ -0,0 +1,206 @@
+"""Filesystem-only module finder for names outside the repository.
+
+``importlib.util.find_spec("a.b.c")`` imports ``a`` and ``a.b`` to locate
+``c``, executing package ``__init__`` code and whatever it imports. This
+module provides :class:`SysPathFinder`, which answers the same question by
+looking at directories only: it snapshots the search path once (``sys.path``
+by default, plus ``src/`` layouts, directories listed in ``.pth`` files and
+setuptools editable-install mappings), lists each directory at most once and
+memoizes every answer.
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+from pathlib import Path
+import logging
+import os
+import re
+import sys
+from typing import Iterable, Optional
+
+DOMAINS = ["pathfinder"]
+
+LOGGER = logging.getLogger(__name__)
+
+# ``MAPPING = {...}`` in setuptools' ``__editable___<dist>_finder.py`` modules.
+_EDITABLE_MAPPING_RE = re.compile(r"^MAPPING\s*(?::[^=\n]*)?=\s*(\{.*?\})\s*$", re.MULTILINE | re.DOTALL)
+
+__all__ = ["SysPathFinder", "default_finder"]
+
+
+class SysPathFinder:
+    """Resolve dotted module names to source files without importing them.
+
+    Resolution follows the import system for source files: the first search
+    path entry containing a regular package (``name/__init__.py``) or a
+    module (``name.py``) wins, directories without ``__init__.py`` act as
+    namespace package portions, and submodules are searched in the parent
+    package's locations. Editable-install mappings are consulted after the
+    search path, as their finders run after the path finder.
+
+    Args:
+        paths: Search path entries; defaults to a snapshot of ``sys.path``
+            (an empty entry means the current working directory).
+        extra_roots: Project roots whose ``src/`` directory, when present,
+            is searched after ``paths`` (``src`` layouts are importable
+            once installed but are not on the path of a checkout).
+    """
+
+    def __init__(self, paths: Optional[Iterable[str]] = None, extra_roots: Iterable[Path] = ()) -> None:
+        self._raw_paths = list(sys.path if paths is None else paths)
+        self._extra_roots = list(extra_roots)
+        self._roots: Optional[list[str]] = None
+        self._mapping: dict[str, str] = {}
+        self._listings: dict[str, Optional[frozenset[str]]] = {}
+        self._memo: dict[str, tuple[Path, ...]] = {}
+        self._locations: dict[str, tuple[str, ...]] = {}
+
+    @property
+    def roots(self) -> list[str]:
+        """Directories searched for top-level names, in order."""
+        if self._roots is None:
+            self._build()
+        return list(self._roots or [])
+
+    def _listdir(self, directory: str) -> Optional[frozenset[str]]:
+        """Return the names in ``directory`` (cached), or None if unreadable."""
+        if directory in self._listings:
+            return self._listings[directory]
+        try:
+            names: Optional[frozenset[str]] = frozenset(os.listdir(directory))
+        except OSError:
+            names = None
+        self._listings[directory] = names
+        return names
+
+    def _build(self) -> None:
+        roots: list[str] = []
+        seen: set[str] = set()
+
+        def add(entry: str) -> None:
+            path = os.path.abspath(entry or os.curdir)
+            if path not in seen and os.path.isdir(path):
+                seen.add(path)
+                roots.append(path)
+
+        for entry in self._raw_paths:
+            add(entry)
+        for extra in self._extra_roots:
+            add(str(Path(extra) / "src"))
+        # .pth files only live in site directories that are already roots;
+        # their entries are appended after the original path like site.py does.
+        for root in list(roots):
+            names = self._listdir(root) or frozenset()
+            for name in sorted(names):
+                if name.endswith(".pth"):
+                    for entry in self._read_pth(os.path.join(root, name)):
+                        add(entry)
+                elif name.startswith("__editable__") and name.endswith("_finder.py"):
+                    self._read_editable_finder(os.path.join(root, name))
+        self._roots = roots
+        LOGGER.debug("SysPathFinder: %d search roots, %d editable mappings", len(roots), len(self._mapping))
+
+    @staticmethod
+    def _read_pth(pth: str) -> list[str]:
+        """Return the directory entries of a ``.pth`` file (import lines are skipped)."""
+        try:
+            with open(pth, encoding="utf-8") as fh:
+                lines = fh.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return []
+        base = os.path.dirname(pth)
+        entries = []
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#") or line.startswith(("import ", "import\t")):
+                continue
+            entries.append(os.path.join(base, line))
+        return entries
+
+    def _read_editable_finder(self, finder: str) -> None:
+        """Collect the ``MAPPING`` of a setuptools editable finder without running it."""
+        import ast
+
+        try:
+            with open(finder, encoding="utf-8") as fh:
+                src = fh.read()
+        except (OSError, UnicodeDecodeError):
+            return
+        m = _EDITABLE_MAPPING_RE.search(src)
+        if m is None:
+            return
+        try:
+            mapping = ast.literal_eval(m.group(1))
+        except (ValueError, SyntaxError):
+            return
+        if isinstance(mapping, dict):
+            for name, location in mapping.items():
+                if isinstance(name, str) and isinstance(location, str):
+                    self._mapping.setdefault(name, location)
+
+    def _find_in(self, name: str, locations: Iterable[str]) -> tuple[tuple[Path, ...], tuple[str, ...]]:
+        """Find ``name`` (one component) in ``locations``.
+
+        Returns the source files and the submodule search locations; both
+        are empty when nothing was found.
+        """
+        namespace: list[str] = []
+        for loc in locations:
+            names = self._listdir(loc)
+            if not names:
+                continue
+            if name in names:
+                pkg_dir = os.path.join(loc, name)
+                pkg_names = self._listdir(pkg_dir)
+                if pkg_names is not None:
+                    if "__init__.py" in pkg_names:
+                        return (Path(pkg_dir, "__init__.py"),), (pkg_dir,)
+                    namespace.append(pkg_dir)
+            if f"{name}.py" in names:
+                return (Path(loc, f"{name}.py"),), ()
+        return (), tuple(namespace)
+
+    def _locate(self, module_name: str) -> tuple[tuple[Path, ...], tuple[str, ...]]:
+        if module_name in self._memo:
+            return self._memo[module_name], self._locations.get(module_name, ())
+        head, _, tail = module_name.rpartition(".")
+        if head:
+            parent_files, parent_locations = self._locate(head)
+            files, locations = self._find_in(tail, parent_locations) if parent_locations else ((), ())
+        else:
+            files, locations = self._find_in(module_name, self.roots)
+            if not files and not locations and module_name in self._mapping:
+                target = self._mapping[module_name]
+                if os.path.isdir(target):
+                    init = os.path.join(target, "__init__.py")
+                    files = (Path(init),) if os.path.isfile(init) else ()
+                    locations = (target,)
+                elif os.path.isfile(target):
+                    files = (Path(target),)
+        self._memo[module_name] = files
+        self._locations[module_name] = locations
+        return files, locations
+
+    def find(self, module_name: str) -> list[Path]:
+        """Return the source file for ``module_name`` (module or package ``__init__``).
+
+        Namespace packages, compiled-only modules and unknown names yield an
+        empty list.
+        """
+        return list(self._locate(module_name)[0])
+
+
+_DEFAULT: Optional[tuple[tuple[str, ...], SysPathFinder]] = None
+
+
+def default_finder() -> SysPathFinder:
+    """Return a process-wide finder for the current ``sys.path``.
+
+    The finder is rebuilt when ``sys.path`` changes.
+    """
+    global _DEFAULT
+    key = tuple(sys.path)
+    if _DEFAULT is None or _DEFAULT[0] != key:
+        _DEFAULT = (key, SysPathFinder(key))
+    return _DEFAULT[1]
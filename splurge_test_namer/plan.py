@@ -0,0 +1,132 @@
+"""Saved rename plans for review-then-apply workflows.
+
+A plan file records the proposals of one scan together with a fingerprint
+(size and ``mtime_ns``) of every file the proposals were derived from: the
+test files and the source modules their sentinels were aggregated from,
+including module locations that were probed but did not exist. Applying a
+plan only stats those files; when all fingerprints match, the recorded
+rename batch is applied exactly as it was reviewed, without scanning or
+parsing anything. A changed, created or deleted file makes the plan stale.
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+import json
+import os
+from typing import Iterable, Mapping, Optional, Sequence
+
+from splurge_test_namer.exceptions import FileReadError, FileWriteError, SplurgeTestNamerError
+from splurge_test_namer.util_helpers import safe_file_reader, safe_file_writer
+
+DOMAINS = ["plan"]
+
+PLAN_VERSION = 1
+
+__all__ = ["RenamePlan", "fingerprint", "read_plan", "write_plan"]
+
+
+def fingerprint(path: Path) -> Optional[list[int]]:
+    """Return ``[size, mtime_ns]`` of ``path``, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+@dataclass(frozen=True)
+class RenamePlan:
+    """Proposals of a previous scan and the fingerprints they depend on.
+
+    Attributes:
+        proposals: ``(original_path, proposed_path)`` pairs with absolute paths.
+        sentinels: Sentinel values of each original path, where recorded.
+        fingerprints: Absolute path -> ``[size, mtime_ns]`` (None for files
+            that did not exist) at the time the plan was written.
+    """
+
+    proposals: list[tuple[Path, Path]]
+    sentinels: dict[Path, list[str]] = field(default_factory=dict)
+    fingerprints: dict[str, Optional[list[int]]] = field(default_factory=dict)
+
+    def stale_files(self) -> list[Path]:
+        """Return the recorded files whose fingerprint no longer matches, sorted."""
+        return sorted(Path(p) for p, fp in self.fingerprints.items() if fingerprint(Path(p)) != fp)
+
+
+def write_plan(
+    path: Path,
+    proposals: Sequence[tuple[Path, Path]],
+    dependencies: Optional[Mapping[Path, Optional[Iterable[Path]]]] = None,
+    sentinels: Optional[Mapping[Path, Sequence[str]]] = None,
+) -> RenamePlan:
+    """Fingerprint the inputs of ``proposals`` and write them to ``path`` as JSON.
+
+    Args:
+        path: Destination plan file.
+        proposals: ``(original_path, proposed_path)`` pairs to record.
+        dependencies: Test file -> files its sentinels were aggregated from
+            (as filled in by ``build_proposals(..., dependencies=)``). Test
+            files with an import that did not resolve map to None and only
+            the test file itself is fingerprinted.
+        sentinels: Optional test file -> sentinel values, reported again
+            when the plan is applied.
+
+    Returns:
+        The plan that was written.
+
+    Raises:
+        SplurgeTestNamerError: If the plan file cannot be written.
+    """
+    files: set[str] = {os.path.abspath(orig) for orig, _ in proposals}
+    for test_file, deps in (dependencies or {}).items():
+        files.add(os.path.abspath(test_file))
+        files.update(os.path.abspath(d) for d in deps or ())
+    plan = RenamePlan(
+        [(Path(os.path.abspath(o)), Path(os.path.abspath(p))) for o, p in proposals],
+        {Path(os.path.abspath(o)): list(sentinels[o]) for o, _ in proposals if sentinels and o in sentinels},
+        {f: fingerprint(Path(f)) for f in sorted(files)},
+    )
+    payload = {
+        "version": PLAN_VERSION,
+        "entries": [
+            {"original": str(o), "proposed": str(p), "sentinels": plan.sentinels.get(o)} for o, p in plan.proposals
+        ],
+        "fingerprints": plan.fingerprints,
+    }
+    try:
+        safe_file_writer(path, json.dumps(payload, indent=1) + "\n")
+    except FileWriteError as e:
+        raise SplurgeTestNamerError(f"Failed to write plan file: {path}") from e
+    return plan
+
+
+def read_plan(path: Path) -> RenamePlan:
+    """Load a plan written by :func:`write_plan`.
+
+    Raises:
+        SplurgeTestNamerError: If the file cannot be read or is not a plan
+            of the supported version.
+    """
+    try:
+        data = json.loads(safe_file_reader(path))
+    except FileReadError as e:
+        raise SplurgeTestNamerError(f"Failed to read plan file: {path}") from e
+    except ValueError as e:
+        raise SplurgeTestNamerError(f"Invalid plan file: {path}") from e
+    try:
+        if data["version"] != PLAN_VERSION:
+            raise SplurgeTestNamerError(f"Unsupported plan version in {path}: {data['version']!r}")
+        proposals = [(Path(e["original"]), Path(e["proposed"])) for e in data["entries"]]
+        sentinels = {
+            Path(e["original"]): list(e["sentinels"]) for e in data["entries"] if e.get("sentinels") is not None
+        }
+        fingerprints = {str(k): (list(v) if v is not None else None) for k, v in data["fingerprints"].items()}
+    except SplurgeTestNamerError:
+        raise
+    except (KeyError, TypeError, AttributeError) as e:
+        raise SplurgeTestNamerError(f"Invalid plan file: {path}") from e
+    return RenamePlan(proposals, sentinels, fingerprints)
@@ -0,0 +1,205 @@
+"""Per-phase run profiling.
+
+Instrumented code marks its work with :func:`phase`, e.g.
+``with phase("resolve"): ...``. Outside :func:`profile_run` this returns a
+shared no-op context manager, so instrumentation costs one global lookup.
+Inside it, wall and CPU time are accumulated per phase as *self* time:
+time spent in a nested phase is attributed to the inner phase only, so the
+phase totals add up to the profiled run.
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+import threading
+import time
+from typing import Any, ContextManager, Iterable, Iterator, Optional, TypeVar
+
+DOMAINS = ["profiling"]
+
+# Phase names used by the pipeline, in reporting order.
+PHASES = ("glob", "prefilter", "sentinels", "imports", "resolve", "naming", "rename", "output")
+
+T = TypeVar("T")
+
+_NULL_PHASE: ContextManager[None] = nullcontext()
+_ACTIVE: Optional["RunProfile"] = None
+
+__all__ = ["PHASES", "PhaseStats", "RunProfile", "phase", "profile_run", "timed_iter"]
+
+
+class PhaseStats:
+    """Accumulated self time of one phase."""
+
+    __slots__ = ("wall", "cpu", "calls")
+
+    def __init__(self) -> None:
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.calls = 0
+
+
+class _Phase:
+    __slots__ = ("profile", "name", "wall", "cpu", "child_wall", "child_cpu")
+
+    def __init__(self, profile: "RunProfile", name: str) -> None:
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.profile._stack().append(self)
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+
+    def __exit__(self, *exc: Any) -> None:
+        wall = time.perf_counter() - self.wall
+        cpu = time.thread_time() - self.cpu
+        stack = self.profile._stack()
+        stack.pop()
+        if stack:
+            parent = stack[-1]
+            parent.child_wall += wall
+            parent.child_cpu += cpu
+        self.profile._add(self.name, wall - self.child_wall, cpu - self.child_cpu)
+
+
+class RunProfile:
+    """Wall/CPU self time per phase for one profiled run.
+
+    Attributes:
+        phases: Mapping of phase name to :class:`PhaseStats`.
+        wall: Total wall time of the run once stopped.
+        cpu: Total process CPU time of the run once stopped.
+    """
+
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseStats] = {}
+        self.wall = 0.0
+        self.cpu = 0.0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started: Optional[tuple[float, float]] = None
+
+    def _stack(self) -> list[_Phase]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _add(self, name: str, wall: float, cpu: float) -> None:
+        with self._lock:
+            stats = self.phases.get(name)
+            if stats is None:
+                stats = self.phases[name] = PhaseStats()
+            stats.wall += wall
+            stats.cpu += cpu
+            stats.calls += 1
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """Return a context manager that times ``name``."""
+        return _Phase(self, name)
+
+    def start(self) -> None:
+        self._started = (time.perf_counter(), time.process_time())
+
+    def stop(self) -> None:
+        if self._started is not None:
+            self.wall = time.perf_counter() - self._started[0]
+            self.cpu = time.process_time() - self._started[1]
+            self._started = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profile as plain data (seconds per phase)."""
+        return {
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "phases": {name: {"wall": s.wall, "cpu": s.cpu, "calls": s.calls} for name, s in self._ordered_phases()},
+        }
+
+    def _ordered_phases(self) -> list[tuple[str, PhaseStats]]:
+        order = {name: i for i, name in enumerate(PHASES)}
+        return sorted(self.phases.items(), key=lambda kv: (order.get(kv[0], len(order)), kv[0]))
+
+    def format_table(self) -> str:
+        """Render a summary table of wall/CPU time per phase."""
+        lines = [f"{'phase':<12} {'wall (s)':>10} {'cpu (s)':>10} {'wall %':>7} {'calls':>9}"]
+        accounted = 0.0
+        for name, s in self._ordered_phases():
+            accounted += s.wall
+            pct = 100.0 * s.wall / self.wall if self.wall else 0.0
+            lines.append(f"{name:<12} {s.wall:>10.4f} {s.cpu:>10.4f} {pct:>6.1f}% {s.calls:>9}")
+        other = max(self.wall - accounted, 0.0)
+        pct = 100.0 * other / self.wall if self.wall else 0.0
+        lines.append(f"{'other':<12} {other:>10.4f} {'':>10} {pct:>6.1f}% {'':>9}")
+        lines.append(f"{'total':<12} {self.wall:>10.4f} {self.cpu:>10.4f} {100.0 if self.wall else 0.0:>6.1f}% {'':>9}")
+        return "\n".join(lines)
+
+
+def phase(name: str) -> ContextManager[None]:
+    """Time the enclosed block as ``name`` when a profile is active.
+
+    Args:
+        name: Phase name, usually one of :data:`PHASES`.
+    """
+    profile = _ACTIVE
+    if profile is None:
+        return _NULL_PHASE
+    return _Phase(profile, name)
+
+
+def timed_iter(iterable: Iterable[T], name: str) -> Iterator[T]:
+    """Yield from ``iterable``, timing each step as phase ``name`` when profiling.
+
+    Used for lazy producers such as the test-file walk, whose work happens
+    inside ``next()``.
+    """
+    it = iter(iterable)
+    while True:
+        with phase(name):
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+        yield item
+
+
+@contextmanager
+def profile_run(pstats_path: Optional[Path] = None) -> Iterator[RunProfile]:
+    """Profile the enclosed block per phase and optionally with cProfile.
+
+    Phases executed in worker processes (``jobs > 1``) are not visible to
+    the profile; their time shows up in the parent as ``other``.
+
+    Args:
+        pstats_path: If given, the block also runs under :mod:`cProfile` and
+            the statistics are written to this file for use with
+            :mod:`pstats` or tools such as snakeviz.
+
+    Yields:
+        The :class:`RunProfile`, complete once the block exits.
+    """
+    global _ACTIVE
+    profile = RunProfile()
+    previous = _ACTIVE
+    _ACTIVE = profile
+    profiler = None
+    if pstats_path is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    profile.start()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield profile
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        profile.stop()
+        _ACTIVE = previous
+        if profiler is not None and pstats_path is not None:
+            profiler.dump_stats(str(pstats_path))
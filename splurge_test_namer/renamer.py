@@ -0,0 +1,348 @@
+"""Batch rename planning and execution.
+
+Renaming proposals one at a time fails when a proposal's target is the
+source of another proposal that has not moved yet, e.g. when renumbering
+swaps ``test_a_0001.py`` and ``test_a_0002.py``. This module orders a batch
+of renames so every target is free when it is written, breaks rename cycles
+with a temporary name, and executes the plan with one ``rename`` per step
+and one directory check per destination directory.
+
+On high-latency filesystems (e.g. NFS) every rename and existence check is
+a network round trip. :func:`execute_rename_plan_concurrent` splits a plan
+into independent groups (steps that share no source or target path: one
+chain or cycle each) and runs the groups in a bounded thread pool, so the
+batch costs roughly one round trip per step of its longest group rather
+than one per file.
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+import logging
+import os
+import threading
+from typing import Iterable, Optional
+
+from splurge_test_namer.exceptions import FileRenameError, SplurgeTestNamerError
+from splurge_test_namer.stats import incr
+
+DOMAINS = ["renamer"]
+
+TEMP_SUFFIX = ".splurge-tmp"
+
+LOGGER = logging.getLogger(__name__)
+
+__all__ = [
+    "RenameFailure",
+    "RenameOutcome",
+    "RenameStep",
+    "execute_rename_plan",
+    "execute_rename_plan_concurrent",
+    "existing_paths",
+    "independent_groups",
+    "plan_renames",
+]
+
+
+@dataclass(frozen=True)
+class RenameStep:
+    """A single filesystem rename in a batch plan.
+
+    Attributes:
+        src: Path to move.
+        dst: Destination path.
+        orig: Original source of the proposal this step belongs to.
+        final: True when the step moves the file to its proposed name;
+            False for the temporary move that breaks a rename cycle.
+    """
+
+    src: Path
+    dst: Path
+    orig: Path
+    final: bool = True
+
+
+def _temp_name(src: Path, reserved: set[Path]) -> Path:
+    """Return an unused temporary path next to ``src``."""
+    n = 0
+    while True:
+        candidate = src.with_name(f".{src.name}{TEMP_SUFFIX}{n or ''}")
+        if candidate not in reserved and not candidate.exists():
+            return candidate
+        n += 1
+
+
+def plan_renames(proposals: Iterable[tuple[Path, Path]]) -> list[RenameStep]:
+    """Order a batch of renames so no step overwrites a pending source.
+
+    No-op proposals are skipped, but their path stays occupied: another
+    proposal targeting it is a conflict like two proposals sharing a
+    target. Because every source has one target and
+    targets are unique, the moves form chains and cycles: each chain is
+    emitted from its free end backwards, and each cycle is broken by moving
+    one member to a temporary name first and into place last. The plan
+    therefore contains one step per effective proposal plus one per cycle.
+
+    Args:
+        proposals: (original_path, proposed_path) tuples.
+
+    Returns:
+        Ordered rename steps.
+
+    Raises:
+        SplurgeTestNamerError: If a path is renamed twice or two proposals
+            share a target (including a file that keeps its name).
+    """
+    moves: dict[Path, Path] = {}
+    targets: dict[Path, Path] = {}
+    kept: set[Path] = set()
+    for orig, prop in proposals:
+        if orig in moves or orig in kept:
+            raise SplurgeTestNamerError(f"Multiple proposals rename the same file: {orig}")
+        if prop in targets:
+            raise SplurgeTestNamerError(f"Multiple proposals target the same path: {prop} ({targets[prop]}, {orig})")
+        targets[prop] = orig
+        if orig == prop:
+            kept.add(orig)
+            continue
+        moves[orig] = prop
+    for path in kept:
+        del targets[path]
+
+    steps: list[RenameStep] = []
+    pending = dict(moves)
+    # A move is ready once its target is not the source of a pending move.
+    # Moving a source frees it, which makes the move targeting it ready.
+    # Ready moves run first-in first-out, so independent renames keep the
+    # proposal order.
+    ready = deque(src for src, dst in moves.items() if dst not in pending)
+    while ready:
+        src = ready.popleft()
+        steps.append(RenameStep(src, pending.pop(src), src))
+        blocked = targets.get(src)
+        if blocked is not None and blocked in pending:
+            ready.append(blocked)
+
+    # Whatever is left consists of cycles only.
+    reserved = set(moves) | set(targets)
+    for start in sorted(pending, key=str):
+        if start not in pending:
+            continue
+        temp = _temp_name(start, reserved)
+        reserved.add(temp)
+        steps.append(RenameStep(start, temp, start, final=False))
+        final_dst = pending.pop(start)
+        src = targets[start]
+        while src != start:
+            steps.append(RenameStep(src, pending.pop(src), src))
+            src = targets[src]
+        steps.append(RenameStep(temp, final_dst, start))
+    return steps
+
+
+def execute_rename_plan(
+    steps: list[RenameStep], ensured_dirs: Optional[set[Path]] = None, overwrite: bool = False
+) -> None:
+    """Execute planned renames in order.
+
+    Each step checks that its source exists and that its destination is
+    free before anything is created; :func:`plan_renames` orders the steps
+    so a destination that is another step's source has already been moved.
+    Destination directories are validated and created once per directory
+    rather than once per file.
+
+    Args:
+        steps: Steps returned by :func:`plan_renames`.
+        ensured_dirs: Directories already known to exist; updated in place.
+        overwrite: Replace destination files that exist outside the plan.
+
+    Raises:
+        FileRenameError: If a source is missing, a destination exists (without
+            ``overwrite``), a destination directory cannot be created or a
+            rename fails.
+    """
+    ensured = ensured_dirs if ensured_dirs is not None else set()
+    for step in steps:
+        _execute_step(step, ensured, overwrite)
+
+
+def _execute_step(step: RenameStep, ensured: set[Path], overwrite: bool = False) -> None:
+    """Rename one step after checking its source and destination.
+
+    The destination directory is only created once both checks passed, and
+    only once per directory.
+    """
+    if not step.src.exists():
+        raise FileRenameError(f"Source does not exist: {step.src}")
+    if not overwrite and step.dst.exists():
+        raise FileRenameError(f"Destination exists and overwrite is False: {step.dst}")
+    parent = step.dst.parent
+    if parent not in ensured:
+        if parent.exists() and not parent.is_dir():
+            raise FileRenameError(f"Destination parent exists but is not a directory: {parent}")
+        try:
+            parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise FileRenameError(f"Failed to create directory {parent}") from e
+        ensured.add(parent)
+    try:
+        os.replace(step.src, step.dst)
+    except OSError as e:
+        LOGGER.debug("rename failed %s -> %s: %s", step.src, step.dst, e)
+        raise FileRenameError(f"Failed to rename {step.src} to {step.dst}") from e
+    incr("renames")
+
+
+def independent_groups(steps: list[RenameStep]) -> list[list[RenameStep]]:
+    """Split a plan into groups of steps that share no path with other groups.
+
+    Steps of a chain or cycle share their source and target paths (and a
+    cycle's temporary name), so each group is one chain or cycle and must
+    run in order, while different groups can run concurrently. Groups are
+    ordered by their first step and keep the plan order within.
+
+    Args:
+        steps: Steps returned by :func:`plan_renames`.
+
+    Returns:
+        The steps of ``steps`` partitioned into independent groups.
+    """
+    parent = list(range(len(steps)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owner: dict[Path, int] = {}
+    for i, step in enumerate(steps):
+        for path in (step.src, step.dst):
+            j = owner.setdefault(path, i)
+            if j != i:
+                parent[find(i)] = find(j)
+    groups: dict[int, list[RenameStep]] = {}
+    for i, step in enumerate(steps):
+        groups.setdefault(find(i), []).append(step)
+    return list(groups.values())
+
+
+@dataclass(frozen=True)
+class RenameFailure:
+    """A planned step that failed.
+
+    Attributes:
+        step: The failed step.
+        error: The error it raised.
+    """
+
+    step: RenameStep
+    error: FileRenameError
+
+
+@dataclass
+class RenameOutcome:
+    """Result of :func:`execute_rename_plan_concurrent`, each list in plan order.
+
+    Attributes:
+        done: Steps that were executed.
+        failures: Steps that failed.
+        skipped: Steps that were not attempted because a step failed first.
+    """
+
+    done: list[RenameStep] = field(default_factory=list)
+    failures: list[RenameFailure] = field(default_factory=list)
+    skipped: list[RenameStep] = field(default_factory=list)
+
+    def describe(self) -> str:
+        """Summarize the failures, skipped steps and any file left at a temporary name."""
+        lines = [
+            f"{len(self.failures)} rename(s) failed, {len(self.done)} completed, {len(self.skipped)} not attempted:"
+        ]
+        for failure in self.failures:
+            cause = failure.error.__cause__ or failure.error
+            lines.append(f"  {failure.step.src} -> {failure.step.dst}: {cause}")
+        # a cycle whose first (temporary) move ran but whose last did not
+        moved_back = {step.src for step in self.done if step.final}
+        for step in self.done:
+            if not step.final and step.dst not in moved_back:
+                lines.append(f"  {step.orig} was left at temporary name {step.dst}")
+        return "\n".join(lines)
+
+
+def execute_rename_plan_concurrent(
+    steps: list[RenameStep], workers: int, ensured_dirs: Optional[set[Path]] = None, overwrite: bool = False
+) -> RenameOutcome:
+    """Execute planned renames with independent groups running in a thread pool.
+
+    Each group of :func:`independent_groups` runs in order on one thread;
+    up to ``workers`` groups run at a time. After the first failure no new
+    group is started, while groups already running finish (so cycles are
+    not left half-rotated by another group's failure). Errors are collected
+    instead of raised so the caller can report every outcome
+    deterministically.
+
+    Args:
+        steps: Steps returned by :func:`plan_renames`.
+        workers: Maximum number of concurrent groups.
+        ensured_dirs: Directories already known to exist; updated in place.
+        overwrite: Replace destination files that exist outside the plan.
+
+    Returns:
+        The executed, failed and skipped steps, in plan order.
+    """
+    # imported here: serial renames never need a thread pool
+    from concurrent.futures import ThreadPoolExecutor
+
+    ensured = ensured_dirs if ensured_dirs is not None else set()
+    order = {step: i for i, step in enumerate(steps)}
+    groups = independent_groups(steps)
+    failed = threading.Event()
+    done: list[RenameStep] = []
+    failures: list[RenameFailure] = []
+    skipped: list[RenameStep] = []
+    lock = threading.Lock()
+
+    def run(group: list[RenameStep]) -> None:
+        if failed.is_set():
+            with lock:
+                skipped.extend(group)
+            return
+        for n, step in enumerate(group):
+            try:
+                _execute_step(step, ensured, overwrite)
+            except FileRenameError as e:
+                failed.set()
+                with lock:
+                    failures.append(RenameFailure(step, e))
+                    skipped.extend(group[n + 1 :])
+                return
+            with lock:
+                done.append(step)
+
+    if groups:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(groups)))) as pool:
+            for _ in pool.map(run, groups):
+                pass
+    done.sort(key=order.__getitem__)
+    failures.sort(key=lambda f: order[f.step])
+    skipped.sort(key=order.__getitem__)
+    return RenameOutcome(done, failures, skipped)
+
+
+def existing_paths(paths: Iterable[Path], workers: int = 1) -> list[Path]:
+    """Return the paths of ``paths`` that exist, in input order.
+
+    With ``workers > 1`` the existence checks run in a thread pool, which
+    hides per-call latency on network filesystems.
+    """
+    paths = list(paths)
+    if workers <= 1 or len(paths) < 2:
+        return [p for p in paths if p.exists()]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return [p for p, exists in zip(paths, pool.map(Path.exists, paths)) if exists]
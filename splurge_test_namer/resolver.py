@@ -0,0 +1,157 @@
+"""Prebuilt module-resolution index.
+
+``resolve_module_to_paths`` stats candidate files for every dotted name and
+falls back to a full ``rglob`` of the repository on a miss. This module
+provides :class:`ModuleIndex`, which walks the repository once and then
+answers the same questions from in-memory tables with memoized positive and
+negative results.
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+from pathlib import Path
+import logging
+import os
+
+from splurge_test_namer.pathfinder import SysPathFinder
+from splurge_test_namer.stats import resolver_outcome
+from splurge_test_namer.util_helpers import resolve_module_outside_repo
+
+DOMAINS = ["resolver"]
+
+LOGGER = logging.getLogger(__name__)
+
+__all__ = ["ModuleIndex"]
+
+
+class ModuleIndex:
+    """Index of Python source files under a repository root.
+
+    The index is built lazily with a single walk of ``repo_root`` on the first
+    lookup. It maps dotted module names to ``module.py`` files and package
+    ``__init__.py`` files, and keeps a basename table for the suffix fallback
+    used by :func:`~splurge_test_namer.util_helpers.resolve_module_to_paths`.
+    Resolution order and results match that function. Names outside the
+    repository are looked up in a :class:`SysPathFinder` snapshot of
+    ``sys.path`` (plus the repository's ``src/`` directory) taken when the
+    index is created.
+
+    Args:
+        repo_root: Filesystem root to resolve against.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self._built = False
+        self._modules: dict[str, Path] = {}
+        self._packages: dict[str, Path] = {}
+        self._basenames: dict[str, list[Path]] = {}
+        self._memo: dict[str, tuple[Path, ...]] = {}
+        self.finder = SysPathFinder(extra_roots=[repo_root])
+
+    def build(self) -> None:
+        """Walk ``repo_root`` once and populate the lookup tables."""
+        modules: dict[str, Path] = {}
+        packages: dict[str, Path] = {}
+        basenames: dict[str, list[Path]] = {}
+        root = str(self.repo_root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            rel = os.path.relpath(dirpath, root)
+            rel_parts = [] if rel == os.curdir else rel.split(os.sep)
+            # directories whose names contain dots cannot form dotted module
+            # names; their files only take part in the basename fallback
+            importable = not any("." in part for part in rel_parts)
+            base = Path(dirpath)
+            for name in sorted(filenames):
+                if not name.endswith(".py"):
+                    continue
+                path = base / name
+                stem = name[:-3]
+                basenames.setdefault(stem, []).append(path)
+                if not importable:
+                    continue
+                if stem == "__init__":
+                    if rel_parts:
+                        packages[".".join(rel_parts)] = path
+                else:
+                    modules[".".join(rel_parts + [stem])] = path
+        self._modules = modules
+        self._packages = packages
+        self._basenames = basenames
+        self._memo = {}
+        self._built = True
+        LOGGER.debug("ModuleIndex: indexed %d modules and %d packages under %s", len(modules), len(packages), root)
+
+    def contains(self, path: str) -> bool:
+        """Return True if the built index knows the source file ``path``.
+
+        An index that has not been built yet knows nothing and returns True,
+        as no lookup has depended on it.
+        """
+        if not self._built:
+            return True
+        target = os.path.abspath(path)
+        stem = os.path.basename(target)[:-3] if target.endswith(".py") else None
+        return stem is not None and any(os.path.abspath(p) == target for p in self._basenames.get(stem, ()))
+
+    def resolve(self, module_name: str) -> list[Path]:
+        """Resolve a dotted module name to candidate file paths.
+
+        Prefer module.py, then module/__init__.py, then any file under the
+        repository with the same basename; names that are not in the
+        repository fall back to sys.path and the working directory. Results,
+        including misses, are memoized.
+
+        Args:
+            module_name: Dotted module name (e.g. "pkg.sub.module").
+
+        Returns:
+            Candidate Path objects, or an empty list if nothing was found.
+        """
+        cached = self._memo.get(module_name)
+        resolver_outcome("index_memo", cached is not None)
+        if cached is not None:
+            return list(cached)
+        if not self._built:
+            self.build()
+
+        candidates: list[Path] = []
+        module_file = self._modules.get(module_name)
+        resolver_outcome("direct_file", module_file is not None)
+        if module_file is not None:
+            candidates.append(module_file)
+        package_init = self._packages.get(module_name)
+        resolver_outcome("package_init", package_init is not None)
+        if package_init is not None:
+            candidates.append(package_init)
+        if not candidates:
+            # the basename table stands in for the repository rglob
+            candidates.extend(self._basenames.get(module_name.rsplit(".", 1)[-1], []))
+            resolver_outcome("repo_rglob", bool(candidates))
+        if not candidates:
+            candidates = resolve_module_outside_repo(module_name, self.finder)
+
+        if candidates:
+            LOGGER.debug("ModuleIndex: module '%s' resolved to %s", module_name, [str(p) for p in candidates])
+        else:
+            LOGGER.debug("ModuleIndex: module '%s' not found under repo_root or sys.path", module_name)
+        self._memo[module_name] = tuple(candidates)
+        return candidates
+
+    def resolve_with_member_fallback(self, module_name: str) -> list[Path]:
+        """Resolve module paths, stripping trailing attributes on a miss.
+
+        Mirrors :func:`~splurge_test_namer.util_helpers.resolve_module_to_paths_with_member_fallback`
+        so 'pkg.module.Class' resolves to 'pkg.module' when possible.
+        """
+        base = module_name
+        while base:
+            paths = self.resolve(base)
+            if paths:
+                return paths
+            if "." not in base:
+                break
+            base = base.rsplit(".", 1)[0]
+        return []
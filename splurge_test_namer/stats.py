@@ -0,0 +1,189 @@
+"""Operation counters for a run.
+
+File reads, parses, resolver strategies, cache lookups and renames report
+to :func:`incr`. Outside :func:`collect_stats` this is a single global
+lookup; inside it, counts accumulate in a :class:`RunStats` together with
+the slowest test files to analyze.
+
+Counter names:
+    files_read, bytes_read: files read (``safe_file_reader`` and
+        ``safe_header_reader``) and bytes read.
+    header_reads, header_fallbacks: header-mode analyses answered from the
+        header alone, and those that needed the whole module.
+    parses, parse_failures: ``ast.parse`` calls in the parser and failures.
+    prefilter_skips: files the byte prefilter proved empty (never decoded
+        or parsed).
+    cache_hits, cache_misses: analysis cache lookups.
+    memo_hits, memo_misses: imported-module sentinel memo lookups.
+    manifest_hits, manifest_misses: incremental-mode manifest lookups.
+    graph_nodes, graph_components: import-graph modules analyzed and cycle-safe
+        components closed (``--follow-depth``).
+    renames: filesystem renames performed.
+    resolver.<strategy>.hits / resolver.<strategy>.misses: module resolution
+        attempts per strategy (``index_memo``, ``direct_file``,
+        ``package_init``, ``repo_rglob``, ``sys_path``, ``cwd_file``,
+        ``cwd_rglob``).
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+import heapq
+import threading
+from typing import Any, Iterator, Optional
+
+from splurge_test_namer.constants import DEFAULT_TOP_N
+
+DOMAINS = ["stats"]
+
+_ACTIVE: Optional["RunStats"] = None
+
+__all__ = [
+    "DEFAULT_TOP_N",
+    "RunStats",
+    "active_stats",
+    "collect_stats",
+    "incr",
+    "record_file_time",
+    "resolver_outcome",
+]
+
+
+class RunStats:
+    """Counters and slowest-file list collected during a run.
+
+    Args:
+        top_n: Number of slowest files to keep.
+    """
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N) -> None:
+        self.top_n = top_n
+        self.counters: Counter[str] = Counter()
+        self._slowest: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += n
+
+    def record_file_time(self, path: str, seconds: float) -> None:
+        """Record the analysis time of ``path``, keeping only the slowest ``top_n``."""
+        with self._lock:
+            if len(self._slowest) < self.top_n:
+                heapq.heappush(self._slowest, (seconds, path))
+            elif self._slowest and seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, (seconds, path))
+
+    @property
+    def slowest_files(self) -> list[tuple[str, float]]:
+        """``(path, seconds)`` pairs, slowest first."""
+        return [(p, s) for s, p in sorted(self._slowest, reverse=True)]
+
+    def take(self) -> dict[str, Any]:
+        """Return and reset the collected data (used to ship worker results)."""
+        with self._lock:
+            data = {"counters": dict(self.counters), "slowest": list(self._slowest)}
+            self.counters.clear()
+            self._slowest = []
+        return data
+
+    def merge(self, data: dict[str, Any]) -> None:
+        """Merge data produced by :meth:`take` in another process."""
+        with self._lock:
+            self.counters.update(data["counters"])
+        for seconds, path in data["slowest"]:
+            self.record_file_time(path, seconds)
+
+    def resolver(self) -> dict[str, dict[str, int]]:
+        """Return resolver hits/misses grouped by strategy."""
+        out: dict[str, dict[str, int]] = {}
+        for name, value in self.counters.items():
+            if name.startswith("resolver."):
+                _, strategy, kind = name.split(".", 2)
+                out.setdefault(strategy, {"hits": 0, "misses": 0})[kind] = value
+        return dict(sorted(out.items()))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as JSON-serializable data."""
+        return {
+            "counters": {k: v for k, v in sorted(self.counters.items()) if not k.startswith("resolver.")},
+            "resolver": self.resolver(),
+            "slowest_files": [{"path": p, "seconds": round(s, 6)} for p, s in self.slowest_files],
+        }
+
+    def format_text(self) -> str:
+        """Render the statistics as a human-readable summary."""
+        data = self.as_dict()
+        lines = [f"{name:<20} {value:>12}" for name, value in data["counters"].items()]
+        if data["resolver"]:
+            lines.append(f"{'resolver strategy':<20} {'hits':>12} {'misses':>8}")
+            for strategy, hm in data["resolver"].items():
+                lines.append(f"  {strategy:<18} {hm['hits']:>12} {hm['misses']:>8}")
+        if data["slowest_files"]:
+            lines.append("slowest files:")
+            for entry in data["slowest_files"]:
+                lines.append(f"  {entry['seconds']:>10.4f}s  {entry['path']}")
+        return "\n".join(lines)
+
+
+def active_stats() -> Optional[RunStats]:
+    """Return the :class:`RunStats` being collected, if any."""
+    return _ACTIVE
+
+
+def incr(name: str, n: int = 1) -> None:
+    """Add ``n`` to counter ``name`` when statistics are being collected."""
+    stats = _ACTIVE
+    if stats is not None:
+        stats.incr(name, n)
+
+
+def resolver_outcome(strategy: str, hit: bool) -> None:
+    """Count a hit or miss of resolver ``strategy``."""
+    stats = _ACTIVE
+    if stats is not None:
+        stats.incr(f"resolver.{strategy}.{'hits' if hit else 'misses'}")
+
+
+def record_file_time(path: str, seconds: float) -> None:
+    """Record how long analyzing test file ``path`` took."""
+    stats = _ACTIVE
+    if stats is not None:
+        stats.record_file_time(path, seconds)
+
+
+def activate(stats: Optional[RunStats]) -> Optional[RunStats]:
+    """Make ``stats`` (or nothing) the active collector and return the previous one."""
+    global _ACTIVE
+    previous = _ACTIVE
+    _ACTIVE = stats
+    return previous
+
+
+def restore(previous: Optional[RunStats]) -> None:
+    """Restore the collector returned by :func:`activate`."""
+    global _ACTIVE
+    _ACTIVE = previous
+
+
+@contextmanager
+def collect_stats(top_n: int = DEFAULT_TOP_N) -> Iterator[RunStats]:
+    """Collect operation counters for the enclosed block.
+
+    Work done in worker processes (``jobs > 1``) is merged back into the
+    returned object.
+
+    Args:
+        top_n: Number of slowest test files to keep.
+
+    Yields:
+        The :class:`RunStats`, complete once the block exits.
+    """
+    stats = RunStats(top_n)
+    previous = activate(stats)
+    try:
+        yield stats
+    finally:
+        restore(previous)
@@ -10,14 +10,19 @@ License: MIT
 """
 
 from pathlib import Path
-import importlib.util
 import logging
+import mmap
+import os
+import re
+from typing import Iterable, Iterator, Optional
 from splurge_test_namer.exceptions import (
     FileReadError,
     FileWriteError,
     FileRenameError,
     FileGlobError,
 )
+from splurge_test_namer.pathfinder import SysPathFinder, default_finder
+from splurge_test_namer.stats import active_stats, incr, resolver_outcome
 
 
 LOGGER = logging.getLogger(__name__)
@@ -61,10 +66,116 @@ def safe_file_reader(path: Path, encoding: str = "utf-8") -> str:
         FileReadError: If the file could not be read.
     """
     try:
-        return path.read_text(encoding=encoding)
+        data = path.read_bytes()
+        text = _decode_source(data, encoding)
     except Exception as e:
         LOGGER.debug("safe_file_reader failed for %s: %s", path, e)
         raise FileReadError(f"Failed to read file: {path}") from e
+    stats = active_stats()
+    if stats is not None:
+        stats.incr("files_read")
+        stats.incr("bytes_read", len(data))
+    return text
+
+
+# Bytes read per chunk by ``safe_header_reader``.
+HEADER_CHUNK_SIZE = 16 * 1024
+
+
+def _decode_source(data: bytes, encoding: str) -> str:
+    """Decode ``data`` the way text-mode reads do (universal newlines)."""
+    return data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+
+
+def safe_header_reader(
+    path: Path, stop: "re.Pattern[bytes]", chunk_size: int = HEADER_CHUNK_SIZE, encoding: str = "utf-8"
+) -> tuple[str, int]:
+    """Read ``path`` in chunks until the first line that starts with ``stop``.
+
+    Only whole lines are matched (``stop`` should be compiled with
+    ``re.MULTILINE`` and anchored with ``^``), so a match never depends on
+    where a chunk ends. Reading stops at the chunk containing the match.
+
+    Args:
+        path: Path to the file to read.
+        stop: Pattern marking the first line that is not returned.
+        chunk_size: Bytes read per chunk.
+        encoding: Text encoding to use.
+
+    Returns:
+        A ``(text, offset)`` pair: the decoded text before the matching line
+        and that line's byte offset, or the whole file and ``-1`` when no
+        line matches.
+
+    Raises:
+        FileReadError: If the file could not be read or decoded.
+    """
+    buf = b""
+    scan_from = 0
+    try:
+        with open(path, "rb") as fh:
+            while True:
+                chunk = fh.read(chunk_size)
+                buf += chunk
+                # the last line may be incomplete until EOF
+                limit = buf.rfind(b"\n") + 1 if chunk else len(buf)
+                m = stop.search(buf, scan_from, limit)
+                if m is not None or not chunk:
+                    break
+                scan_from = limit
+        offset = m.start() if m is not None else -1
+        text = _decode_source(buf[:offset] if m is not None else buf, encoding)
+    except Exception as e:
+        LOGGER.debug("safe_header_reader failed for %s: %s", path, e)
+        raise FileReadError(f"Failed to read file: {path}") from e
+    stats = active_stats()
+    if stats is not None:
+        stats.incr("files_read")
+        stats.incr("bytes_read", len(buf))
+    return text, offset
+
+
+def safe_tail_reader(path: Path, offset: int, encoding: str = "utf-8") -> str:
+    """Read ``path`` from byte ``offset`` to the end (see :func:`safe_header_reader`).
+
+    Raises:
+        FileReadError: If the file could not be read or decoded.
+    """
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(offset)
+            data = fh.read()
+        text = _decode_source(data, encoding)
+    except Exception as e:
+        LOGGER.debug("safe_tail_reader failed for %s: %s", path, e)
+        raise FileReadError(f"Failed to read file: {path}") from e
+    incr("bytes_read", len(data))
+    return text
+
+
+def safe_file_contains(path: Path, needles: Iterable[bytes], patterns: Iterable["re.Pattern[bytes]"] = ()) -> bool:
+    """Return whether the raw bytes of ``path`` contain a needle or match a pattern.
+
+    The file is memory-mapped and searched without being decoded or copied.
+    An empty file contains nothing.
+
+    Args:
+        path: Path to the file to search.
+        needles: Byte strings to look for.
+        patterns: Byte patterns to search for.
+
+    Raises:
+        FileReadError: If the file could not be opened or mapped.
+    """
+    try:
+        with open(path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return any(mm.find(n) != -1 for n in needles) or any(p.search(mm) is not None for p in patterns)
+    except Exception as e:
+        LOGGER.debug("safe_file_contains failed for %s: %s", path, e)
+        raise FileReadError(f"Failed to read file: {path}") from e
 
 
 def safe_file_writer(path: Path, data: str, encoding: str = "utf-8") -> None:
@@ -116,6 +227,7 @@ def safe_file_renamer(src: Path, dst: Path, overwrite: bool = False) -> None:
         dst.parent.mkdir(parents=True, exist_ok=True)
         # Use replace to atomically move on the same filesystem when possible
         src.replace(dst)
+        incr("renames")
     except FileRenameError:
         raise
     except Exception as e:
@@ -143,6 +255,81 @@ def safe_file_rglob(root: Path, pattern: str) -> list[Path]:
         raise FileGlobError(f"Failed to rglob {pattern} in {root}") from e
 
 
+# Directory names that are never scanned for test modules.
+ALWAYS_PRUNED_DIRS = frozenset({"helpers"})
+
+
+def iter_test_files(
+    root: Path, excludes: Optional[Iterable[str]] = None, name_prefix: str = "test_", suffix: str = ".py"
+) -> Iterator[Path]:
+    """Lazily yield test module paths under ``root`` in sorted path order.
+
+    Unlike ``safe_file_rglob`` followed by post-filtering, directories named
+    ``helpers`` or listed in ``excludes`` (case-insensitive) are pruned before
+    they are descended into, so excluded trees are never traversed. Only
+    regular files whose names start with ``name_prefix`` and end with
+    ``suffix`` are yielded; file names listed in ``excludes`` are skipped.
+    Symlinked directories are not followed and unreadable sub-directories are
+    skipped, matching ``Path.rglob``.
+
+    Args:
+        root: Root directory to walk.
+        excludes: Directory (or file) names to skip.
+        name_prefix: Required file name prefix.
+        suffix: Required file name suffix.
+
+    Yields:
+        Matching file paths, in the same order as ``sorted(root.rglob(...))``.
+
+    Raises:
+        FileGlobError: If ``root`` itself cannot be scanned.
+    """
+    pruned = ALWAYS_PRUNED_DIRS | {e.lower() for e in (excludes or [])}
+    # Excluded names anywhere in the root's own path exclude everything,
+    # as they would when filtering on the full path parts.
+    if any(part.lower() in pruned for part in root.parts):
+        return
+    if not root.is_dir():
+        return
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError as e:
+        LOGGER.debug("iter_test_files failed for %s: %s", root, e)
+        raise FileGlobError(f"Failed to scan test files in {root}") from e
+    yield from _walk_entries(root, entries, pruned, name_prefix, suffix)
+
+
+def _walk_entries(
+    parent: Path, entries: "list[os.DirEntry[str]]", pruned: frozenset[str], name_prefix: str, suffix: str
+) -> Iterator[Path]:
+    """Depth-first walk helper for :func:`iter_test_files`."""
+    for entry in entries:
+        name = entry.name
+        if name.lower() in pruned:
+            continue
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            child = parent / name
+            try:
+                with os.scandir(child) as it:
+                    children = sorted(it, key=lambda e: e.name)
+            except OSError as e:
+                LOGGER.debug("iter_test_files skipping unreadable directory %s: %s", child, e)
+                continue
+            yield from _walk_entries(child, children, pruned, name_prefix, suffix)
+        elif name.startswith(name_prefix) and name.endswith(suffix):
+            try:
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            yield parent / name
+
+
 def resolve_module_to_paths(module_name: str, repo_root: Path) -> list[Path]:
     """Resolve a dotted module name to candidate file paths inside repo_root.
 
@@ -159,36 +346,60 @@ def resolve_module_to_paths(module_name: str, repo_root: Path) -> list[Path]:
     candidates: list[Path] = []
     # Try module as file: repo_root/parts[0]/.../parts[-1].py
     file_path = repo_root.joinpath(*parts).with_suffix(".py")
-    if file_path.exists():
+    found = file_path.exists()
+    resolver_outcome("direct_file", found)
+    if found:
         candidates.append(file_path)
     # Try package __init__.py: repo_root/parts[0]/.../parts[-1]/__init__.py
     pkg_init = repo_root.joinpath(*parts, "__init__.py")
-    if pkg_init.exists():
+    found = pkg_init.exists()
+    resolver_outcome("package_init", found)
+    if found:
         candidates.append(pkg_init)
     # fallback: try to find any file under repo_root that ends with the module path
     if not candidates:
         for p in repo_root.rglob(parts[-1] + ".py"):
             candidates.append(p)
+        resolver_outcome("repo_rglob", bool(candidates))
 
-    # If still not found, attempt to resolve via importlib (installed packages
-    # or modules available on sys.path). This avoids importing the module code;
-    # we only inspect the import spec to discover source file locations.
+    # If still not found, look outside the repository (sys.path, then cwd).
     if not candidates:
-        try:
-            spec = importlib.util.find_spec(module_name)
-            if spec:
-                # If spec.origin points to a file, add it
-                if spec.origin and spec.origin != "namespace":
-                    candidates.append(Path(spec.origin))
-                # If it's a package, prefer __init__.py inside submodule_search_locations
-                if spec.submodule_search_locations:
-                    for loc in spec.submodule_search_locations:
-                        init = Path(loc) / "__init__.py"
-                        if init.exists():
-                            candidates.append(init)
-        except Exception:
-            # Be conservative — silently ignore resolution failures
-            pass
+        candidates = resolve_module_outside_repo(module_name)
+
+    # Log resolution outcome for debugging
+    try:
+        logger = logging.getLogger(__name__)
+        if candidates:
+            logger.debug(
+                "resolve_module_to_paths: module '%s' resolved to %s", module_name, [str(p) for p in candidates]
+            )
+        else:
+            logger.debug("resolve_module_to_paths: module '%s' not found under repo_root or sys.path", module_name)
+    except Exception:
+        # Keep resolver robust even if logging fails
+        pass
+
+    return candidates
+
+
+def resolve_module_outside_repo(module_name: str, finder: Optional[SysPathFinder] = None) -> list[Path]:
+    """Resolve a dotted module name outside the repository root.
+
+    Used by the resolvers once the repository lookups have failed. Searches
+    the ``sys.path`` snapshot of ``finder`` first (no module is imported)
+    and then the current working directory.
+
+    Args:
+        module_name: Dotted module name (e.g. "pkg.sub.module").
+        finder: Search path index to use; defaults to a process-wide finder
+            for the current ``sys.path``.
+
+    Returns:
+        Candidate Path objects, or an empty list when nothing matched.
+    """
+    parts = module_name.split(".")
+    candidates = (finder or default_finder()).find(module_name)
+    resolver_outcome("sys_path", bool(candidates))
 
     # Final fallback: search the working directory for a file that matches the
     # dotted module path. This helps in monorepo or workspace layouts where the
@@ -198,28 +409,17 @@ def resolve_module_to_paths(module_name: str, repo_root: Path) -> list[Path]:
         try:
             cwd = Path.cwd()
             file_candidate = cwd.joinpath(*parts).with_suffix(".py")
-            if file_candidate.exists():
+            found = file_candidate.exists()
+            resolver_outcome("cwd_file", found)
+            if found:
                 candidates.append(file_candidate)
             else:
                 # as a last resort, search for any file ending with the module name
                 for p in cwd.rglob(parts[-1] + ".py"):
                     candidates.append(p)
+                resolver_outcome("cwd_rglob", bool(candidates))
         except Exception:
             pass
-
-    # Log resolution outcome for debugging
-    try:
-        logger = logging.getLogger(__name__)
-        if candidates:
-            logger.debug(
-                "resolve_module_to_paths: module '%s' resolved to %s", module_name, [str(p) for p in candidates]
-            )
-        else:
-            logger.debug("resolve_module_to_paths: module '%s' not found under repo_root or sys.path", module_name)
-    except Exception:
-        # Keep resolver robust even if logging fails
-        pass
-
     return candidates
 
 
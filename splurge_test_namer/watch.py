@@ -0,0 +1,587 @@
+"""Watch mode: keep proposals current while files change.
+
+:class:`WatchSession` performs an initial scan and keeps every test file's
+result and its import dependencies in memory. Given a batch of changed
+paths, it re-analyzes only the touched test files and the tests depending on
+touched source modules, renumbers, and returns the difference to the
+previous proposals. File changes come from an :class:`InotifyWatcher` on
+Linux or a :class:`PollingWatcher` (one ``scandir`` pass per interval)
+elsewhere; :func:`create_watcher` picks one.
+
+Copyright (c) 2025 Jim Schilling
+License: MIT
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from typing import Iterable, Iterator, Optional, TextIO, Union
+
+from splurge_test_namer.constants import (
+    DEFAULT_POLL_INTERVAL,
+    IMPORTS_ALL,
+    NUMBERING_SEQUENTIAL,
+    READ_FULL,
+)
+from splurge_test_namer.exceptions import SentinelReadError
+from splurge_test_namer.namer import (
+    FileProposal,
+    create_scan_context,
+    number_proposals,
+    read_file_domains,
+    show_dry_run,
+    slug_sentinel_list,
+)
+from splurge_test_namer.output import MODE_WATCH, ProposalWriter
+from splurge_test_namer.resolver import ModuleIndex
+from splurge_test_namer.util_helpers import ALWAYS_PRUNED_DIRS, iter_test_files
+
+DOMAINS = ["watch"]
+
+# Seconds to keep collecting events after the first one, so an editor's
+# save (write, rename, chmod) is handled as one batch.
+DEBOUNCE_SECONDS = 0.05
+
+LOGGER = logging.getLogger(__name__)
+
+__all__ = [
+    "DEFAULT_POLL_INTERVAL",
+    "InotifyWatcher",
+    "PollingWatcher",
+    "WatchDiff",
+    "WatchSession",
+    "create_watcher",
+    "run_watch",
+]
+
+
+@dataclass
+class WatchDiff:
+    """Proposal changes produced by one batch of file changes.
+
+    Attributes:
+        changed: ``(original, proposed)`` pairs that are new or whose
+            proposed name changed, in proposal order.
+        removed: Test files that no longer have a proposal.
+        analyzed: Number of test files re-analyzed for the batch.
+        seconds: Time taken to process the batch.
+    """
+
+    changed: list[tuple[Path, Path]] = field(default_factory=list)
+    removed: list[Path] = field(default_factory=list)
+    analyzed: int = 0
+    seconds: float = 0.0
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.removed)
+
+
+class WatchSession:
+    """In-memory scan state that can be updated from changed paths.
+
+    Arguments have the same meaning as for
+    :func:`~splurge_test_namer.namer.build_proposals`. The analysis cache,
+    when ``cache_dir`` is given, is loaded once and saved by :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        sentinel: str,
+        root_import: Optional[str] = None,
+        repo_root: Optional[Path] = None,
+        excludes: Optional[list[str]] = None,
+        fallback: str = "misc",
+        prefix: str = "test",
+        cache_dir: Optional[Path] = None,
+        numbering: str = NUMBERING_SEQUENTIAL,
+        follow_depth: int = 1,
+        read_mode: str = READ_FULL,
+        imports: str = IMPORTS_ALL,
+        skip_type_checking: bool = False,
+        skip_local_imports: bool = False,
+    ) -> None:
+        self.root = root
+        self.excludes = list(excludes or [])
+        self.fallback = fallback
+        self.prefix = prefix
+        self.numbering = numbering
+        self.ctx = create_scan_context(
+            sentinel,
+            root_import=root_import,
+            repo_root=repo_root,
+            cache_dir=cache_dir,
+            follow_depth=follow_depth,
+            read_mode=read_mode,
+            imports=imports,
+            skip_type_checking=skip_type_checking,
+            skip_local_imports=skip_local_imports,
+            dependencies={},
+        )
+        self.results: dict[Path, FileProposal] = {}
+        self.proposals: dict[Path, Path] = {}
+        # absolute dependency path -> test files whose sentinels came from it
+        self._dependents: dict[str, set[Path]] = {}
+        self._deps: dict[Path, list[str]] = {}
+        # test files with an unresolved import: re-analyzed on any new module
+        self._untracked: set[Path] = set()
+        self._pruned = ALWAYS_PRUNED_DIRS | {e.lower() for e in self.excludes}
+        self._abs_root = os.path.abspath(root)
+
+    @property
+    def watch_roots(self) -> list[Path]:
+        """Directories whose changes affect the proposals."""
+        roots = [self.root]
+        repo_root = self.ctx.repo_root
+        if repo_root is not None:
+            abs_repo = os.path.abspath(repo_root)
+            if os.path.commonpath([abs_repo, self._abs_root]) == abs_repo:
+                return [repo_root]
+            if os.path.commonpath([abs_repo, self._abs_root]) != self._abs_root:
+                roots.append(repo_root)
+        return roots
+
+    @property
+    def watch_pruned(self) -> frozenset[str]:
+        """Directory names (lower-cased) that test discovery prunes."""
+        return frozenset(self._pruned)
+
+    @property
+    def source_dirs(self) -> list[Path]:
+        """Import-root package directories, watched in full since their modules can be dependencies."""
+        if self.ctx.root_import is None or self.ctx.repo_root is None:
+            return []
+        return [self.ctx.repo_root.joinpath(*self.ctx.root_import.split("."))]
+
+    def scan(self) -> list[tuple[Path, Path]]:
+        """Analyze every test file and return the initial proposals."""
+        for f in iter_test_files(self.root, self.excludes):
+            self._analyze(f)
+        self.proposals = dict(self._number())
+        return sorted(self.proposals.items(), key=lambda op: self._order(op[0]))
+
+    def _order(self, f: Path) -> tuple[str, str]:
+        return (self.results[f].prefix, str(f).lower())
+
+    def _number(self) -> list[tuple[Path, Path]]:
+        return number_proposals(((r.prefix, r.path) for r in self.results.values()), self.numbering)
+
+    def _test_path(self, path: Path) -> Optional[Path]:
+        """Return ``path`` in the form the walker yields it, if it is a test file under the root."""
+        rel = os.path.relpath(os.path.abspath(path), self._abs_root)
+        if rel == os.curdir or rel.startswith(os.pardir):
+            return None
+        parts = rel.split(os.sep)
+        name = parts[-1]
+        if not (name.startswith("test_") and name.endswith(".py")):
+            return None
+        if any(part.lower() in self._pruned for part in parts):
+            return None
+        return self.root.joinpath(*parts)
+
+    def _forget(self, f: Path) -> None:
+        self.results.pop(f, None)
+        self._untracked.discard(f)
+        for dep in self._deps.pop(f, []):
+            users = self._dependents.get(dep)
+            if users is not None:
+                users.discard(f)
+                if not users:
+                    del self._dependents[dep]
+
+    def _analyze(self, f: Path) -> None:
+        self._forget(f)
+        try:
+            domains = read_file_domains(f, self.ctx)
+        except SentinelReadError:
+            # deleted or unreadable between the event and the read
+            LOGGER.debug("watch: skipping unreadable %s", f)
+            return
+        deps = self.ctx.deps.pop(f, []) if self.ctx.deps is not None else []
+        file_prefix = f"{self.prefix}_" + slug_sentinel_list(domains, fallback=self.fallback)
+        self.results[f] = FileProposal(f, domains, file_prefix)
+        if deps is None:
+            self._untracked.add(f)
+            deps = []
+        keys = sorted({os.path.abspath(d) for d in deps})
+        self._deps[f] = keys
+        for dep in keys:
+            self._dependents.setdefault(dep, set()).add(f)
+
+    def _expand(self, changed: Iterable[Union[str, Path]]) -> set[str]:
+        """Return absolute paths of changed ``.py`` files, expanding directories.
+
+        A directory stands for every file below it: those on disk now and
+        those known from the previous state (for removed directories).
+        """
+        out: set[str] = set()
+        known = [os.path.abspath(f) for f in self.results] + list(self._dependents)
+        for p in changed:
+            ap = os.path.abspath(p)
+            if ap.endswith(".py") and not os.path.isdir(ap):
+                out.add(ap)
+                continue
+            prefix = ap + os.sep
+            out.update(k for k in known if k.startswith(prefix))
+            if os.path.isdir(ap):
+                kept = [os.path.abspath(k) for k in self.source_dirs]
+                for dirpath, dirnames, filenames in os.walk(ap):
+                    dirnames[:] = [d for d in dirnames if _observed(os.path.join(dirpath, d), self._pruned, kept)]
+                    out.update(os.path.join(dirpath, n) for n in filenames if n.endswith(".py"))
+        return out
+
+    def update(self, changed: Iterable[Union[str, Path]]) -> WatchDiff:
+        """Apply a batch of changed paths and return the proposal difference.
+
+        Changed test files are re-analyzed (or dropped when deleted); changed
+        source modules invalidate their memoized sentinels and re-analyze the
+        tests depending on them. Creating or deleting a module also rebuilds
+        the module index and re-analyzes tests with unresolved imports.
+        """
+        start = time.perf_counter()
+        paths = self._expand(changed)
+        tests: set[Path] = set()
+        sources: list[str] = []
+        for ap in paths:
+            test = self._test_path(Path(ap))
+            if test is not None:
+                tests.add(test)
+            else:
+                sources.append(ap)
+        if sources and self.ctx.repo_root is not None:
+            structural = False
+            resolver = self.ctx.resolver
+            for ap in sources:
+                tests.update(self._dependents.get(ap, ()))
+                if not os.path.exists(ap) or (resolver is not None and not resolver.contains(ap)):
+                    # a module appeared or disappeared: name resolution may change,
+                    # and so does every star import of its package
+                    structural = True
+                    tests.update(self._dependents.get(os.path.dirname(ap), ()))
+            memo = self.ctx.memo
+            if structural:
+                self.ctx.resolver = ModuleIndex(self.ctx.repo_root)
+                if memo is not None:
+                    memo.clear()
+                tests.update(self._untracked)
+            elif memo is not None:
+                memo.invalidate(Path(ap) for ap in sources)
+            if self.ctx.graph is not None:
+                # closures span many modules; rebuild them (the cache keeps parsing cheap)
+                self.ctx.attach_graph()
+        for f in sorted(tests, key=str):
+            if f.is_file():
+                self._analyze(f)
+            else:
+                self._forget(f)
+        previous = self.proposals
+        current = dict(self._number())
+        self.proposals = current
+        changed_pairs = sorted(
+            ((o, p) for o, p in current.items() if previous.get(o) != p), key=lambda op: self._order(op[0])
+        )
+        removed = sorted((o for o in previous if o not in current), key=str)
+        return WatchDiff(changed_pairs, removed, len(tests), time.perf_counter() - start)
+
+    def close(self) -> None:
+        """Save the analysis cache, if one is used."""
+        if self.ctx.cache is not None:
+            self.ctx.cache.save()
+
+
+def _observed(path: str, pruned: Iterable[str], keep: list[str]) -> bool:
+    """Whether a watcher observes directory ``path``.
+
+    Dot-directories and ``__pycache__`` are skipped, and so are directories
+    named in ``pruned`` unless they lie in (or above) a ``keep`` directory.
+    """
+    name = os.path.basename(path)
+    if name.startswith(".") or name == "__pycache__":
+        return False
+    if name.lower() not in pruned:
+        return True
+    ap = os.path.abspath(path)
+    return any(os.path.commonpath([ap, k]) in (ap, k) for k in keep)
+
+
+def _walk_dirs(roots: Iterable[Path], pruned: Iterable[str] = (), keep: Iterable[Path] = ()) -> Iterator[str]:
+    """Yield every directory under ``roots`` that a watcher observes (see :func:`_observed`)."""
+    pruned = frozenset(pruned)
+    kept = [os.path.abspath(k) for k in keep]
+    for root in roots:
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if _observed(os.path.join(dirpath, d), pruned, kept))
+            yield dirpath
+
+
+class PollingWatcher:
+    """Detect ``.py`` file changes by comparing directory scans.
+
+    Args:
+        roots: Directories to watch recursively.
+        interval: Seconds between scans.
+        pruned: Directory names (lower-cased) that are not scanned, as test
+            discovery prunes them (see :attr:`WatchSession.watch_pruned`).
+        keep: Directories scanned in full even below a pruned name.
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        interval: float = DEFAULT_POLL_INTERVAL,
+        pruned: Iterable[str] = (),
+        keep: Iterable[Path] = (),
+    ) -> None:
+        self.roots = list(roots)
+        self.interval = interval
+        self.pruned = frozenset(pruned)
+        self.keep = list(keep)
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        for dirpath in _walk_dirs(self.roots, self.pruned, self.keep):
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        if entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                            st = entry.stat(follow_symlinks=False)
+                            snapshot[entry.path] = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                continue
+        return snapshot
+
+    def poll(self, timeout: Optional[float] = None) -> set[str]:
+        """Return the paths changed since the last call.
+
+        Waits up to ``timeout`` seconds (forever when None) for a change.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            previous = self._snapshot
+            self._snapshot = current
+            changed = {p for p, v in current.items() if previous.get(p) != v}
+            changed.update(p for p in previous if p not in current)
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            remaining = self.interval if deadline is None else deadline - time.monotonic()
+            time.sleep(max(0.0, min(self.interval, remaining)))
+
+    def batches(self) -> Iterator[set[str]]:
+        """Yield non-empty batches of changed paths forever."""
+        while True:
+            yield self.poll()
+
+    def close(self) -> None:
+        """Release resources (nothing to release for polling)."""
+
+
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+_EVENT = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Detect ``.py`` file changes with Linux inotify (through ``ctypes``).
+
+    Every directory below ``roots`` is watched; directories created later
+    are added as they appear. An event queue overflow reports the roots
+    themselves, which a :class:`WatchSession` treats as "everything changed".
+
+    Args:
+        roots: Directories to watch recursively.
+        pruned: Directory names (lower-cased) that are not watched, as test
+            discovery prunes them (see :attr:`WatchSession.watch_pruned`).
+        keep: Directories watched in full even below a pruned name.
+
+    Raises:
+        OSError: If inotify is unavailable or a watch cannot be added.
+    """
+
+    def __init__(self, roots: Iterable[Path], pruned: Iterable[str] = (), keep: Iterable[Path] = ()) -> None:
+        import ctypes
+        import ctypes.util
+
+        self.roots = list(roots)
+        self.pruned = frozenset(pruned)
+        self.keep = list(keep)
+        self._kept = [os.path.abspath(k) for k in self.keep]
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._ctypes = ctypes
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._wds: dict[int, str] = {}
+        try:
+            for dirpath in _walk_dirs(self.roots, self.pruned, self.keep):
+                self._add_watch(dirpath)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, dirpath: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(self._ctypes.get_errno(), f"inotify_add_watch failed for {dirpath}")
+        self._wds[wd] = dirpath
+
+    def _read_events(self, changed: set[str]) -> None:
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + _EVENT.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+            raw = buf[offset + _EVENT.size : offset + _EVENT.size + length]
+            offset += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                changed.update(str(r) for r in self.roots)
+                continue
+            if mask & _IN_IGNORED:
+                self._wds.pop(wd, None)
+                continue
+            directory = self._wds.get(wd)
+            if directory is None:
+                continue
+            name = os.fsdecode(raw.rstrip(b"\0"))
+            path = os.path.join(directory, name) if name else directory
+            if mask & _IN_ISDIR:
+                if not _observed(path, self.pruned, self._kept):
+                    continue
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    for sub in _walk_dirs([Path(path)], self.pruned, self.keep):
+                        try:
+                            self._add_watch(sub)
+                        except OSError as e:
+                            LOGGER.debug("watch: cannot watch %s: %s", sub, e)
+                changed.add(path)
+            elif name.endswith(".py") and not mask & _IN_CREATE:
+                # files are reported once written (IN_CLOSE_WRITE), not on creation
+                changed.add(path)
+
+    def poll(self, timeout: Optional[float] = None) -> set[str]:
+        """Return the paths changed since the last call.
+
+        Waits up to ``timeout`` seconds (forever when None) for a first
+        event, then collects events for :data:`DEBOUNCE_SECONDS` more.
+        """
+        changed: set[str] = set()
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return changed
+        while readable:
+            self._read_events(changed)
+            readable, _, _ = select.select([self._fd], [], [], DEBOUNCE_SECONDS)
+        return changed
+
+    def batches(self) -> Iterator[set[str]]:
+        """Yield non-empty batches of changed paths forever."""
+        while True:
+            changed = self.poll()
+            if changed:
+                yield changed
+
+    def close(self) -> None:
+        """Close the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(
+    roots: Iterable[Path],
+    interval: float = DEFAULT_POLL_INTERVAL,
+    pruned: Iterable[str] = (),
+    keep: Iterable[Path] = (),
+) -> Union[InotifyWatcher, PollingWatcher]:
+    """Return an inotify watcher on Linux, or a polling watcher otherwise.
+
+    Polling is also used when inotify cannot be set up (for example when the
+    per-user watch limit is reached). ``pruned`` and ``keep`` are passed to
+    the watcher.
+    """
+    roots = list(roots)
+    pruned = frozenset(pruned)
+    keep = list(keep)
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(roots, pruned, keep)
+        except (OSError, AttributeError) as e:
+            LOGGER.info("inotify unavailable (%s); polling every %.2fs", e, interval)
+    return PollingWatcher(roots, interval, pruned, keep)
+
+
+def run_watch(
+    session: WatchSession,
+    stream: TextIO,
+    fmt: str = "text",
+    interval: float = DEFAULT_POLL_INTERVAL,
+    watcher: Optional[Union[InotifyWatcher, PollingWatcher]] = None,
+    max_batches: Optional[int] = None,
+) -> None:
+    """Scan, report the proposals, then report proposal changes as files change.
+
+    Each batch of changes is reported as a ``watch`` report containing the
+    new or changed proposals and the removed files (``text`` adds a summary
+    line with the batch time). Runs until interrupted or, when
+    ``max_batches`` is given, until that many non-empty diffs were reported.
+
+    Args:
+        session: Session to scan and update.
+        stream: Report destination.
+        fmt: ``text`` or ``ndjson``.
+        interval: Polling interval when inotify is unavailable.
+        watcher: Change source; defaults to :func:`create_watcher` over
+            :attr:`WatchSession.watch_roots`, skipping the directories test
+            discovery prunes outside :attr:`WatchSession.source_dirs`.
+        max_batches: Stop after this many reported diffs.
+    """
+    show_dry_run(session.scan(), writer=ProposalWriter(stream, fmt, metadata=session.results))
+    if watcher is None:
+        watcher = create_watcher(session.watch_roots, interval, session.watch_pruned, session.source_dirs)
+    reported = 0
+    try:
+        for batch in watcher.batches():
+            diff = session.update(batch)
+            if not diff:
+                continue
+            writer = ProposalWriter(stream, fmt, metadata=session.results)
+            writer.begin(MODE_WATCH)
+            for orig, prop in diff.changed:
+                writer.proposal(orig, prop)
+            for orig in diff.removed:
+                writer.removal(orig)
+            writer.end()
+            if fmt == "text":
+                stream.write(
+                    f"Updated {len(diff.changed)}, removed {len(diff.removed)} "
+                    f"({diff.analyzed} files analyzed in {diff.seconds * 1000:.1f} ms)\n"
+                )
+                stream.flush()
+            reported += 1
+            if max_batches is not None and reported >= max_batches:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        session.close()
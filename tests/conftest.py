@@ -0,0 +1,65 @@
+"""Shared fixtures for building small repositories and test trees on disk."""
+
+import os
+from pathlib import Path
+from typing import Callable, Mapping
+
+import pytest
+
+
+def _write(path: Path, content: str = "") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _bump(path: Path, content: str) -> None:
+    st = path.stat()
+    path.write_text(content, encoding="utf-8")
+    # a visibly newer mtime even on filesystems with coarse timestamps
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def write() -> Callable[..., Path]:
+    """Return ``write(path, content="")``: write a file, creating its parent directories."""
+    return _write
+
+
+@pytest.fixture
+def bump() -> Callable[[Path, str], None]:
+    """Return ``bump(path, content)``: rewrite a file and advance its mtime by one second."""
+    return _bump
+
+
+@pytest.fixture
+def make_repo(tmp_path: Path) -> Callable[[Mapping[str, str]], tuple[Path, Path]]:
+    """Return ``make_repo(files)``: write ``files`` (relative path -> content) under ``tmp_path / "repo"``.
+
+    The factory returns the repository root and its ``tests`` directory.
+    """
+
+    def make(files: Mapping[str, str]) -> tuple[Path, Path]:
+        repo = tmp_path / "repo"
+        for rel, content in files.items():
+            _write(repo / rel, content)
+        return repo, repo / "tests"
+
+    return make
+
+
+# package ``pkg`` with modules ``core`` and ``io``, and three tests importing them
+SAMPLE_PROJECT = {
+    "pkg/__init__.py": "",
+    "pkg/core.py": "DOMAINS = ['core']\n",
+    "pkg/io.py": "DOMAINS = ['io']\n",
+    "tests/test_a.py": "import pkg.core\n",
+    "tests/test_b.py": "import pkg.core\n",
+    "tests/test_c.py": "import pkg.io\n",
+}
+
+
+@pytest.fixture
+def sample_project(make_repo: Callable[[Mapping[str, str]], tuple[Path, Path]]) -> tuple[Path, Path]:
+    """Write :data:`SAMPLE_PROJECT` and return the repository root and its ``tests`` directory."""
+    return make_repo(SAMPLE_PROJECT)
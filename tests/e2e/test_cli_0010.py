@@ -0,0 +1,75 @@
+import importlib
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
+
+def run_cli(args, cwd):
+    old_cwd = os.getcwd()
+    old_argv = sys.argv[:]
+    old_stdout = sys.stdout
+    buf = io.StringIO()
+    try:
+        os.chdir(str(cwd))
+        sys.argv = ["splurge_test_namer"] + args
+        import splurge_test_namer.cli as cli
+
+        importlib.reload(cli)
+        sys.stdout = buf
+        cli.main()
+        return 0, buf.getvalue()
+    except SystemExit as e:
+        return (e.code if isinstance(e.code, int) else 1), buf.getvalue()
+    finally:
+        sys.argv = old_argv
+        sys.stdout = old_stdout
+        os.chdir(old_cwd)
+
+
+PROJECT = {
+    "pkg/__init__.py": "",
+    "pkg/core.py": "DOMAINS = ['core']\n",
+    "tests/test_a.py": "import pkg.core\n",
+    "tests/test_b.py": "DOMAINS = ['io']\n",
+}
+
+SCAN = ["--test-root", "tests", "--import-root", "pkg", "--repo-root", ".", "--no-cache", "--jobs", "1"]
+
+
+def test_plan_out_then_apply_plan(make_repo):
+    repo, _ = make_repo(PROJECT)
+    code, out = run_cli(SCAN + ["--plan-out", "plan.json"], repo)
+    assert code == 0
+    assert "test_core_0001.py" in out and "test_io_0001.py" in out
+    assert sorted(p.name for p in (repo / "tests").iterdir()) == ["test_a.py", "test_b.py"]
+
+    # applying needs neither the test root nor a scan
+    code, out = run_cli(["--apply-plan", "plan.json", "--test-root", "missing", "--format", "ndjson"], repo)
+    assert code == 0
+    entries = [json.loads(line) for line in out.splitlines()]
+    renamed = {Path(e["proposed"]).name: e["sentinels"] for e in entries if e["event"] == "rename"}
+    assert renamed == {"test_core_0001.py": ["core"], "test_io_0001.py": ["io"]}
+    assert sorted(p.name for p in (repo / "tests").iterdir()) == ["test_core_0001.py", "test_io_0001.py"]
+
+
+def test_stale_plan_is_refused(make_repo):
+    repo, _ = make_repo(PROJECT)
+    assert run_cli(SCAN + ["--plan-out", "plan.json"], repo)[0] == 0
+    core = repo / "pkg" / "core.py"
+    st = core.stat()
+    core.write_text("DOMAINS = ['api']\n")
+    os.utime(core, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    code, out = run_cli(["--apply-plan", "plan.json"], repo)
+    assert code == 2
+    assert "stale" in out and str(core.resolve()) in out
+    assert sorted(p.name for p in (repo / "tests").iterdir()) == ["test_a.py", "test_b.py"]
+
+
+def test_plan_flag_conflicts(make_repo):
+    repo, _ = make_repo(PROJECT)
+    assert run_cli(SCAN + ["--plan-out", "plan.json", "--apply"], repo)[0] == 2
+    assert run_cli(SCAN + ["--apply-plan", "plan.json", "--watch"], repo)[0] == 2
+    code, out = run_cli(["--apply-plan", "missing.json"], repo)
+    assert code == 2 and "Failed to read plan file" in out
@@ -0,0 +1,60 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY = {"splurge_test_namer.namer", "splurge_test_namer.parser", "splurge_test_namer.cache", "ast", "inspect"}
+
+SCRIPT = (
+    "import sys; sys.argv = ['splurge-test-namer'] + sys.argv[1:]\n"
+    "from splurge_test_namer import cli\n"
+    "try:\n"
+    "    cli.main()\n"
+    "except SystemExit:\n"
+    "    pass\n"
+    "print('\\nMODULES ' + ' '.join(sorted(sys.modules)))\n"
+)
+
+
+def loaded_modules(args: list[str], cwd: Path) -> set[str]:
+    proc = subprocess.run(
+        [sys.executable, "-c", SCRIPT, *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(REPO_ROOT), "PATH": ""},
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith("MODULES "):
+            return set(line.split()[1:])
+    raise AssertionError(proc.stdout + proc.stderr)
+
+
+@pytest.mark.parametrize("args", [["--help"], ["--sentinel", "1bad"], ["--jobs", "0"]])
+def test_help_and_validation_do_not_load_analysis_modules(tmp_path, args):
+    (tmp_path / "tests").mkdir()
+    modules = loaded_modules(["--test-root", str(tmp_path / "tests"), *args], tmp_path)
+    assert "splurge_test_namer.cli" in modules
+    assert not HEAVY & modules
+
+
+def test_serial_run_does_not_load_multiprocessing(tmp_path):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_a.py").write_text("DOMAINS = ['core']\n")
+    modules = loaded_modules(["--test-root", str(tests), "--no-cache", "--jobs", "1"], tmp_path)
+    assert "splurge_test_namer.namer" in modules
+    assert "multiprocessing" not in modules
+
+
+def test_namer_functions_delegate_to_namer(monkeypatch):
+    import splurge_test_namer.cli as cli
+    import splurge_test_namer.namer as namer
+
+    calls = []
+    monkeypatch.setattr(namer, "show_dry_run", lambda *a, **k: calls.append((a, k)))
+    cli.show_dry_run(["p"], writer=None)
+    assert calls == [((["p"],), {"writer": None})]
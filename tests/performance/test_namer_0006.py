@@ -0,0 +1,48 @@
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCH_DIR = Path(__file__).resolve().parents[2] / "tools" / "benchmarks"
+
+
+@pytest.fixture()
+def bench(monkeypatch):
+    monkeypatch.syspath_prepend(str(BENCH_DIR))
+    corpus = importlib.import_module("corpus")
+    pipeline = importlib.import_module("bench_pipeline")
+    yield corpus, pipeline
+    sys.modules.pop("corpus", None)
+    sys.modules.pop("bench_pipeline", None)
+
+
+def tree_snapshot(root: Path) -> dict[str, str]:
+    return {str(p.relative_to(root)): p.read_text() for p in sorted(root.rglob("*.py"))}
+
+
+def test_corpus_is_deterministic(tmp_path, bench):
+    corpus, _ = bench
+    spec = corpus.CorpusSpec(tests=40, modules=8, depth=2)
+    a = corpus.generate_corpus(tmp_path / "a", spec)
+    b = corpus.generate_corpus(tmp_path / "b", spec)
+    assert a.test_files == b.test_files == 40 and a.modules == b.modules == 8
+    assert tree_snapshot(tmp_path / "a") == tree_snapshot(tmp_path / "b")
+    text = "".join(tree_snapshot(tmp_path / "a").values())
+    assert "import *" in text and "importlib.import_module(" in text
+
+
+def test_runner_reports_phases_and_compare_flags_regressions(tmp_path, bench, capsys):
+    corpus, pipeline = bench
+    run = pipeline.run_size("tiny", 1, False, spec=corpus.CorpusSpec(tests=30, modules=6, depth=1))
+    phases = run["phases"]
+    assert set(phases) == {"scan", "imports", "resolve", "resolve_index", "rename"}
+    assert phases["scan"]["files"] == 30
+    assert phases["rename"]["files"] == 30
+
+    base = {"runs": {"tiny": run}}
+    slower = json.loads(json.dumps(base))
+    slower["runs"]["tiny"]["phases"]["scan"]["seconds"] = run["phases"]["scan"]["seconds"] * 3 + 1
+    assert pipeline.compare(base, base, 0.15) == []
+    assert pipeline.compare(base, slower, 0.15) == ["tiny/scan"]
@@ -0,0 +1,43 @@
+import ast
+import time
+from pathlib import Path
+
+from splurge_test_namer.parser import read_sentinels_from_file
+
+
+def make_large_module(functions: int, sentinel_line: str) -> str:
+    lines = ["import pytest", "", sentinel_line]
+    for i in range(functions):
+        lines.append(f"@pytest.mark.parametrize('v', [{', '.join(repr(f'v{i}_{j}') for j in range(20))}])")
+        lines.append(f"def test_case_{i}(v):")
+        lines.append(f"    assert {{'id': {i}, 'items': [v] * 3}}['items'][0] == v")
+    return "\n".join(lines) + "\n"
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_fast_path_faster_than_full_parse_on_large_module(tmp_path: Path):
+    p = tmp_path / "test_large.py"
+    p.write_text(make_large_module(1500, "DOMAINS = ['core', 'parser']"))
+
+    assert read_sentinels_from_file(p, "DOMAINS") == ["core", "parser"]
+    full = best_of(3, lambda: ast.parse(p.read_text()))
+    fast = best_of(3, lambda: read_sentinels_from_file(p, "DOMAINS"))
+    assert fast * 10 < full
+
+
+def test_module_without_sentinel_skips_parse(tmp_path: Path):
+    p = tmp_path / "test_large.py"
+    p.write_text(make_large_module(1500, "OTHER = ['x']"))
+
+    assert read_sentinels_from_file(p, "DOMAINS") == []
+    full = best_of(3, lambda: ast.parse(p.read_text()))
+    fast = best_of(3, lambda: read_sentinels_from_file(p, "DOMAINS"))
+    assert fast * 10 < full
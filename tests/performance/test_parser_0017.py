@@ -0,0 +1,43 @@
+import time
+from pathlib import Path
+
+from splurge_test_namer.constants import IMPORTS_STATIC
+from splurge_test_namer.parser import ImportPolicy, analyze_module
+from splurge_test_namer.stats import collect_stats
+
+
+def make_data_heavy_module(functions: int) -> str:
+    lines = ["import pytest", "import pkg.core", "", "DOMAINS = ['core', 'parser']"]
+    for i in range(functions):
+        lines.append(f"CASES_{i} = [{', '.join(repr({'id': j, 'name': f'c{i}_{j}'}) for j in range(10))}]")
+        lines.append(f"@pytest.mark.parametrize('case', CASES_{i})")
+        lines.append(f"def test_case_{i}(case):")
+        lines.append("    assert case['name']")
+    return "\n".join(lines) + "\n"
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_header_mode_saves_io_and_parse_on_large_module(tmp_path: Path):
+    p = tmp_path / "test_large.py"
+    p.write_text(make_data_heavy_module(1500))
+    # header mode applies when dynamic import calls are not scanned
+    static = ImportPolicy(IMPORTS_STATIC)
+
+    full = analyze_module(p, "DOMAINS", "pkg", tmp_path, policy=static)
+    with collect_stats() as stats:
+        header = analyze_module(p, "DOMAINS", "pkg", tmp_path, header=True, policy=static)
+    assert header.sentinels == full.sentinels == ["core", "parser"]
+    assert header.imports == full.imports == {"pkg.core"}
+    assert stats.counters["bytes_read"] * 10 < p.stat().st_size
+
+    full_time = best_of(3, lambda: analyze_module(p, "DOMAINS", "pkg", tmp_path, policy=static))
+    header_time = best_of(3, lambda: analyze_module(p, "DOMAINS", "pkg", tmp_path, header=True, policy=static))
+    assert header_time * 10 < full_time
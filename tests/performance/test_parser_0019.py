@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from splurge_test_namer.parser import analyze_module
+from splurge_test_namer.stats import collect_stats
+
+
+def make_unrelated_module(functions: int) -> str:
+    lines = ["import pytest", "import json"]
+    for i in range(functions):
+        lines.append(f"@pytest.mark.parametrize('v', [{', '.join(repr(f'v{i}_{j}') for j in range(20))}])")
+        lines.append(f"def test_case_{i}(v):")
+        lines.append("    assert json.loads(json.dumps(v)) == v")
+    return "\n".join(lines) + "\n"
+
+
+def test_prefilter_skips_parse_of_unrelated_module(tmp_path: Path):
+    p = tmp_path / "test_large.py"
+    p.write_text(make_unrelated_module(1500))
+
+    with collect_stats() as stats:
+        analysis = analyze_module(p, "DOMAINS", "pkg", tmp_path)
+    assert analysis.sentinels == [] and analysis.imports == set()
+    assert stats.counters["prefilter_skips"] == 1
+    assert stats.counters.get("parses", 0) == 0
+
+
+def test_prefilter_parses_module_that_mentions_the_import_root(tmp_path: Path):
+    p = tmp_path / "test_large.py"
+    p.write_text("import pkg.core\n" + make_unrelated_module(1500))
+
+    with collect_stats() as stats:
+        analysis = analyze_module(p, "DOMAINS", "pkg", tmp_path)
+    assert analysis.imports == {"pkg.core"}
+    assert stats.counters.get("prefilter_skips", 0) == 0
+    assert stats.counters["parses"] == 1
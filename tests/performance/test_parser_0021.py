@@ -0,0 +1,44 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from splurge_test_namer.parser import _sentinels_from_source, read_sentinels_from_file
+
+SHAPES = {
+    "unclosed": "DOMAINS = [\n",
+    "blank": "\n\n\n\n   \t\n",
+    "annotation": "DOMAINS: list[str] , x.y " + "a" * 100 + "\n",
+    "brackets": "x = [[[(({{" * 8 + "\n",
+}
+
+
+def malformed(shape: str, size: int) -> str:
+    unit = SHAPES[shape]
+    return "def broken(:\n" + unit * (size // len(unit) + 1)
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("shape", sorted(SHAPES))
+def test_fallback_scales_linearly_on_malformed_sources(shape):
+    small = malformed(shape, 1 << 20)
+    large = malformed(shape, 1 << 22)
+    t_small = min(timed(_sentinels_from_source, small, "DOMAINS") for _ in range(3))
+    t_large = min(timed(_sentinels_from_source, large, "DOMAINS") for _ in range(3))
+    assert t_large < 2.0
+    # 4x the input; a quadratic scan would take ~16x
+    assert t_large < t_small * 8 + 0.01
+
+
+def test_multi_megabyte_malformed_file(tmp_path: Path):
+    p = tmp_path / "test_broken.py"
+    p.write_text(malformed("unclosed", 4 << 20) + "DOMAINS = ['late']\n")
+    start = time.perf_counter()
+    # the first candidate's list runs to the only closing bracket
+    assert read_sentinels_from_file(p, "DOMAINS") == ["late"]
+    assert time.perf_counter() - start < 5.0
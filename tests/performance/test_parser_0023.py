@@ -0,0 +1,37 @@
+import ast
+import time
+from pathlib import Path
+
+from splurge_test_namer.parser import ImportPolicy, _imports_from_tree
+
+
+def make_data_heavy_module(functions: int) -> str:
+    lines = ["import pytest", "import pkg.core", "", "DOMAINS = ['core']"]
+    for i in range(functions):
+        lines.append(f"CASES_{i} = [{', '.join(repr({'id': j, 'name': f'c{i}_{j}'}) for j in range(10))}]")
+        lines.append(f"@pytest.mark.parametrize('case', CASES_{i})")
+        lines.append(f"def test_case_{i}(case):")
+        lines.append("    from pkg import helpers")
+        lines.append("    assert helpers.check(case)")
+    return "\n".join(lines) + "\n"
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_static_scope_skips_data_literals(tmp_path: Path):
+    p = tmp_path / "test_large.py"
+    tree = ast.parse(make_data_heavy_module(1000))
+    full = ImportPolicy()
+    static = ImportPolicy("static")
+    assert _imports_from_tree(tree, p, "pkg", tmp_path, static) == _imports_from_tree(tree, p, "pkg", tmp_path, full)
+
+    full_time = best_of(3, lambda: _imports_from_tree(tree, p, "pkg", tmp_path, full))
+    static_time = best_of(3, lambda: _imports_from_tree(tree, p, "pkg", tmp_path, static))
+    assert static_time * 2 < full_time
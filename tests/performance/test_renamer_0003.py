@@ -0,0 +1,49 @@
+import os
+import time
+from pathlib import Path
+
+import splurge_test_namer.renamer as renamer
+from splurge_test_namer.namer import apply_renames
+from splurge_test_namer.output import ProposalWriter
+
+LATENCY = 0.002
+
+
+class NullStream:
+    def write(self, text: str) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+
+def make_batch(root: Path, n: int) -> list[tuple[Path, Path]]:
+    root.mkdir()
+    proposals = []
+    for i in range(n):
+        src = root / f"test_old_{i:04d}.py"
+        src.write_text("")
+        proposals.append((src, root / f"test_new_{i:04d}.py"))
+    return proposals
+
+
+def timed_apply(root: Path, workers: int) -> float:
+    proposals = make_batch(root, 300)
+    start = time.perf_counter()
+    apply_renames(proposals, writer=ProposalWriter(NullStream()), workers=workers)
+    return time.perf_counter() - start
+
+
+def test_concurrent_renames_hide_filesystem_latency(tmp_path: Path, monkeypatch):
+    real_replace = os.replace
+
+    def slow_replace(src, dst):
+        # every rename costs a round trip, as on a network filesystem
+        time.sleep(LATENCY)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(renamer.os, "replace", slow_replace)
+    serial = timed_apply(tmp_path / "serial", 1)
+    concurrent = timed_apply(tmp_path / "concurrent", 16)
+    assert sorted(p.name for p in (tmp_path / "concurrent").iterdir()) == [f"test_new_{i:04d}.py" for i in range(300)]
+    assert concurrent * 4 < serial
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+from splurge_test_namer.cache import AnalysisCache
+from splurge_test_namer.parser import PARSE_OK, ModuleAnalysis
+
+
+def analysis(path: Path, sentinels: list[str], imports=None) -> ModuleAnalysis:
+    return ModuleAnalysis(
+        path,
+        PARSE_OK,
+        sentinels=sentinels,
+        static_imports=frozenset(imports or ()),
+        imports_scanned=imports is not None,
+    )
+
+
+def test_cache_roundtrip_persists_entries(tmp_path, write):
+    src = write(tmp_path / "mod.py", "DOMAINS = ['a']\n")
+    cache_dir = tmp_path / "cache"
+
+    cache = AnalysisCache.load(cache_dir, "DOMAINS")
+    cache.put_analysis(src, analysis(src, ["a"], {"pkg.b", "pkg.a"}))
+    cache.save()
+
+    reloaded = AnalysisCache.load(cache_dir, "DOMAINS")
+    cached = reloaded.get_analysis(src, need_imports=True)
+    assert cached is not None
+    assert cached.sentinels == ["a"]
+    assert cached.imports == {"pkg.a", "pkg.b"}
+
+
+def test_cache_sentinel_only_entry_does_not_satisfy_import_lookup(tmp_path, write):
+    src = write(tmp_path / "mod.py", "DOMAINS = ['a']\n")
+    cache = AnalysisCache.load(tmp_path / "cache", "DOMAINS")
+    cache.put_analysis(src, analysis(src, ["a"]))
+    assert cache.get_analysis(src) is not None
+    assert cache.get_analysis(src, need_imports=True) is None
+
+
+def test_cache_invalidated_when_file_changes(tmp_path, write):
+    src = write(tmp_path / "mod.py", "DOMAINS = ['a']\n")
+    cache = AnalysisCache.load(tmp_path / "cache", "DOMAINS")
+    cache.put_analysis(src, analysis(src, ["a"]))
+
+    src.write_text("DOMAINS = ['a', 'b']\n")
+    assert cache.get_analysis(src) is None
+
+
+def test_cache_separate_per_configuration(tmp_path, write):
+    src = write(tmp_path / "mod.py", "DOMAINS = ['a']\n")
+    cache_dir = tmp_path / "cache"
+    cache = AnalysisCache.load(cache_dir, "DOMAINS")
+    cache.put_analysis(src, analysis(src, ["a"]))
+    cache.save()
+
+    other = AnalysisCache.load(cache_dir, "OTHER")
+    assert other.get_analysis(src) is None
+
+
+def test_cache_prunes_deleted_files(tmp_path, write):
+    keep = write(tmp_path / "keep.py", "x = 1\n")
+    gone = write(tmp_path / "gone.py", "x = 2\n")
+    cache_dir = tmp_path / "cache"
+    cache = AnalysisCache.load(cache_dir, "DOMAINS")
+    cache.put_analysis(keep, analysis(keep, []))
+    cache.put_analysis(gone, analysis(gone, []))
+    cache.save()
+
+    gone.unlink()
+    reloaded = AnalysisCache.load(cache_dir, "DOMAINS")
+    assert reloaded.prune() == 1
+    assert len(reloaded) == 1
+
+
+def test_cache_ignores_corrupt_file(tmp_path):
+    cache = AnalysisCache(tmp_path, "DOMAINS")
+    cache.cache_file.write_text("{not json")
+    reloaded = AnalysisCache.load(tmp_path, "DOMAINS")
+    assert len(reloaded) == 0
@@ -0,0 +1,49 @@
+from splurge_test_namer.cache import AnalysisCache
+from splurge_test_namer.namer import build_proposals
+from splurge_test_namer.parser import analyze_module, analyze_module_cached
+from splurge_test_namer.stats import collect_stats
+
+
+STAR_PROJECT = {
+    "pkg/__init__.py": "",
+    "pkg/a.py": "DOMAINS = ['alpha']\n",
+    "tests/test_x.py": "from pkg import *\n",
+}
+
+
+def names(proposals) -> list[str]:
+    return [p.name for _, p in proposals]
+
+
+def test_star_import_listing_is_recorded(make_repo):
+    repo, tests = make_repo(STAR_PROJECT)
+    analysis = analyze_module(tests / "test_x.py", "DOMAINS", "pkg", repo)
+    assert analysis.imports == {"pkg", "pkg.a"}
+    assert analysis.star_imports == {"pkg": ["a"]}
+
+
+def test_cached_star_import_follows_package_listing(tmp_path, make_repo, write):
+    repo, tests = make_repo(STAR_PROJECT)
+    test_x = tests / "test_x.py"
+    cache = AnalysisCache(tmp_path / "cache", "DOMAINS", root_import="pkg", repo_root=repo)
+    analyze_module_cached(test_x, "DOMAINS", "pkg", repo, cache)
+    with collect_stats() as stats:
+        assert analyze_module_cached(test_x, "DOMAINS", "pkg", repo, cache).star_imports == {"pkg": ["a"]}
+    assert stats.counters["cache_hits"] == 1
+
+    write(repo / "pkg" / "b.py", "DOMAINS = ['beta']\n")
+    with collect_stats() as stats:
+        analysis = analyze_module_cached(test_x, "DOMAINS", "pkg", repo, cache)
+    assert stats.counters["cache_misses"] == 1
+    assert analysis.imports == {"pkg", "pkg.a", "pkg.b"}
+    assert analyze_module_cached(test_x, "DOMAINS", "pkg", repo, cache).star_imports == {"pkg": ["a", "b"]}
+
+
+def test_warm_cache_matches_uncached_run_after_package_grows(tmp_path, make_repo, write):
+    repo, tests = make_repo(STAR_PROJECT)
+    kwargs = {"root_import": "pkg", "repo_root": repo, "jobs": 1}
+    cache = tmp_path / "cache"
+    assert names(build_proposals(tests, "DOMAINS", cache_dir=cache, **kwargs)) == ["test_alpha_0001.py"]
+    write(repo / "pkg" / "b.py", "DOMAINS = ['beta']\n")
+    warm = build_proposals(tests, "DOMAINS", cache_dir=cache, **kwargs)
+    assert names(warm) == names(build_proposals(tests, "DOMAINS", **kwargs)) == ["test_alpha_beta_0001.py"]
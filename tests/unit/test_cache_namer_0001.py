@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import splurge_test_namer.parser as parser_mod
+from splurge_test_namer.namer import build_proposals
+
+
+def test_warm_run_skips_unchanged_files(tmp_path, monkeypatch, write):
+    repo = tmp_path / "repo"
+    write(repo / "pkg" / "__init__.py", "")
+    write(repo / "pkg" / "core.py", "DOMAINS = ['core']\n")
+    tests = repo / "tests"
+    write(tests / "test_a.py", "import pkg.core\n")
+    write(tests / "test_b.py", "DOMAINS = ['local']\n")
+    cache_dir = tmp_path / "cache"
+
+    cold = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, cache_dir=cache_dir)
+
+    parsed: list[Path] = []
+    real_reader = parser_mod.safe_file_reader
+
+    def counting_reader(path):
+        parsed.append(path)
+        return real_reader(path)
+
+    monkeypatch.setattr(parser_mod, "safe_file_reader", counting_reader)
+    warm = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, cache_dir=cache_dir)
+    assert warm == cold
+    assert parsed == []
+
+    # touching one file only re-parses that file
+    write(tests / "test_b.py", "DOMAINS = ['changed']\n")
+    changed = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, cache_dir=cache_dir)
+    assert set(parsed) == {tests / "test_b.py"}
+    assert any(p.name.startswith("test_changed_") for _, p in changed)
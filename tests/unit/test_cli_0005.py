@@ -65,7 +65,7 @@ def test_main_apply_calls_apply_renames(monkeypatch, tmp_path):
 
     called = {}
 
-    def fake_apply(proposals, force=False):
+    def fake_apply(proposals, force=False, **_):
         called["force"] = force
 
     monkeypatch.setattr(cli, "apply_renames", fake_apply)
@@ -65,6 +65,13 @@ def test_invalid_prefix(tmp_path):
     assert code == 2
 
 
+def test_invalid_jobs(tmp_path):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    code = run_main_with_args(["--test-root", str(tests), "--jobs", "0"], cwd=tmp_path)
+    assert code == 2
+
+
 def test_dry_run_happy_path(tmp_path):
     # create a simple test file with DOMAINS sentinel so build_proposals finds something
     repo = tmp_path
@@ -75,3 +82,90 @@ def test_dry_run_happy_path(tmp_path):
     code = run_main_with_args(["--test-root", str(tests)], cwd=repo)
     # main should return 0 for dry-run
     assert code == 0
+
+
+def test_progress_reports_on_stderr(tmp_path, capsys):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_a.py").write_text("DOMAINS = ['core']\n")
+    run_main_with_args(["--test-root", str(tests), "--progress", "--no-cache"], cwd=tmp_path)
+    captured = capsys.readouterr()
+    assert "Analyzed 1 files" in captured.err
+
+
+def test_json_output_to_file(tmp_path):
+    import json
+
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_a.py").write_text("DOMAINS = ['core']\n")
+    out = tmp_path / "out.json"
+    code = run_main_with_args(
+        ["--test-root", str(tests), "--format", "json", "--output", str(out), "--no-cache"], cwd=tmp_path
+    )
+    assert code == 0
+    doc = json.loads(out.read_text())
+    assert doc["count"] == 1
+    assert doc["entries"][0]["sentinels"] == ["core"]
+    assert doc["entries"][0]["prefix"] == "test_core"
+
+
+def test_profile_prints_phase_table(tmp_path, capsys):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_a.py").write_text("DOMAINS = ['core']\n")
+    out = tmp_path / "run.pstats"
+    code = run_main_with_args(["--test-root", str(tests), "--profile-out", str(out), "--no-cache"], cwd=tmp_path)
+    assert code == 0
+    err = capsys.readouterr().err
+    assert "sentinels" in err and "total" in err
+    assert out.exists()
+
+
+def test_stats_json_on_stderr(tmp_path, capsys):
+    import json
+
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_a.py").write_text("DOMAINS = ['core']\n")
+    code = run_main_with_args(["--test-root", str(tests), "--stats", "json", "--no-cache"], cwd=tmp_path)
+    assert code == 0
+    data = json.loads(capsys.readouterr().err)
+    assert data["counters"]["files_read"] == 1
+    assert data["slowest_files"][0]["path"].endswith("test_a.py")
+
+
+def test_incremental_with_no_cache_is_rejected(tmp_path):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    code = run_main_with_args(["--test-root", str(tests), "--incremental", "--no-cache"], cwd=tmp_path)
+    assert code == 2
+
+
+def test_incremental_writes_manifest(tmp_path):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_a.py").write_text("DOMAINS = ['core']\n")
+    assert run_main_with_args(["--test-root", str(tests), "--incremental"], cwd=tmp_path) == 0
+    assert list((tmp_path / ".splurge_test_namer_cache").glob("manifest-*.json"))
+
+
+def test_invalid_numbering_policy(tmp_path):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    code = run_main_with_args(["--test-root", str(tests), "--numbering", "random"], cwd=tmp_path)
+    assert code == 2
+
+
+def test_negative_follow_depth_rejected(tmp_path):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    assert run_main_with_args(["--test-root", str(tests), "--follow-depth", "-1"], cwd=tmp_path) == 2
+
+
+def test_watch_rejects_apply_and_json(tmp_path):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    assert run_main_with_args(["--test-root", str(tests), "--watch", "--apply"], cwd=tmp_path) == 2
+    assert run_main_with_args(["--test-root", str(tests), "--watch", "--format", "json"], cwd=tmp_path) == 2
+    assert run_main_with_args(["--test-root", str(tests), "--watch", "--watch-interval", "0"], cwd=tmp_path) == 2
@@ -38,7 +38,7 @@ def test_build_proposals_with_full_signature(tmp_path):
 
     called = {}
 
-    def fake_build(root, sentinel, root_import=None, repo_root=None, excludes=None, fallback=None, prefix=None):
+    def fake_build(root, sentinel, root_import=None, repo_root=None, excludes=None, fallback=None, prefix=None, **_):
         called["args"] = dict(
             root=root,
             sentinel=sentinel,
@@ -72,7 +72,7 @@ def test_build_proposals_with_excludes_only_signature(tmp_path):
 
     called = {}
 
-    def fake_build(root, sentinel, root_import=None, repo_root=None, excludes=None):
+    def fake_build(root, sentinel, root_import=None, repo_root=None, excludes=None, **_):
         called["args"] = dict(
             root=root, sentinel=sentinel, root_import=root_import, repo_root=repo_root, excludes=excludes
         )
@@ -97,11 +97,11 @@ def test_apply_calls_apply_renames(tmp_path):
 
     captured = {}
 
-    def fake_build(root, sentinel, root_import=None, repo_root=None, excludes=None, fallback=None, prefix=None):
+    def fake_build(root, sentinel, root_import=None, repo_root=None, excludes=None, fallback=None, prefix=None, **_):
         # return a dummy proposal list
         return [(Path("a.py"), Path("b.py"))]
 
-    def fake_apply(proposals, force=False):
+    def fake_apply(proposals, force=False, **_):
         captured["called"] = True
         captured["force"] = force
 
@@ -53,7 +53,7 @@ def test_main_calls_build_and_show_dry_run(monkeypatch, tmp_path):
 
     # Fake build_proposals that accepts the modern signature
     def fake_build_proposals(
-        root, sentinel, root_import=None, repo_root=None, excludes=None, fallback=None, prefix=None
+        root, sentinel, root_import=None, repo_root=None, excludes=None, fallback=None, prefix=None, **_
     ):
         return ["p1", "p2"]
 
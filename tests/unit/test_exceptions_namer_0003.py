@@ -77,13 +77,13 @@ def test_apply_renames_successful_and_propagated_failure(tmp_path: Path, monkeyp
     dst2 = tmp_path / "dest2" / "new2.txt"
     src2.write_text("x")
 
-    def fake_renamer(a, b, overwrite=False):
+    def fake_execute(steps, ensured_dirs=None, **_):
         raise FileRenameError("boom")
 
-    # monkeypatch the safe_file_renamer used by namer.apply_renames
+    # monkeypatch the plan executor used by namer.apply_renames
     import splurge_test_namer.namer as namer_mod
 
-    monkeypatch.setattr(namer_mod, "safe_file_renamer", fake_renamer)
+    monkeypatch.setattr(namer_mod, "execute_rename_plan", fake_execute)
 
     with pytest.raises(SplurgeTestNamerError):
         apply_renames([(src2, dst2)], force=False)
@@ -8,13 +8,13 @@ def test_build_proposals_rglob_error(tmp_path, monkeypatch):
     root = tmp_path / "tests"
     root.mkdir()
 
-    # monkeypatch safe_file_rglob to raise
-    # monkeypatch the symbol used by namer (it imports safe_file_rglob into its module)
+    # monkeypatch iter_test_files to raise
+    # monkeypatch the symbol used by namer (it imports iter_test_files into its module)
     import splurge_test_namer.namer as nm
 
     from splurge_test_namer.exceptions import FileGlobError
 
-    monkeypatch.setattr(nm, "safe_file_rglob", lambda root, pattern: (_ for _ in ()).throw(FileGlobError("boom")))
+    monkeypatch.setattr(nm, "iter_test_files", lambda root, excludes=None: (_ for _ in ()).throw(FileGlobError("boom")))
 
     with pytest.raises(SplurgeTestNamerError):
         build_proposals(root, "DOMAINS")
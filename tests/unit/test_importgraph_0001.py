@@ -0,0 +1,115 @@
+import os
+
+import pytest
+
+from splurge_test_namer.exceptions import SplurgeTestNamerError
+from splurge_test_namer.importgraph import ImportGraph
+from splurge_test_namer.namer import build_proposals
+from splurge_test_namer.parser import aggregate_sentinels_for_test
+from splurge_test_namer.stats import collect_stats
+
+
+CHAIN = {
+    "pkg/__init__.py": "",
+    "pkg/api.py": "DOMAINS = ['api']\nimport pkg.core\n",
+    "pkg/core.py": "DOMAINS = ['core']\nfrom pkg import util\n",
+    "pkg/util.py": "DOMAINS = ['util']\n",
+    "tests/test_a.py": "import pkg.api\n",
+    "tests/test_b.py": "import pkg.core\n",
+}
+
+
+def names(proposals) -> list[str]:
+    return sorted(p.name for _, p in proposals)
+
+
+def test_follow_depth_controls_transitive_sentinels(make_repo):
+    repo, tests = make_repo(CHAIN)
+    test_a = tests / "test_a.py"
+    assert aggregate_sentinels_for_test(test_a, "pkg", repo, "DOMAINS") == ["api"]
+    assert aggregate_sentinels_for_test(test_a, "pkg", repo, "DOMAINS", follow_depth=2) == ["api", "core"]
+    assert aggregate_sentinels_for_test(test_a, "pkg", repo, "DOMAINS", follow_depth=0) == ["api", "core", "util"]
+
+
+def test_negative_follow_depth_rejected(make_repo):
+    repo, tests = make_repo(CHAIN)
+    with pytest.raises(SplurgeTestNamerError):
+        aggregate_sentinels_for_test(tests / "test_a.py", "pkg", repo, follow_depth=-1)
+    with pytest.raises(SplurgeTestNamerError):
+        build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, follow_depth=-1)
+
+
+def test_import_cycle_closes_once(tmp_path, write):
+    repo = tmp_path / "repo"
+    write(repo / "pkg" / "__init__.py", "")
+    write(repo / "pkg" / "a.py", "DOMAINS = ['a']\nimport pkg.b\n")
+    write(repo / "pkg" / "b.py", "DOMAINS = ['b']\nimport pkg.a\nimport pkg.c\n")
+    write(repo / "pkg" / "c.py", "DOMAINS = ['c']\n")
+    graph = ImportGraph(repo, "pkg")
+    with collect_stats() as stats:
+        assert graph.closure_sentinels([repo / "pkg" / "a.py"]) == {"a", "b", "c"}
+        assert graph.closure_sentinels([repo / "pkg" / "b.py"]) == {"a", "b", "c"}
+    # {a, b} is one component, {c} another
+    assert stats.counters["graph_components"] == 2
+    assert stats.counters["graph_nodes"] == 3
+    assert graph.closure_sentinels([repo / "pkg" / "a.py"], depth=1) == {"a"}
+    assert graph.closure_sentinels([repo / "pkg" / "a.py"], depth=2) == {"a", "b"}
+
+
+def test_each_module_parsed_once_per_run(make_repo, write):
+    repo, tests = make_repo(CHAIN)
+    for i in range(5):
+        write(tests / f"test_x{i}.py", "import pkg.api\nimport pkg.core\n")
+    with collect_stats() as stats:
+        proposals = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1, follow_depth=0)
+    assert names(proposals) == [
+        "test_api_core_util_0001.py",
+        "test_api_core_util_0002.py",
+        "test_api_core_util_0003.py",
+        "test_api_core_util_0004.py",
+        "test_api_core_util_0005.py",
+        "test_api_core_util_0006.py",
+        "test_core_util_0001.py",
+    ]
+    # 7 test files plus api, core and util; the empty pkg/__init__ is prefiltered
+    assert stats.counters["graph_nodes"] == 4
+    assert stats.counters["parses"] == 10
+    assert stats.counters["prefilter_skips"] == 1
+
+
+def test_parallel_matches_serial(make_repo, write):
+    repo, tests = make_repo(CHAIN)
+    for i in range(4):
+        write(tests / f"test_y{i}.py", "from pkg import core\n")
+    serial = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1, follow_depth=2)
+    parallel = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=2, follow_depth=2)
+    assert parallel == serial
+
+
+def test_incremental_tracks_transitive_dependencies(tmp_path, make_repo):
+    repo, tests = make_repo(CHAIN)
+    cache = tmp_path / "cache"
+
+    def run():
+        with collect_stats() as stats:
+            proposals = build_proposals(
+                tests,
+                "DOMAINS",
+                root_import="pkg",
+                repo_root=repo,
+                cache_dir=cache,
+                jobs=1,
+                incremental=True,
+                follow_depth=0,
+            )
+        return proposals, stats.counters
+
+    first, _ = run()
+    assert names(first) == ["test_api_core_util_0001.py", "test_core_util_0001.py"]
+    util = repo / "pkg" / "util.py"
+    st = util.stat()
+    util.write_text("DOMAINS = ['helpers']\n")
+    os.utime(util, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second, counters = run()
+    assert counters["manifest_misses"] == 2
+    assert names(second) == ["test_api_core_helpers_0001.py", "test_core_helpers_0001.py"]
@@ -0,0 +1,156 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from splurge_test_namer.exceptions import SplurgeTestNamerError
+from splurge_test_namer.namer import apply_renames, build_proposals
+from splurge_test_namer.stats import collect_stats
+
+
+@pytest.fixture
+def project(sample_project, write):
+    repo, tests = sample_project
+    write(tests / "test_d.py", "DOMAINS = ['local']\n")
+    return repo, tests
+
+
+def run(tests: Path, repo: Path, cache: Path, **kwargs):
+    with collect_stats() as stats:
+        proposals = build_proposals(
+            tests, "DOMAINS", root_import="pkg", repo_root=repo, cache_dir=cache, jobs=1, **kwargs
+        )
+    return proposals, stats.counters
+
+
+def full(tests: Path, repo: Path):
+    return build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1)
+
+
+def test_incremental_reuses_unchanged_files(tmp_path, project):
+    repo, tests = project
+    cache = tmp_path / "cache"
+    first, counters = run(tests, repo, cache, incremental=True)
+    assert first == full(tests, repo)
+    assert counters["manifest_misses"] == 4
+    second, counters = run(tests, repo, cache, incremental=True)
+    assert second == first
+    assert counters["manifest_hits"] == 4
+    assert counters["parses"] == 0
+
+
+def test_incremental_reanalyzes_dependents_of_changed_module(tmp_path, project, bump):
+    repo, tests = project
+    cache = tmp_path / "cache"
+    run(tests, repo, cache, incremental=True)
+    bump(repo / "pkg" / "core.py", "DOMAINS = ['engine']\n")
+    proposals, counters = run(tests, repo, cache, incremental=True)
+    assert proposals == full(tests, repo)
+    assert {p.name for _, p in proposals} >= {"test_engine_0001.py", "test_engine_0002.py"}
+    assert counters["manifest_misses"] == 2
+    assert counters["manifest_hits"] == 2
+
+
+def test_incremental_handles_added_and_deleted_files(tmp_path, project, write):
+    repo, tests = project
+    cache = tmp_path / "cache"
+    run(tests, repo, cache, incremental=True)
+    write(tests / "test_aa.py", "import pkg.core\n")
+    (tests / "test_c.py").unlink()
+    proposals, counters = run(tests, repo, cache, incremental=True)
+    assert proposals == full(tests, repo)
+    assert counters["manifest_misses"] == 1
+    names = {o.name: p.name for o, p in proposals}
+    assert names["test_aa.py"] == "test_core_0002.py"
+    assert names["test_b.py"] == "test_core_0003.py"
+
+
+def test_incremental_always_rechecks_unresolved_imports(tmp_path, project, write):
+    repo, tests = project
+    write(tests / "test_e.py", "import pkg.later\n")
+    cache = tmp_path / "cache"
+    run(tests, repo, cache, incremental=True)
+    write(repo / "pkg" / "later.py", "DOMAINS = ['later']\n")
+    proposals, counters = run(tests, repo, cache, incremental=True)
+    assert proposals == full(tests, repo)
+    assert counters["manifest_misses"] == 1
+    assert dict((o.name, p.name) for o, p in proposals)["test_e.py"] == "test_later_0001.py"
+
+
+def test_incremental_follows_applied_renames(tmp_path, capsys, project):
+    repo, tests = project
+    cache = tmp_path / "cache"
+    proposals, _ = run(tests, repo, cache, incremental=True)
+    apply_renames(proposals)
+    capsys.readouterr()
+    after, counters = run(tests, repo, cache, incremental=True)
+    assert counters["manifest_hits"] == 4
+    assert counters["parses"] == 0
+    assert after == full(tests, repo)
+    assert all(o == p for o, p in after)
+
+
+def test_incremental_config_change_uses_separate_manifest(tmp_path, project):
+    repo, tests = project
+    cache = tmp_path / "cache"
+    run(tests, repo, cache, incremental=True)
+    proposals, counters = run(tests, repo, cache, incremental=True, prefix="spec")
+    assert counters["manifest_misses"] == 4
+    assert all(p.name.startswith("spec_") for _, p in proposals)
+
+
+def test_incremental_requires_cache_dir(project):
+    repo, tests = project
+    with pytest.raises(SplurgeTestNamerError):
+        build_proposals(tests, "DOMAINS", incremental=True)
+
+
+def test_incremental_parallel_matches_serial(tmp_path, project, bump):
+    repo, tests = project
+    cache = tmp_path / "cache"
+    proposals = build_proposals(
+        tests, "DOMAINS", root_import="pkg", repo_root=repo, cache_dir=cache, jobs=2, incremental=True
+    )
+    assert proposals == full(tests, repo)
+    bump(repo / "pkg" / "io.py", "DOMAINS = ['net']\n")
+    second, counters = run(tests, repo, cache, incremental=True)
+    assert second == full(tests, repo)
+    assert counters["manifest_misses"] == 1
+
+
+def add_module(pkg_dir: Path, name: str, content: str) -> None:
+    st = pkg_dir.stat()
+    (pkg_dir / name).write_text(content)
+    os.utime(pkg_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.parametrize("follow_depth", [1, 0])
+def test_incremental_notices_modules_added_to_star_imported_package(tmp_path, follow_depth, write):
+    repo = tmp_path / "repo"
+    write(repo / "pkg" / "__init__.py", "")
+    write(repo / "pkg" / "a.py", "DOMAINS = ['alpha']\n")
+    write(repo / "pkg" / "b.py", "DOMAINS = ['beta']\n")
+    tests = repo / "tests"
+    write(tests / "test_x.py", "from pkg import *\n")
+    cache = tmp_path / "cache"
+    first, _ = run(tests, repo, cache, incremental=True, follow_depth=follow_depth)
+    assert [p.name for _, p in first] == ["test_alpha_beta_0001.py"]
+    add_module(repo / "pkg", "c.py", "DOMAINS = ['gamma']\n")
+    proposals, counters = run(tests, repo, cache, incremental=True, follow_depth=follow_depth)
+    assert [p.name for _, p in proposals] == ["test_alpha_beta_gamma_0001.py"]
+    assert counters["manifest_misses"] == 1
+
+
+def test_incremental_notices_star_imports_of_followed_modules(tmp_path, write):
+    repo = tmp_path / "repo"
+    write(repo / "pkg" / "__init__.py", "")
+    write(repo / "pkg" / "hub.py", "from pkg.sub import *\n")
+    write(repo / "pkg" / "sub" / "__init__.py", "")
+    write(repo / "pkg" / "sub" / "a.py", "DOMAINS = ['alpha']\n")
+    tests = repo / "tests"
+    write(tests / "test_x.py", "import pkg.hub\n")
+    cache = tmp_path / "cache"
+    run(tests, repo, cache, incremental=True, follow_depth=0)
+    add_module(repo / "pkg" / "sub", "b.py", "DOMAINS = ['beta']\n")
+    proposals, _ = run(tests, repo, cache, incremental=True, follow_depth=0)
+    assert [p.name for _, p in proposals] == ["test_alpha_beta_0001.py"]
@@ -0,0 +1,38 @@
+import pytest
+
+from splurge_test_namer.exceptions import SplurgeTestNamerError
+from splurge_test_namer.namer import build_proposals
+
+
+def tree_files() -> dict[str, str]:
+    files = {"pkg/__init__.py": ""}
+    for name in ("core", "api", "models"):
+        files[f"pkg/{name}.py"] = f"DOMAINS = [{name!r}]\n"
+    for i in range(24):
+        mod = ("core", "api", "models", "missing")[i % 4]
+        body = f"from pkg.{mod} import Thing\n" if i % 3 else f"DOMAINS = ['local{i % 2}']\n"
+        files[f"tests/sub{i % 3}/test_case_{i:02d}.py"] = body
+    return files
+
+
+@pytest.mark.parametrize("jobs", [2, 3])
+def test_parallel_scan_matches_serial(jobs, make_repo):
+    repo, tests = make_repo(tree_files())
+    serial = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1)
+    parallel = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=jobs)
+    assert parallel == serial
+
+
+def test_parallel_scan_populates_cache(tmp_path, make_repo):
+    repo, tests = make_repo(tree_files())
+    cache_dir = tmp_path / "cache"
+    first = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, cache_dir=cache_dir, jobs=2)
+    second = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, cache_dir=cache_dir, jobs=1)
+    assert first == second
+    assert any(cache_dir.glob("analysis-*.json"))
+
+
+def test_invalid_jobs_raises(make_repo):
+    _, tests = make_repo(tree_files())
+    with pytest.raises(SplurgeTestNamerError):
+        build_proposals(tests, "DOMAINS", jobs=0)
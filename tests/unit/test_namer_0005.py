@@ -0,0 +1,48 @@
+import pytest
+
+from splurge_test_namer.exceptions import SplurgeTestNamerError
+from splurge_test_namer.namer import FileProposal, build_proposals, iter_proposals, number_proposals
+
+
+def test_iter_proposals_streams_in_path_order(tmp_path, write):
+    write(tmp_path / "b" / "test_b.py", "DOMAINS = ['beta']\n")
+    write(tmp_path / "a" / "test_a.py", "DOMAINS = ['alpha']\n")
+    write(tmp_path / "test_c.py", "x = 1\n")
+    it = iter_proposals(tmp_path, "DOMAINS", jobs=1)
+    first = next(it)
+    assert first == FileProposal(tmp_path / "a" / "test_a.py", ["alpha"], "test_alpha")
+    rest = list(it)
+    assert [r.prefix for r in rest] == ["test_beta", "test_misc"]
+
+
+def test_build_proposals_equals_numbered_stream(tmp_path, write):
+    for i in range(5):
+        write(tmp_path / f"test_{i}.py", f"DOMAINS = ['d{i % 2}']\n")
+    seen: list[FileProposal] = []
+    proposals = build_proposals(tmp_path, "DOMAINS", jobs=1, on_result=seen.append)
+    assert len(seen) == 5
+    assert proposals == number_proposals((r.prefix, r.path) for r in iter_proposals(tmp_path, "DOMAINS", jobs=1))
+    assert [p[1].name for p in proposals] == [
+        "test_d0_0001.py",
+        "test_d0_0002.py",
+        "test_d0_0003.py",
+        "test_d1_0001.py",
+        "test_d1_0002.py",
+    ]
+
+
+def test_number_proposals_validates_names(tmp_path):
+    with pytest.raises(SplurgeTestNamerError):
+        number_proposals([("test_" + "x" * 240, tmp_path / "test_x.py")])
+
+
+def test_iter_proposals_saves_cache_when_closed(tmp_path, write):
+    tests = tmp_path / "tests"
+    for i in range(3):
+        write(tests / f"test_{i}.py", "DOMAINS = ['core']\n")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    it = iter_proposals(tests, "DOMAINS", cache_dir=cache_dir, jobs=1)
+    next(it)
+    it.close()
+    assert list(cache_dir.glob("analysis-*.json"))
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pytest
+
+from splurge_test_namer.exceptions import SplurgeTestNamerError
+from splurge_test_namer.namer import apply_renames, build_proposals, number_proposals
+
+
+def names(proposals):
+    return {o.name: p.name for o, p in proposals}
+
+
+def test_stable_keeps_existing_numbers_and_appends_new_files(tmp_path):
+    pairs = [
+        ("test_core", tmp_path / "test_core_0001.py"),
+        ("test_core", tmp_path / "test_core_0003.py"),
+        ("test_core", tmp_path / "test_aaa.py"),
+        ("test_core", tmp_path / "test_zzz.py"),
+    ]
+    result = names(number_proposals(pairs, numbering="stable"))
+    assert result == {
+        "test_core_0001.py": "test_core_0001.py",
+        "test_core_0003.py": "test_core_0003.py",
+        "test_aaa.py": "test_core_0004.py",
+        "test_zzz.py": "test_core_0005.py",
+    }
+    # the sequential policy renumbers the whole group in path order
+    assert names(number_proposals(pairs))["test_core_0001.py"] == "test_core_0002.py"
+
+
+def test_stable_renames_files_whose_prefix_changed(tmp_path):
+    pairs = [
+        ("test_io", tmp_path / "test_core_0001.py"),
+        ("test_core", tmp_path / "test_core_0002.py"),
+    ]
+    assert names(number_proposals(pairs, numbering="stable")) == {
+        "test_core_0001.py": "test_io_0001.py",
+        "test_core_0002.py": "test_core_0002.py",
+    }
+
+
+def test_stable_resolves_duplicate_numbers_across_directories(tmp_path):
+    a = tmp_path / "a" / "test_core_0001.py"
+    b = tmp_path / "b" / "test_core_0001.py"
+    result = number_proposals([("test_core", b), ("test_core", a)], numbering="stable")
+    assert result == [(a, a), (b, b.with_name("test_core_0002.py"))]
+
+
+def test_stable_numbering_is_a_fixed_point_after_apply(tmp_path, capsys):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    for name in ("test_b.py", "test_d.py"):
+        (tests / name).write_text("DOMAINS = ['core']\n")
+    apply_renames(build_proposals(tests, "DOMAINS", numbering="stable"))
+    (tests / "test_a.py").write_text("DOMAINS = ['core']\n")
+    proposals = build_proposals(tests, "DOMAINS", numbering="stable")
+    changed = [(o.name, p.name) for o, p in proposals if o != p]
+    assert changed == [("test_a.py", "test_core_0003.py")]
+    capsys.readouterr()
+
+
+def test_unknown_numbering_policy(tmp_path):
+    with pytest.raises(SplurgeTestNamerError):
+        number_proposals([("test_x", Path("test_x.py"))], numbering="random")
+    with pytest.raises(SplurgeTestNamerError):
+        build_proposals(tmp_path, "DOMAINS", numbering="random")
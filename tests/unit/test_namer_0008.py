@@ -0,0 +1,24 @@
+import pytest
+
+from splurge_test_namer.exceptions import SplurgeTestNamerError
+from splurge_test_namer.namer import create_scan_context, read_file_domains
+
+
+def test_scan_context_reads_domains_and_records_dependencies(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "pkg" / "__init__.py").write_text("")
+    (repo / "pkg" / "core.py").write_text("DOMAINS = ['core']\n")
+    test = repo / "tests" / "test_a.py"
+    test.parent.mkdir()
+    test.write_text("import pkg.core\n")
+
+    ctx = create_scan_context("DOMAINS", root_import="pkg", repo_root=repo, dependencies={})
+    assert read_file_domains(test, ctx) == ["core"]
+    assert ctx.deps is not None and repo / "pkg" / "core.py" in (ctx.deps[test] or [])
+
+
+@pytest.mark.parametrize("kwargs", [{"read_mode": "partial"}, {"follow_depth": -1}, {"imports": "some"}])
+def test_scan_context_rejects_unsupported_options(kwargs):
+    with pytest.raises(SplurgeTestNamerError):
+        create_scan_context("DOMAINS", **kwargs)
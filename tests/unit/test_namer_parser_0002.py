@@ -0,0 +1,38 @@
+from collections import Counter
+
+import pytest
+
+import splurge_test_namer.parser as parser_mod
+from splurge_test_namer.exceptions import FileReadError, SentinelReadError
+from splurge_test_namer.namer import build_proposals
+
+
+def test_each_test_file_read_once_during_aggregation(tmp_path, monkeypatch, write):
+    repo = tmp_path / "repo"
+    write(repo / "pkg" / "__init__.py")
+    write(repo / "pkg" / "empty.py", "X = 1\n")
+    tests = repo / "tests"
+    # aggregation yields nothing, so the in-file sentinel fallback is used
+    write(tests / "test_a.py", "import pkg.empty\nDOMAINS = ['local']\n")
+    write(tests / "test_b.py", "import pkg.empty\ndef broken(:\n")
+
+    reads: Counter = Counter()
+    real_reader = parser_mod.safe_file_reader
+
+    def counting_reader(path):
+        reads[path] += 1
+        return real_reader(path)
+
+    monkeypatch.setattr(parser_mod, "safe_file_reader", counting_reader)
+    proposals = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1)
+    assert reads[tests / "test_a.py"] == 1
+    assert reads[tests / "test_b.py"] == 1
+    assert [p.name for _, p in proposals] == ["test_local_0001.py", "test_misc_0001.py"]
+
+
+def test_unreadable_test_file_raises_sentinel_error(tmp_path, monkeypatch, write):
+    tests = tmp_path / "tests"
+    write(tests / "test_a.py", "DOMAINS = ['a']\n")
+    monkeypatch.setattr(parser_mod, "safe_file_reader", lambda path: (_ for _ in ()).throw(FileReadError("boom")))
+    with pytest.raises(SentinelReadError):
+        build_proposals(tests, "DOMAINS", jobs=1)
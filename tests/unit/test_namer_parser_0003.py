@@ -0,0 +1,51 @@
+from collections import Counter
+
+import pytest
+
+import splurge_test_namer.parser as parser_mod
+from splurge_test_namer.exceptions import SplurgeTestNamerError
+from splurge_test_namer.namer import build_proposals
+from splurge_test_namer.parser import ModuleSentinelMemo, aggregate_imported_sentinels
+
+
+@pytest.fixture
+def counted_reads(monkeypatch):
+    reads: Counter = Counter()
+    real_reader = parser_mod.safe_file_reader
+
+    def counting_reader(path):
+        reads[path] += 1
+        return real_reader(path)
+
+    monkeypatch.setattr(parser_mod, "safe_file_reader", counting_reader)
+    return reads
+
+
+SHARED_MODEL = {
+    "pkg/__init__.py": "",
+    "pkg/models.py": "DOMAINS = ['models']\n",
+    **{f"tests/test_m{i}.py": "from pkg.models import Model\nimport pkg.models\n" for i in range(10)},
+}
+
+
+def test_shared_module_parsed_once_per_run(counted_reads, make_repo):
+    repo, tests = make_repo(SHARED_MODEL)
+    proposals = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1)
+    assert len(proposals) == 10
+    assert counted_reads[repo / "pkg" / "models.py"] == 1
+
+
+def test_memo_reused_across_calls(counted_reads, make_repo):
+    repo, tests = make_repo(SHARED_MODEL)
+    memo = ModuleSentinelMemo("DOMAINS")
+    first = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1, memo=memo)
+    second = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1, memo=memo)
+    assert first == second
+    assert counted_reads[repo / "pkg" / "models.py"] == 1
+    assert len(memo) > 0
+
+
+def test_memo_for_other_sentinel_rejected(make_repo):
+    repo, _ = make_repo(SHARED_MODEL)
+    with pytest.raises(SplurgeTestNamerError):
+        aggregate_imported_sentinels({"pkg.models"}, repo, "DOMAINS", memo=ModuleSentinelMemo("OTHER"))
@@ -0,0 +1,73 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from splurge_test_namer.exceptions import SplurgeTestNamerError
+from splurge_test_namer.namer import FileProposal, apply_renames, show_dry_run
+from splurge_test_namer.output import ProposalWriter, group_prefix
+
+PROPOSALS = [
+    (Path("tests/test_a.py"), Path("tests/test_core_0001.py")),
+    (Path("tests/test_b.py"), Path("tests/test_misc_0001.py")),
+]
+
+
+def test_text_format_matches_dry_run_output(capsys):
+    show_dry_run(PROPOSALS)
+    expected = capsys.readouterr().out
+    buf = io.StringIO()
+    show_dry_run(PROPOSALS, writer=ProposalWriter(buf))
+    assert buf.getvalue() == expected
+    assert expected.splitlines() == [
+        "DRY RUN - original | proposed",
+        f"{PROPOSALS[0][0]} | test_core_0001.py",
+        f"{PROPOSALS[1][0]} | test_misc_0001.py",
+    ]
+
+
+def test_ndjson_includes_prefix_and_sentinels():
+    meta = {PROPOSALS[0][0]: FileProposal(PROPOSALS[0][0], ["core"], "test_core")}
+    buf = io.StringIO()
+    show_dry_run(PROPOSALS, writer=ProposalWriter(buf, "ndjson", metadata=meta))
+    lines = [json.loads(line) for line in buf.getvalue().splitlines()]
+    assert lines[0] == {
+        "event": "proposal",
+        "original": str(PROPOSALS[0][0]),
+        "proposed": str(PROPOSALS[0][1]),
+        "prefix": "test_core",
+        "sentinels": ["core"],
+    }
+    assert lines[1]["sentinels"] is None
+    assert lines[2] == {"event": "summary", "mode": "dry-run", "count": 2}
+
+
+@pytest.mark.parametrize("n", [0, 1, 3000])
+def test_json_document_is_valid(n):
+    buf = io.StringIO()
+    writer = ProposalWriter(buf, "json")
+    writer.begin("dry-run")
+    for i in range(n):
+        writer.proposal(Path(f"test_{i}.py"), Path(f"test_x_{i + 1:04d}.py"))
+    writer.end()
+    doc = json.loads(buf.getvalue())
+    assert doc["mode"] == "dry-run"
+    assert doc["count"] == n == len(doc["entries"])
+
+
+def test_apply_renames_reports_through_writer(tmp_path):
+    src = tmp_path / "test_a.py"
+    src.write_text("x")
+    dst = tmp_path / "test_core_0001.py"
+    buf = io.StringIO()
+    apply_renames([(src, dst)], writer=ProposalWriter(buf, "ndjson"))
+    first = json.loads(buf.getvalue().splitlines()[0])
+    assert first["event"] == "rename" and first["proposed"] == str(dst)
+    assert dst.exists()
+
+
+def test_group_prefix_and_invalid_format():
+    assert group_prefix(Path("test_core_api_0012.py")) == "test_core_api"
+    with pytest.raises(SplurgeTestNamerError):
+        ProposalWriter(io.StringIO(), "xml")
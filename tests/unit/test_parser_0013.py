@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import splurge_test_namer.parser as parser_mod
+from splurge_test_namer.exceptions import FileReadError
+from splurge_test_namer.parser import (
+    PARSE_OK,
+    PARSE_SYNTAX_ERROR,
+    PARSE_UNREADABLE,
+    analyze_module,
+    find_imports_in_file,
+    read_sentinels_from_file,
+)
+
+
+SOURCE = """
+import importlib
+import pkg.core
+from pkg.api import Client
+
+DOMAINS = ['alpha', 'beta']
+
+mod = importlib.import_module('pkg.dynamic')
+"""
+
+
+def test_analyze_module_matches_individual_helpers(tmp_path, write):
+    p = write(tmp_path / "test_mod.py", SOURCE)
+    result = analyze_module(p, "DOMAINS", "pkg")
+    assert result.status == PARSE_OK
+    assert result.sentinels == read_sentinels_from_file(p, "DOMAINS")
+    assert result.imports == find_imports_in_file(p, "pkg")
+    assert result.static_imports == {"pkg.core", "pkg.api", "pkg.api.Client"}
+    assert result.dynamic_imports == {"pkg.dynamic"}
+
+
+def test_analyze_module_reads_file_once(tmp_path, monkeypatch, write):
+    p = write(tmp_path / "test_mod.py", SOURCE)
+    reads: list[Path] = []
+    real_reader = parser_mod.safe_file_reader
+
+    def counting_reader(path):
+        reads.append(path)
+        return real_reader(path)
+
+    monkeypatch.setattr(parser_mod, "safe_file_reader", counting_reader)
+    analyze_module(p, "DOMAINS", "pkg")
+    assert reads == [p]
+
+
+def test_analyze_module_without_root_import_skips_imports(tmp_path, write):
+    p = write(tmp_path / "test_mod.py", SOURCE)
+    result = analyze_module(p, "DOMAINS")
+    assert result.sentinels == ["alpha", "beta"]
+    assert not result.imports_scanned
+    assert result.imports == set()
+
+
+def test_analyze_module_syntax_error_uses_source_fallback(tmp_path, write):
+    p = write(tmp_path / "test_bad.py", "import pkg.core\nDOMAINS = ['x']\ndef broken(:\n")
+    result = analyze_module(p, "DOMAINS", "pkg")
+    assert result.status == PARSE_SYNTAX_ERROR
+    assert result.sentinels == ["x"]
+    assert result.imports == set()
+
+
+def test_analyze_module_unreadable_reports_status(tmp_path, monkeypatch, write):
+    p = write(tmp_path / "test_mod.py", SOURCE)
+    monkeypatch.setattr(parser_mod, "safe_file_reader", lambda path: (_ for _ in ()).throw(FileReadError("boom")))
+    result = analyze_module(p, "DOMAINS", "pkg")
+    assert result.status == PARSE_UNREADABLE
+    assert result.sentinels == []
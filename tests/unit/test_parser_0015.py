@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+from splurge_test_namer.parser import analyze_module, read_sentinels_from_file
+
+
+def write_module(tmp_path: Path, src: str) -> Path:
+    p = tmp_path / "mod.py"
+    p.write_text(src)
+    return p
+
+
+@pytest.mark.parametrize(
+    "src, expected",
+    [
+        # candidate at column 0 inside a docstring is not a real assignment
+        ('"""\nDOMAINS = [\'doc\']\n"""\nDOMAINS = [\'real\']\n', ["real"]),
+        # candidate inside an open bracket expression
+        ("x = [\nDOMAINS\n]\nDOMAINS = ('a', 'b')\n", ["a", "b"]),
+        # an earlier semicolon-separated assignment wins, as with the full AST
+        ("x = 1; DOMAINS = ['first']\nDOMAINS = ['second']\n", ["first"]),
+        # an earlier non-list assignment makes the result empty
+        ("DOMAINS = make()\nDOMAINS = ['late']\n", []),
+        # annotated assignment with brackets and comments in the value
+        ("DOMAINS: list[str] = [  # note ]\n    'a',  # ]\n    \"b]\",\n]\n", ["a", "b]"]),
+        # trailing expression continues on the next line
+        ("DOMAINS = ['a'] + [\n    'b']\n", []),
+        # no column-0 candidate but the name appears in a nested block
+        ("if True:\n    DOMAINS = ['nested']\n", ["nested"]),
+    ],
+)
+def test_fast_path_matches_full_parse_semantics(tmp_path, src, expected):
+    p = write_module(tmp_path, src)
+    assert read_sentinels_from_file(p, "DOMAINS") == expected
+    assert analyze_module(p, "DOMAINS").sentinels == expected
+
+
+def test_fast_path_tolerates_syntax_error_after_sentinel(tmp_path):
+    p = write_module(tmp_path, "DOMAINS = ('a', 'b')\ndef broken(:\n")
+    assert read_sentinels_from_file(p, "DOMAINS") == ["a", "b"]
@@ -0,0 +1,129 @@
+import re
+
+import pytest
+
+from splurge_test_namer.cache import AnalysisCache
+from splurge_test_namer.constants import IMPORTS_STATIC
+from splurge_test_namer.exceptions import FileReadError, SplurgeTestNamerError
+from splurge_test_namer.namer import build_proposals
+from splurge_test_namer.parser import PARSE_OK, PARSE_UNREADABLE, ImportPolicy, analyze_module
+from splurge_test_namer.stats import collect_stats
+from splurge_test_namer.util_helpers import safe_header_reader, safe_tail_reader
+
+STOP = re.compile(rb"^def ", re.M)
+
+# header mode only applies when imports are not scanned for dynamic calls
+STATIC = ImportPolicy(IMPORTS_STATIC)
+
+
+def big_body(n: int = 400) -> str:
+    return "".join(f"def test_{i}():\n    assert {list(range(20))}\n\n" for i in range(n))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_header_reader_stops_at_first_matching_line(tmp_path, chunk_size):
+    p = tmp_path / "m.py"
+    p.write_bytes(b"import os\r\nX = 'def '\r\n\r\ndef f():\r\n    pass\r\ndef g(): pass\r\n")
+    text, offset = safe_header_reader(p, STOP, chunk_size=chunk_size)
+    assert text == "import os\nX = 'def '\n\n"
+    assert offset == len(b"import os\r\nX = 'def '\r\n\r\n")
+    assert safe_tail_reader(p, offset) == "def f():\n    pass\ndef g(): pass\n"
+
+
+def test_header_reader_returns_whole_file_without_match(tmp_path, write):
+    p = write(tmp_path / "m.py", "import os\nX = 1")
+    assert safe_header_reader(p, STOP, chunk_size=4) == ("import os\nX = 1", -1)
+    with pytest.raises(FileReadError):
+        safe_header_reader(tmp_path / "missing.py", STOP)
+
+
+def test_header_mode_reads_only_the_header(tmp_path, write):
+    p = write(tmp_path / "test_big.py", "import pkg.core\nDOMAINS = ['core']\n\n" + big_body(2000))
+    with collect_stats() as stats:
+        analysis = analyze_module(p, "DOMAINS", "pkg", tmp_path, header=True, policy=STATIC)
+    assert analysis.status == PARSE_OK
+    assert analysis.sentinels == ["core"]
+    assert analysis.imports == {"pkg.core"}
+    assert stats.counters["header_reads"] == 1
+    assert stats.counters["bytes_read"] < p.stat().st_size // 4
+
+
+def test_header_mode_falls_back_when_sentinel_assigned_later(tmp_path, write):
+    p = write(tmp_path / "test_late.py", "import pkg.core\n\n" + big_body(5) + "DOMAINS = ['late']\n")
+    with collect_stats() as stats:
+        analysis = analyze_module(p, "DOMAINS", "pkg", tmp_path, header=True)
+    assert analysis == analyze_module(p, "DOMAINS", "pkg", tmp_path)
+    assert analysis.sentinels == ["late"]
+    assert stats.counters["header_fallbacks"] == 1
+
+
+def test_header_mode_without_sentinel_reads_but_does_not_parse_rest(tmp_path, write):
+    p = write(tmp_path / "test_plain.py", "import pkg.core\n\n" + big_body())
+    with collect_stats() as stats:
+        analysis = analyze_module(p, "DOMAINS", "pkg", tmp_path, header=True, policy=STATIC)
+    assert analysis.sentinels == []
+    assert analysis.imports == {"pkg.core"}
+    assert stats.counters["header_reads"] == 1
+    assert stats.counters["bytes_read"] >= p.stat().st_size
+    assert stats.counters["parses"] == 1
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        "import importlib\nimport pkg.core\n",
+        # a column-0 'def' inside a string is not the end of the header
+        'DOC = """\ndef not_code():\n"""\nimport pkg.core\n',
+    ],
+)
+def test_header_mode_falls_back_to_full_analysis(tmp_path, head, write):
+    body = "def test_x():\n    importlib.import_module('pkg.io')\n"
+    p = write(tmp_path / "test_x.py", head + "DOMAINS = ['x']\n" + body)
+    with collect_stats() as stats:
+        analysis = analyze_module(p, "DOMAINS", "pkg", tmp_path, header=True)
+    assert analysis == analyze_module(p, "DOMAINS", "pkg", tmp_path)
+    assert stats.counters["header_fallbacks"] == 1
+
+
+def test_header_mode_reads_whole_module_when_dynamic_imports_are_scanned(tmp_path, write):
+    p = write(tmp_path / "test_x.py", "DOMAINS = ['x']\n\ndef test_x():\n    __import__('pkg.io')\n")
+    with collect_stats() as stats:
+        analysis = analyze_module(p, "DOMAINS", "pkg", tmp_path, header=True)
+    assert analysis == analyze_module(p, "DOMAINS", "pkg", tmp_path)
+    assert analysis.imports == {"pkg.io"}
+    assert stats.counters["header_fallbacks"] == 1
+    assert "header_reads" not in stats.counters
+    # without an import root only the sentinel is needed
+    with collect_stats() as stats:
+        assert analyze_module(p, "DOMAINS", header=True).sentinels == ["x"]
+    assert stats.counters["header_reads"] == 1
+
+
+def test_header_mode_ignores_imports_inside_functions(tmp_path, write):
+    p = write(tmp_path / "test_x.py", "import pkg.core\n\ndef test_x():\n    import pkg.io\n")
+    assert analyze_module(p, "DOMAINS", "pkg", tmp_path, policy=STATIC).imports == {"pkg.core", "pkg.io"}
+    assert analyze_module(p, "DOMAINS", "pkg", tmp_path, header=True, policy=STATIC).imports == {"pkg.core"}
+    assert analyze_module(tmp_path / "missing.py", "DOMAINS", header=True).status == PARSE_UNREADABLE
+
+
+def test_header_cache_is_separate(tmp_path):
+    full = AnalysisCache(tmp_path, "DOMAINS")
+    header = AnalysisCache(tmp_path, "DOMAINS", header=True)
+    assert full.cache_file != header.cache_file
+
+
+def test_build_proposals_read_mode(tmp_path, write):
+    repo = tmp_path / "repo"
+    write(repo / "pkg" / "__init__.py", "")
+    write(repo / "pkg" / "core.py", "DOMAINS = ['core']\n")
+    tests = repo / "tests"
+    write(tests / "test_a.py", "import pkg.core\n\n" + big_body(50))
+    write(tests / "test_b.py", "DOMAINS = ['local']\n\n" + big_body(50))
+    kwargs = {"root_import": "pkg", "repo_root": repo, "jobs": 1}
+    header = build_proposals(tests, "DOMAINS", read_mode="header", cache_dir=tmp_path / "cache", **kwargs)
+    assert header == build_proposals(tests, "DOMAINS", **kwargs)
+    static = {**kwargs, "imports": IMPORTS_STATIC}
+    static_header = build_proposals(tests, "DOMAINS", read_mode="header", **static)
+    assert static_header == build_proposals(tests, "DOMAINS", **static)
+    with pytest.raises(SplurgeTestNamerError, match="read mode"):
+        build_proposals(tests, "DOMAINS", read_mode="partial", **kwargs)
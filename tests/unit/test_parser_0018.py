@@ -0,0 +1,69 @@
+import re
+
+import pytest
+
+from splurge_test_namer.exceptions import FileReadError
+from splurge_test_namer.parser import (
+    PARSE_OK,
+    analyze_module,
+    find_imports_in_file,
+    read_sentinels_from_file,
+)
+from splurge_test_namer.stats import collect_stats
+from splurge_test_namer.util_helpers import safe_file_contains
+
+
+def test_safe_file_contains(tmp_path, write):
+    p = write(tmp_path / "m.py", "import os\nfrom . import x\n")
+    assert safe_file_contains(p, [b"os"])
+    assert not safe_file_contains(p, [b"pkg", b"DOMAINS"])
+    assert safe_file_contains(p, [b"pkg"], [re.compile(rb"from\s*\.")])
+    assert not safe_file_contains(write(tmp_path / "empty.py", ""), [b""])
+    with pytest.raises(FileReadError):
+        safe_file_contains(tmp_path / "missing.py", [b"x"])
+
+
+def test_unrelated_file_is_not_read_or_parsed(tmp_path, write):
+    p = write(tmp_path / "test_x.py", "import os\n\ndef test_x():\n    assert os.sep\n")
+    with collect_stats() as stats:
+        analysis = analyze_module(p, "DOMAINS", "pkg", tmp_path)
+        assert find_imports_in_file(p, "pkg", tmp_path) == set()
+        assert read_sentinels_from_file(p, "DOMAINS") == []
+    assert analysis.status == PARSE_OK
+    assert analysis.sentinels == [] and analysis.imports == set()
+    assert analysis.imports_scanned
+    assert stats.counters["prefilter_skips"] == 3
+    assert stats.counters["parses"] == 0
+    assert stats.counters["files_read"] == 0
+
+
+@pytest.mark.parametrize(
+    "src, imports",
+    [
+        ("import pkg.core\n", {"pkg.core"}),
+        ("import importlib\nimportlib.import_module('pk' + 'g.io')\n", {"pkg.io"}),
+        ("mod = __import__('p' 'kg.io')\n", {"pkg.io"}),
+        # identifiers are NFKC-normalized: this imports pkg.core
+        ("import ｐｋｇ.core\n", {"pkg.core"}),
+    ],
+)
+def test_files_that_may_import_are_parsed(tmp_path, src, imports, write):
+    p = write(tmp_path / "test_x.py", src)
+    with collect_stats() as stats:
+        assert analyze_module(p, "DOMAINS", "pkg", tmp_path).imports == imports
+    assert stats.counters["prefilter_skips"] == 0
+
+
+def test_relative_imports_are_parsed(tmp_path, write):
+    p = write(tmp_path / "pkg" / "api.py", "from .core import run\n")
+    assert analyze_module(p, "DOMAINS", "pkg", tmp_path).imports == {"pkg.core", "pkg.core.run"}
+    assert find_imports_in_file(p, "pkg", tmp_path) == {"pkg.core", "pkg.core.run"}
+
+
+def test_sentinel_only_lookup_skips_files_without_the_name(tmp_path, write):
+    plain = write(tmp_path / "plain.py", "import pkg\n")
+    tagged = write(tmp_path / "tagged.py", "DOMAINS = ['core']\n")
+    with collect_stats() as stats:
+        assert analyze_module(plain, "DOMAINS").sentinels == []
+        assert analyze_module(tagged, "DOMAINS").sentinels == ["core"]
+    assert stats.counters["prefilter_skips"] == 1
@@ -0,0 +1,35 @@
+import pytest
+
+from splurge_test_namer.parser import _sentinels_from_source
+
+
+@pytest.mark.parametrize(
+    "src, expected",
+    [
+        ("DOMAINS = ['a', \"b\"]\n", ["a", "b"]),
+        ("DOMAINS: list[str] = ['a']\n", ["a"]),
+        ("if x:\n    DOMAINS = [\n        'a',\n        'b',\n    ]\n", ["a", "b"]),
+        ("DOMAINS\n\n= ['a']", ["a"]),
+        ("x = DOMAINS = ['a']\nDOMAINS = ['b']\n", ["b"]),
+        ("DOMAINS_X = ['a']\nDOMAINS = ['b']\n", ["b"]),
+        ("DOMAINS: = ['a']\nDOMAINS = ['b']\n", ["b"]),
+        ("DOMAINS = ('a',)\nDOMAINS = ['b']\n", ["b"]),
+        ("DOMAINS = ['a', 'b'\ndef broken(:\n", []),
+        # quoted items never span lines
+        ("DOMAINS = ['a\n', 'b']", [", "]),
+        ("", []),
+    ],
+)
+def test_fallback_matches_assignments_at_line_start(src, expected):
+    assert _sentinels_from_source(src, "DOMAINS") == expected
+
+
+def test_sentinel_is_matched_literally():
+    assert _sentinels_from_source("DXMAINS = ['a']\n", "D.MAINS") == []
+    assert _sentinels_from_source("D.MAINS = ['a']\n", "D.MAINS") == ["a"]
+    assert _sentinels_from_source("DOMAINS = ['a']\n", "") == []
+
+
+def test_first_unclosed_candidate_ends_the_scan():
+    src = "DOMAINS = [\n" * 1000 + "'a'"
+    assert _sentinels_from_source(src, "DOMAINS") == []
@@ -0,0 +1,106 @@
+import pytest
+
+from splurge_test_namer.cache import AnalysisCache
+from splurge_test_namer.exceptions import SplurgeTestNamerError
+from splurge_test_namer.namer import build_proposals
+from splurge_test_namer.parser import ImportPolicy, analyze_module, find_imports_in_file
+
+SOURCE = """\
+import importlib
+from typing import TYPE_CHECKING
+
+import pkg.core
+
+if TYPE_CHECKING:
+    from pkg import types
+else:
+    import pkg.runtime
+
+try:
+    import pkg.fast
+except ImportError:
+    import pkg.slow
+
+plugin = importlib.import_module("pkg.plugin")
+importlib.import_module("pkg.side")
+CASES = [importlib.import_module("pkg.nested")]
+
+
+class TestThing:
+    import pkg.classlevel
+
+    def test_local(self):
+        from pkg import local
+        mod = importlib.import_module("pkg.dynamic_local")
+        assert [importlib.import_module("pkg.deep")]
+"""
+
+# "from pkg import x" records both pkg and pkg.x
+EVERYTHING = {
+    "pkg",
+    "pkg.core",
+    "pkg.types",
+    "pkg.runtime",
+    "pkg.fast",
+    "pkg.slow",
+    "pkg.plugin",
+    "pkg.side",
+    "pkg.nested",
+    "pkg.classlevel",
+    "pkg.local",
+    "pkg.dynamic_local",
+    "pkg.deep",
+}
+STATIC = {"pkg", "pkg.core", "pkg.types", "pkg.runtime", "pkg.fast", "pkg.slow", "pkg.classlevel", "pkg.local"}
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        (ImportPolicy(), EVERYTHING),
+        (ImportPolicy("all", skip_type_checking=True), EVERYTHING - {"pkg.types"}),
+        (ImportPolicy("all", skip_local=True), EVERYTHING - {"pkg.local", "pkg.dynamic_local", "pkg.deep"}),
+        (ImportPolicy("toplevel"), STATIC | {"pkg.plugin", "pkg.side", "pkg.dynamic_local"}),
+        (ImportPolicy("static"), STATIC),
+        (ImportPolicy("static", skip_type_checking=True, skip_local=True), STATIC - {"pkg", "pkg.types", "pkg.local"}),
+    ],
+)
+def test_import_policies(tmp_path, policy, expected, write):
+    p = write(tmp_path / "test_x.py", SOURCE)
+    assert find_imports_in_file(p, "pkg", tmp_path, policy) == expected
+    assert analyze_module(p, "DOMAINS", "pkg", tmp_path, policy=policy).imports == expected
+
+
+def test_type_checking_attribute_form(tmp_path, write):
+    p = write(tmp_path / "test_x.py", "import typing\nif typing.TYPE_CHECKING:\n    import pkg.types\n")
+    assert find_imports_in_file(p, "pkg", tmp_path, ImportPolicy("static", skip_type_checking=True)) == set()
+
+
+def test_unknown_scope_rejected(tmp_path):
+    with pytest.raises(SplurgeTestNamerError):
+        ImportPolicy("everything")
+    with pytest.raises(SplurgeTestNamerError):
+        build_proposals(tmp_path, "DOMAINS", imports="everything")
+
+
+def test_policy_gets_its_own_cache(tmp_path):
+    default = AnalysisCache(tmp_path, "DOMAINS", root_import="pkg")
+    static = AnalysisCache(tmp_path, "DOMAINS", root_import="pkg", policy=ImportPolicy("static"))
+    assert default.cache_file == AnalysisCache(tmp_path, "DOMAINS", root_import="pkg", policy=ImportPolicy()).cache_file
+    assert static.cache_file != default.cache_file
+
+
+def test_build_proposals_with_static_imports(tmp_path, write):
+    repo = tmp_path / "repo"
+    write(repo / "pkg" / "__init__.py", "")
+    write(repo / "pkg" / "core.py", "DOMAINS = ['core']\n")
+    write(repo / "pkg" / "io.py", "DOMAINS = ['io']\n")
+    tests = repo / "tests"
+    body = "def test_a():\n    importlib.import_module('pkg.io')\n"
+    write(tests / "test_a.py", "import importlib\nimport pkg.core\n\n" + body)
+    kwargs = {"root_import": "pkg", "repo_root": repo, "jobs": 1}
+    assert [p.name for _, p in build_proposals(tests, "DOMAINS", **kwargs)] == ["test_core_io_0001.py"]
+    static = build_proposals(tests, "DOMAINS", imports="static", cache_dir=tmp_path / "cache", **kwargs)
+    assert [p.name for _, p in static] == ["test_core_0001.py"]
+    local = build_proposals(tests, "DOMAINS", skip_local_imports=True, **kwargs)
+    assert [p.name for _, p in local] == ["test_core_0001.py"]
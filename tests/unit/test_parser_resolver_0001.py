@@ -0,0 +1,15 @@
+from splurge_test_namer.parser import aggregate_sentinels_for_test
+from splurge_test_namer.resolver import ModuleIndex
+
+
+def test_aggregate_with_resolver_matches_default(tmp_path, write):
+    repo = tmp_path / "repo"
+    write(repo / "pkg" / "__init__.py", "DOMAINS = ['root']\n")
+    write(repo / "pkg" / "core.py", "DOMAINS = ['core']\n")
+    write(repo / "pkg" / "api.py", "DOMAINS = ['api']\n")
+    test = write(repo / "tests" / "test_x.py", "from pkg.core import Thing\nimport pkg.api\n")
+
+    index = ModuleIndex(repo)
+    with_index = aggregate_sentinels_for_test(test, "pkg", repo, resolver=index)
+    without_index = aggregate_sentinels_for_test(test, "pkg", repo)
+    assert with_index == without_index == ["api", "core"]
@@ -0,0 +1,82 @@
+import sys
+
+from splurge_test_namer.pathfinder import SysPathFinder, default_finder
+from splurge_test_namer.resolver import ModuleIndex
+from splurge_test_namer.util_helpers import resolve_module_outside_repo
+
+
+BOOM = "raise RuntimeError('package code executed')\n"
+
+
+def test_finder_resolves_without_importing(tmp_path, write):
+    site = tmp_path / "site"
+    write(site / "extpkg" / "__init__.py", BOOM)
+    write(site / "extpkg" / "sub" / "__init__.py", BOOM)
+    mod = write(site / "extpkg" / "sub" / "mod.py", "DOMAINS = ['ext']\n")
+    finder = SysPathFinder([str(site)])
+    assert finder.find("extpkg.sub.mod") == [mod]
+    assert finder.find("extpkg") == [site / "extpkg" / "__init__.py"]
+    assert finder.find("extpkg.missing") == []
+    assert "extpkg" not in sys.modules
+
+
+def test_finder_follows_path_order_and_package_precedence(tmp_path, write):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    init = write(first / "dup" / "__init__.py")
+    write(first / "dup.py")
+    write(second / "dup.py")
+    assert SysPathFinder([str(first), str(second)]).find("dup") == [init]
+    assert SysPathFinder([str(second), str(first)]).find("dup") == [second / "dup.py"]
+
+
+def test_finder_namespace_packages_span_entries(tmp_path, write):
+    a = tmp_path / "a"
+    b = tmp_path / "b"
+    write(a / "ns" / "one.py")
+    two = write(b / "ns" / "two.py")
+    finder = SysPathFinder([str(a), str(b)])
+    assert finder.find("ns") == []
+    assert finder.find("ns.two") == [two]
+
+
+def test_finder_reads_pth_and_editable_mappings(tmp_path, write):
+    site = tmp_path / "site"
+    extra = tmp_path / "extra"
+    target = tmp_path / "proj" / "src" / "edpkg"
+    pth_mod = write(extra / "pthmod.py")
+    write(target / "__init__.py", BOOM)
+    ed_mod = write(target / "core.py")
+    write(site / "extra.pth", f"# comment\n{extra}\nimport os; raise SystemExit\n")
+    write(
+        site / "__editable___edpkg_0_1_finder.py",
+        f"import sys\nMAPPING: dict[str, str] = {{'edpkg': {str(target)!r}}}\nNAMESPACES = {{}}\n",
+    )
+    finder = SysPathFinder([str(site)])
+    assert str(extra) in finder.roots
+    assert finder.find("pthmod") == [pth_mod]
+    assert finder.find("edpkg.core") == [ed_mod]
+    assert "edpkg" not in sys.modules
+
+
+def test_module_index_searches_src_layout_and_counts_sys_path(tmp_path, write):
+    from splurge_test_namer.stats import collect_stats
+
+    repo = tmp_path / "repo"
+    mod = write(repo / "src" / "srcpkg" / "engine.py")
+    write(repo / "src" / "srcpkg" / "__init__.py", BOOM)
+    index = ModuleIndex(repo)
+    # the basename fallback already finds the file; the finder resolves the dotted name
+    assert index.finder.find("srcpkg.engine") == [mod]
+    with collect_stats() as stats:
+        assert resolve_module_outside_repo("srcpkg.engine", index.finder) == [mod]
+    assert stats.resolver()["sys_path"] == {"hits": 1, "misses": 0}
+
+
+def test_default_finder_tracks_sys_path(tmp_path, monkeypatch, write):
+    mod = write(tmp_path / "latemod.py")
+    before = default_finder()
+    assert before.find("latemod") == []
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert default_finder() is not before
+    assert default_finder().find("latemod") == [mod]
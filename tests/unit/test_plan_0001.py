@@ -0,0 +1,93 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from splurge_test_namer.exceptions import SplurgeTestNamerError
+from splurge_test_namer.namer import apply_renames, build_proposals
+from splurge_test_namer.plan import RenamePlan, fingerprint, read_plan, write_plan
+
+
+PROJECT = {
+    "pkg/__init__.py": "",
+    "pkg/core.py": "DOMAINS = ['core']\n",
+    "tests/test_a.py": "import pkg.core\n",
+    "tests/test_b.py": "from pkg.core import helper\n",
+    "tests/test_c.py": "DOMAINS = ['local']\n",
+}
+
+
+def plan_for(tmp_path: Path, repo: Path, tests: Path, **kwargs) -> RenamePlan:
+    deps: dict = {}
+    proposals = build_proposals(
+        tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1, dependencies=deps, **kwargs
+    )
+    return write_plan(tmp_path / "plan.json", proposals, deps)
+
+
+def test_plan_round_trip_and_dependencies(tmp_path, make_repo):
+    repo, tests = make_repo(PROJECT)
+    deps: dict = {}
+    proposals = build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1, dependencies=deps)
+    assert deps[tests / "test_a.py"] == [repo / "pkg" / "core.py"]
+    # pkg.core.helper resolved by stripping 'helper': its would-be locations are recorded
+    assert repo / "pkg" / "core" / "helper.py" in deps[tests / "test_b.py"]
+    assert deps[tests / "test_c.py"] == []
+
+    written = write_plan(tmp_path / "plan.json", proposals, deps, {tests / "test_c.py": ["local"]})
+    loaded = read_plan(tmp_path / "plan.json")
+    assert loaded == written
+    assert loaded.proposals == [(Path(os.path.abspath(o)), Path(os.path.abspath(p))) for o, p in proposals]
+    assert loaded.sentinels == {Path(os.path.abspath(tests / "test_c.py")): ["local"]}
+    assert loaded.fingerprints[os.path.abspath(repo / "pkg" / "core.py")] == fingerprint(repo / "pkg" / "core.py")
+    assert loaded.fingerprints[os.path.abspath(repo / "pkg" / "core" / "helper.py")] is None
+    assert loaded.stale_files() == []
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda repo, tests, write, bump: bump(tests / "test_a.py", "import pkg.core  # edited\n"),
+        lambda repo, tests, write, bump: bump(repo / "pkg" / "core.py", "DOMAINS = ['api']\n"),
+        lambda repo, tests, write, bump: write(repo / "pkg" / "core" / "helper.py", "DOMAINS = ['helper']\n"),
+        lambda repo, tests, write, bump: (tests / "test_c.py").unlink(),
+    ],
+    ids=["test-edited", "module-edited", "module-created", "test-deleted"],
+)
+def test_changes_make_plan_stale(tmp_path, change, make_repo, write, bump):
+    repo, tests = make_repo(PROJECT)
+    plan = plan_for(tmp_path, repo, tests)
+    change(repo, tests, write, bump)
+    assert len(read_plan(tmp_path / "plan.json").stale_files()) == 1
+    assert len(plan.stale_files()) == 1
+
+
+def test_incremental_runs_report_reused_dependencies(tmp_path, make_repo):
+    repo, tests = make_repo(PROJECT)
+    cache = tmp_path / "cache"
+    first = plan_for(tmp_path, repo, tests, cache_dir=cache, incremental=True)
+    second = plan_for(tmp_path, repo, tests, cache_dir=cache, incremental=True)
+    assert second.fingerprints == first.fingerprints
+    assert os.path.abspath(repo / "pkg" / "core.py") in second.fingerprints
+
+
+def test_applying_a_plan_renames_without_scanning(tmp_path, make_repo):
+    repo, tests = make_repo(PROJECT)
+    plan = plan_for(tmp_path, repo, tests)
+    apply_renames(read_plan(tmp_path / "plan.json").proposals)
+    assert sorted(p.name for p in tests.iterdir()) == sorted(p.name for _, p in plan.proposals)
+
+
+def test_invalid_plan_files_rejected(tmp_path, write):
+    with pytest.raises(SplurgeTestNamerError, match="read"):
+        read_plan(tmp_path / "missing.json")
+    bad = write(tmp_path / "bad.json", "{not json")
+    with pytest.raises(SplurgeTestNamerError, match="Invalid"):
+        read_plan(bad)
+    write(bad, json.dumps({"version": 99, "entries": [], "fingerprints": {}}))
+    with pytest.raises(SplurgeTestNamerError, match="version"):
+        read_plan(bad)
+    write(bad, json.dumps({"version": 1, "entries": [{"original": "a.py"}], "fingerprints": {}}))
+    with pytest.raises(SplurgeTestNamerError, match="Invalid"):
+        read_plan(bad)
@@ -0,0 +1,44 @@
+import pstats
+import time
+
+from splurge_test_namer.namer import build_proposals
+from splurge_test_namer.profiling import phase, profile_run, timed_iter
+
+
+def test_phase_is_noop_without_profile():
+    with phase("glob"):
+        pass
+    assert list(timed_iter([1, 2], "glob")) == [1, 2]
+
+
+def test_nested_phases_record_self_time():
+    with profile_run() as prof:
+        with phase("sentinels"):
+            time.sleep(0.02)
+            with phase("imports"):
+                time.sleep(0.03)
+    assert prof.phases["imports"].wall >= 0.025
+    assert prof.phases["sentinels"].wall < prof.phases["imports"].wall
+    assert prof.phases["sentinels"].calls == 1
+    assert prof.wall >= prof.phases["sentinels"].wall + prof.phases["imports"].wall
+    table = prof.format_table()
+    assert table.splitlines()[1].startswith("sentinels")
+    assert "total" in table
+
+
+def test_profile_run_covers_pipeline_and_dumps_pstats(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "pkg" / "__init__.py").write_text("")
+    (repo / "pkg" / "core.py").write_text("DOMAINS = ['core']\n")
+    tests = repo / "tests"
+    tests.mkdir()
+    for i in range(3):
+        (tests / f"test_{i}.py").write_text("from pkg.core import x\n")
+    out = tmp_path / "run.pstats"
+    with profile_run(out) as prof:
+        build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1)
+    assert {"glob", "sentinels", "imports", "resolve", "naming"} <= set(prof.phases)
+    assert prof.phases["glob"].calls == 4  # three files plus exhaustion
+    assert pstats.Stats(str(out)).total_calls > 0
+    assert set(prof.as_dict()["phases"]) == set(prof.phases)
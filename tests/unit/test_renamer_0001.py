@@ -0,0 +1,87 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from splurge_test_namer.exceptions import FileRenameError, SplurgeTestNamerError
+from splurge_test_namer.namer import apply_renames
+from splurge_test_namer.output import ProposalWriter
+from splurge_test_namer.renamer import RenameStep, execute_rename_plan, plan_renames
+
+
+def write_files(root: Path, names: list[str]) -> dict[str, Path]:
+    paths = {}
+    for name in names:
+        p = root / name
+        p.write_text(name)
+        paths[name] = p
+    return paths
+
+
+def test_swap_is_planned_with_one_temporary(tmp_path):
+    f = write_files(tmp_path, ["test_a_0001.py", "test_a_0002.py"])
+    steps = plan_renames([(f["test_a_0001.py"], f["test_a_0002.py"]), (f["test_a_0002.py"], f["test_a_0001.py"])])
+    assert len(steps) == 3
+    assert [s.final for s in steps].count(False) == 1
+    execute_rename_plan(steps)
+    assert f["test_a_0001.py"].read_text() == "test_a_0002.py"
+    assert f["test_a_0002.py"].read_text() == "test_a_0001.py"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["test_a_0001.py", "test_a_0002.py"]
+
+
+def test_chain_is_ordered_without_temporaries(tmp_path):
+    f = write_files(tmp_path, ["a.py", "b.py", "c.py"])
+    d = tmp_path / "d.py"
+    steps = plan_renames([(f["a.py"], f["b.py"]), (f["b.py"], f["c.py"]), (f["c.py"], d)])
+    assert [(s.src.name, s.dst.name) for s in steps] == [("c.py", "d.py"), ("b.py", "c.py"), ("a.py", "b.py")]
+    assert all(s.final for s in steps)
+
+
+def test_independent_renames_are_applied_in_proposal_order(tmp_path):
+    f = write_files(tmp_path, ["a.py", "b.py", "c.py", "d.py"])
+    proposals = [(f[name], tmp_path / f"test_{name}") for name in ["a.py", "b.py", "c.py", "d.py"]]
+    assert [(s.src, s.dst) for s in plan_renames(proposals)] == proposals
+    out = io.StringIO()
+    apply_renames(proposals, writer=ProposalWriter(out, "ndjson"))
+    applied = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [(Path(r["original"]), Path(r["proposed"])) for r in applied if "original" in r] == proposals
+
+
+def test_noops_skipped_and_conflicts_rejected(tmp_path):
+    a, b = tmp_path / "a.py", tmp_path / "b.py"
+    assert plan_renames([(a, a)]) == []
+    with pytest.raises(SplurgeTestNamerError):
+        plan_renames([(a, b), (tmp_path / "c.py", b)])
+    with pytest.raises(SplurgeTestNamerError):
+        plan_renames([(a, b), (a, tmp_path / "c.py")])
+
+
+def test_apply_renames_rotates_cycle_in_one_pass(tmp_path):
+    f = write_files(tmp_path, ["x.py", "y.py", "z.py"])
+    proposals = [(f["x.py"], f["y.py"]), (f["y.py"], f["z.py"]), (f["z.py"], f["x.py"])]
+    apply_renames(proposals)
+    assert f["y.py"].read_text() == "x.py"
+    assert f["z.py"].read_text() == "y.py"
+    assert f["x.py"].read_text() == "z.py"
+
+
+def test_execute_checks_parent_once(tmp_path, monkeypatch):
+    f = write_files(tmp_path, ["a.py", "b.py"])
+    dest = tmp_path / "sub"
+    calls = []
+    orig_mkdir = Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        calls.append(self)
+        return orig_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+    execute_rename_plan(plan_renames([(f["a.py"], dest / "a.py"), (f["b.py"], dest / "b.py")]))
+    assert calls == [dest]
+    assert (dest / "a.py").exists() and (dest / "b.py").exists()
+
+
+def test_execute_missing_source_raises(tmp_path):
+    with pytest.raises(FileRenameError):
+        execute_rename_plan([RenameStep(tmp_path / "nope.py", tmp_path / "x.py", tmp_path / "nope.py")])
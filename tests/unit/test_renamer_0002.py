@@ -0,0 +1,137 @@
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+import splurge_test_namer.renamer as renamer
+from splurge_test_namer.exceptions import FileRenameError, SplurgeTestNamerError
+from splurge_test_namer.namer import apply_renames
+from splurge_test_namer.output import ProposalWriter
+from splurge_test_namer.renamer import execute_rename_plan_concurrent, existing_paths, independent_groups, plan_renames
+
+
+def make_batch(root: Path) -> list[tuple[Path, Path]]:
+    """Swaps, a three-cycle, chains and plain moves into a subdirectory."""
+    root.mkdir(parents=True, exist_ok=True)
+    proposals = []
+    for i in range(0, 20, 2):
+        a, b = root / f"test_s_{i:04d}.py", root / f"test_s_{i + 1:04d}.py"
+        proposals += [(a, b), (b, a)]
+    x, y, z = root / "x.py", root / "y.py", root / "z.py"
+    proposals += [(x, y), (y, z), (z, x)]
+    c = [root / f"chain_{i}.py" for i in range(4)]
+    proposals += [(c[0], c[1]), (c[1], c[2]), (c[2], c[3])]
+    proposals += [(root / f"plain_{i}.py", root / "moved" / f"plain_{i}.py") for i in range(10)]
+    for orig, _ in proposals:
+        orig.write_text(orig.name)
+    return proposals
+
+
+def snapshot(root: Path) -> dict[str, str]:
+    return {str(p.relative_to(root)): p.read_text() for p in sorted(root.rglob("*.py"))}
+
+
+def test_independent_groups_follow_chains_and_cycles(tmp_path):
+    steps = plan_renames(make_batch(tmp_path))
+    groups = independent_groups(steps)
+    # 10 swaps, one three-cycle, one chain and 10 plain moves
+    assert len(groups) == 22
+    assert sorted(len(g) for g in groups)[-3:] == [3, 3, 4]
+    assert sorted(map(str, (s for g in groups for s in g))) == sorted(map(str, steps))
+    for group in groups:
+        assert group == [s for s in steps if s in group]
+
+
+def test_concurrent_apply_matches_serial(tmp_path):
+    serial_out, concurrent_out = io.StringIO(), io.StringIO()
+    apply_renames(make_batch(tmp_path / "one"), writer=ProposalWriter(serial_out, "ndjson"))
+    apply_renames(make_batch(tmp_path / "two"), writer=ProposalWriter(concurrent_out, "ndjson"), workers=8)
+    assert snapshot(tmp_path / "two") == snapshot(tmp_path / "one")
+    assert concurrent_out.getvalue().replace("/two/", "/one/") == serial_out.getvalue()
+
+
+def test_failure_is_reported_and_stops_new_groups(tmp_path, monkeypatch):
+    proposals = make_batch(tmp_path)
+    steps = plan_renames(proposals)
+    real_replace = os.replace
+    broken = tmp_path / "chain_1.py"
+
+    def replace(src, dst):
+        if Path(src) == broken:
+            raise PermissionError("read-only")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(renamer.os, "replace", replace)
+    outcome = execute_rename_plan_concurrent(steps, workers=1)
+    assert [f.step.src for f in outcome.failures] == [broken]
+    assert len(outcome.done) + len(outcome.failures) + len(outcome.skipped) == len(steps)
+    assert outcome.skipped and outcome.done == [s for s in steps if s in outcome.done]
+    # the chain stopped before moving chain_0 onto chain_1
+    assert (tmp_path / "chain_0.py").read_text() == "chain_0.py"
+    report = outcome.describe()
+    assert "1 rename(s) failed" in report and "read-only" in report
+
+
+def test_apply_renames_raises_with_failure_report(tmp_path, monkeypatch):
+    proposals = make_batch(tmp_path)
+
+    def replace(src, dst):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(renamer.os, "replace", replace)
+    out = io.StringIO()
+    with pytest.raises(SplurgeTestNamerError, match="rename\\(s\\) failed") as excinfo:
+        apply_renames(proposals, writer=ProposalWriter(out), workers=4)
+    assert isinstance(excinfo.value.__cause__, FileRenameError)
+    assert out.getvalue() == ""
+
+
+def test_temporary_name_is_reported_when_a_cycle_breaks(tmp_path, monkeypatch):
+    a, b = tmp_path / "a.py", tmp_path / "b.py"
+    a.write_text("a")
+    b.write_text("b")
+    steps = plan_renames([(a, b), (b, a)])
+    real_replace = os.replace
+
+    def replace(src, dst):
+        # only the move to the temporary name succeeds
+        if Path(src) != steps[0].src:
+            raise PermissionError("read-only")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(renamer.os, "replace", replace)
+    outcome = execute_rename_plan_concurrent(steps, workers=2)
+    assert outcome.done == [steps[0]]
+    assert f"was left at temporary name {steps[0].dst}" in outcome.describe()
+
+
+def test_serial_apply_reports_file_left_at_temporary_name(tmp_path, monkeypatch):
+    a, b = tmp_path / "test_a_0001.py", tmp_path / "test_a_0002.py"
+    a.write_text("a")
+    b.write_text("b")
+    real_replace = os.replace
+    calls = []
+
+    def replace(src, dst):
+        # the move to the temporary name succeeds, the next one fails
+        calls.append(src)
+        if len(calls) > 1:
+            raise PermissionError("read-only")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(renamer.os, "replace", replace)
+    with pytest.raises(SplurgeTestNamerError, match="1 rename\\(s\\) failed, 1 completed") as excinfo:
+        apply_renames([(a, b), (b, a)], writer=ProposalWriter(io.StringIO()))
+    assert isinstance(excinfo.value.__cause__, FileRenameError)
+    temp = next(tmp_path.glob(".*.splurge-tmp"))
+    assert f"was left at temporary name {temp}" in str(excinfo.value)
+
+
+def test_existing_paths_and_worker_validation(tmp_path):
+    present = tmp_path / "a.py"
+    present.write_text("")
+    paths = [tmp_path / "missing.py", present, tmp_path / "other.py"]
+    assert existing_paths(paths) == existing_paths(paths, workers=4) == [present]
+    with pytest.raises(SplurgeTestNamerError):
+        apply_renames([], workers=0)
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+
+from splurge_test_namer.exceptions import FileRenameError, SplurgeTestNamerError
+from splurge_test_namer.namer import apply_renames
+from splurge_test_namer.renamer import RenameStep, execute_rename_plan, execute_rename_plan_concurrent, plan_renames
+
+
+def write_files(root: Path, names: list[str]) -> dict[str, Path]:
+    paths = {}
+    for name in names:
+        p = root / name
+        p.write_text(name)
+        paths[name] = p
+    return paths
+
+
+def contents(root: Path) -> dict[str, str]:
+    return {p.name: p.read_text() for p in sorted(root.iterdir())}
+
+
+@pytest.mark.parametrize("force", [False, True])
+@pytest.mark.parametrize("workers", [1, 4])
+def test_rename_onto_kept_file_is_refused(tmp_path, force, workers):
+    f = write_files(tmp_path, ["a.py", "b.py"])
+    with pytest.raises(SplurgeTestNamerError):
+        apply_renames([(f["a.py"], f["a.py"]), (f["b.py"], f["a.py"])], force=force, workers=workers)
+    assert contents(tmp_path) == {"a.py": "a.py", "b.py": "b.py"}
+
+
+def test_no_op_paths_stay_occupied_in_plans(tmp_path):
+    a, b, c = tmp_path / "a.py", tmp_path / "b.py", tmp_path / "c.py"
+    for proposals in ([(a, a), (b, a)], [(b, a), (a, a)], [(a, a), (a, c)]):
+        with pytest.raises(SplurgeTestNamerError):
+            plan_renames(proposals)
+    assert plan_renames([(a, a), (b, c)]) == [RenameStep(b, c, b)]
+
+
+def test_existing_destination_is_not_overwritten(tmp_path):
+    f = write_files(tmp_path, ["a.py", "c.py"])
+    step = RenameStep(f["a.py"], f["c.py"], f["a.py"])
+    with pytest.raises(FileRenameError, match="Destination exists"):
+        execute_rename_plan([step])
+    outcome = execute_rename_plan_concurrent([step], workers=2)
+    assert [failure.step for failure in outcome.failures] == [step]
+    assert contents(tmp_path) == {"a.py": "a.py", "c.py": "c.py"}
+    execute_rename_plan([step], overwrite=True)
+    assert contents(tmp_path) == {"c.py": "a.py"}
+
+
+def test_missing_source_creates_no_directories(tmp_path):
+    step = RenameStep(tmp_path / "missing.py", tmp_path / "newdir" / "sub" / "x.py", tmp_path / "missing.py")
+    with pytest.raises(FileRenameError, match="Source does not exist"):
+        execute_rename_plan([step])
+    assert execute_rename_plan_concurrent([step], workers=2).failures
+    with pytest.raises(SplurgeTestNamerError):
+        apply_renames([(step.src, step.dst)])
+    assert list(tmp_path.iterdir()) == []
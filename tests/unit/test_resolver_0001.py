@@ -0,0 +1,38 @@
+from splurge_test_namer.resolver import ModuleIndex
+from splurge_test_namer.util_helpers import resolve_module_to_paths
+
+LAYOUT = {
+    "pkg/__init__.py": "",
+    "pkg/mod.py": "",
+    "pkg/utils.py": "",
+    "pkg/utils/__init__.py": "",
+    "other/deep/helpers.py": "",
+}
+
+
+def test_index_matches_resolve_module_to_paths(make_repo):
+    repo, _ = make_repo(LAYOUT)
+    index = ModuleIndex(repo)
+    for name in ("pkg", "pkg.mod", "pkg.utils", "pkg.sub.helpers"):
+        assert set(index.resolve(name)) == set(resolve_module_to_paths(name, repo))
+
+
+def test_index_prefers_module_file_before_package_init(make_repo):
+    repo, _ = make_repo(LAYOUT)
+    paths = ModuleIndex(repo).resolve("pkg.utils")
+    assert paths == [repo / "pkg" / "utils.py", repo / "pkg" / "utils" / "__init__.py"]
+
+
+def test_index_memoizes_lookups(make_repo, write):
+    repo, _ = make_repo(LAYOUT)
+    index = ModuleIndex(repo)
+    assert index.resolve("pkg.late") == []
+    # files created after the walk are not seen: the miss was memoized
+    write(repo / "pkg" / "late.py")
+    assert index.resolve("pkg.late") == []
+
+
+def test_index_member_fallback_strips_attributes(make_repo):
+    repo, _ = make_repo(LAYOUT)
+    index = ModuleIndex(repo)
+    assert index.resolve_with_member_fallback("pkg.mod.Class.attr") == [repo / "pkg" / "mod.py"]
@@ -0,0 +1,88 @@
+import json
+
+from splurge_test_namer.namer import apply_renames, build_proposals
+from splurge_test_namer.stats import RunStats, collect_stats, incr
+from splurge_test_namer.util_helpers import resolve_module_to_paths, safe_file_reader
+
+
+def project_files(n_tests: int = 4) -> dict[str, str]:
+    files = {"pkg/__init__.py": "", "pkg/core.py": "DOMAINS = ['core']\n"}
+    for i in range(n_tests):
+        files[f"tests/test_{i}.py"] = "from pkg.core import x\n"
+    # mentions the import root so the byte prefilter lets it reach the parser
+    files["tests/test_broken.py"] = "import pkg\ndef broken(:\n"
+    return files
+
+
+def test_incr_is_noop_without_collector():
+    incr("files_read")
+    with collect_stats() as stats:
+        incr("files_read", 2)
+    incr("files_read")
+    assert stats.counters["files_read"] == 2
+
+
+def test_pipeline_counters(tmp_path, make_repo):
+    repo, tests = make_repo(project_files())
+    cache_dir = tmp_path / "cache"
+    with collect_stats(top_n=3) as stats:
+        build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, cache_dir=cache_dir, jobs=1)
+    c = stats.counters
+    # five test files plus pkg/core.py
+    assert c["files_read"] == 6
+    assert c["bytes_read"] > 0
+    assert c["parse_failures"] == 1
+    assert c["cache_misses"] == 6 and c["cache_hits"] == 0
+    # "pkg.core" and the member name "pkg.core.x" are looked up once each
+    assert c["memo_misses"] == 2 and c["memo_hits"] == 6
+    assert stats.resolver()["direct_file"] == {"hits": 1, "misses": 1}
+    assert len(stats.slowest_files) == 3
+
+    with collect_stats() as warm:
+        build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, cache_dir=cache_dir, jobs=1)
+    assert warm.counters["cache_hits"] == 6
+    # only the cache file itself is read
+    assert warm.counters["files_read"] == 1
+
+
+def test_parallel_stats_are_merged(make_repo):
+    repo, tests = make_repo(project_files(n_tests=8))
+    with collect_stats() as stats:
+        build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=2)
+    assert stats.counters["files_read"] >= 9
+    assert len(stats.slowest_files) == 9
+
+
+def test_resolver_strategies_and_renames(tmp_path, make_repo):
+    repo, _ = make_repo(project_files())
+    src = tmp_path / "a.py"
+    src.write_text("")
+    with collect_stats() as stats:
+        resolve_module_to_paths("pkg", repo)
+        apply_renames([(src, tmp_path / "b.py")], writer=None)
+    r = stats.resolver()
+    assert r["direct_file"] == {"hits": 0, "misses": 1}
+    assert r["package_init"] == {"hits": 1, "misses": 0}
+    assert stats.counters["renames"] == 1
+    data = json.loads(json.dumps(stats.as_dict()))
+    assert data["counters"]["renames"] == 1
+
+
+def test_slowest_keeps_top_n():
+    stats = RunStats(top_n=2)
+    for i, s in enumerate([0.1, 0.5, 0.3, 0.05]):
+        stats.record_file_time(f"f{i}", s)
+    assert stats.slowest_files == [("f1", 0.5), ("f2", 0.3)]
+    other = RunStats(top_n=2)
+    other.merge(stats.take())
+    assert other.slowest_files == [("f1", 0.5), ("f2", 0.3)]
+    assert stats.slowest_files == []
+
+
+def test_bytes_read_counts_file_size_of_crlf_files(tmp_path):
+    p = tmp_path / "test_crlf.py"
+    p.write_bytes(b"import pkg\r\nDOMAINS = ['core']\r\n")
+    with collect_stats() as stats:
+        text = safe_file_reader(p)
+    assert text == "import pkg\nDOMAINS = ['core']\n"
+    assert stats.counters["bytes_read"] == p.stat().st_size
@@ -0,0 +1,63 @@
+import os
+from pathlib import Path
+
+import splurge_test_namer.util_helpers as utils_mod
+from splurge_test_namer.util_helpers import iter_test_files
+
+
+def touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x = 1\n")
+    return path
+
+
+def make_tree(root: Path) -> None:
+    touch(root / "test_top.py")
+    touch(root / "conftest.py")
+    touch(root / "a" / "test_a.py")
+    touch(root / "a" / "b" / "test_b.py")
+    touch(root / "a.py" / "test_in_dir_named_py.py")
+    touch(root / "helpers" / "test_helper.py")
+    touch(root / "Vendored" / "deep" / "test_vendored.py")
+    touch(root / "a" / "test_skip_me.py")
+    touch(root / "a" / "test_data.txt")
+
+
+def test_iter_matches_sorted_rglob_with_post_filtering(tmp_path):
+    root = tmp_path / "tests"
+    make_tree(root)
+    excludes = ["vendored", "test_skip_me.py"]
+    expected = [
+        f
+        for f in sorted(root.rglob("*.py"))
+        if f.is_file()
+        and f.name.startswith("test_")
+        and not any(part.lower() in {"helpers", *excludes} for part in f.parts)
+    ]
+    assert list(iter_test_files(root, excludes)) == expected
+
+
+def test_iter_never_descends_into_excluded_dirs(tmp_path, monkeypatch):
+    root = tmp_path / "tests"
+    make_tree(root)
+    scanned: list[str] = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(os.fspath(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(utils_mod.os, "scandir", recording_scandir)
+    list(iter_test_files(root, ["Vendored"]))
+    assert not any("Vendored" in p or "helpers" in p for p in scanned)
+
+
+def test_iter_is_lazy(tmp_path):
+    root = tmp_path / "tests"
+    make_tree(root)
+    it = iter_test_files(root, ["vendored"])
+    assert next(it) == root / "a" / "b" / "test_b.py"
+
+
+def test_iter_missing_root_yields_nothing(tmp_path):
+    assert list(iter_test_files(tmp_path / "nope")) == []
@@ -0,0 +1,227 @@
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from splurge_test_namer.namer import build_proposals
+from splurge_test_namer.watch import InotifyWatcher, PollingWatcher, WatchSession, run_watch
+
+
+def session_for(repo: Path, tests: Path) -> WatchSession:
+    return WatchSession(tests, "DOMAINS", root_import="pkg", repo_root=repo)
+
+
+def full(repo: Path, tests: Path):
+    return build_proposals(tests, "DOMAINS", root_import="pkg", repo_root=repo, jobs=1)
+
+
+def test_scan_matches_build_proposals(sample_project):
+    repo, tests = sample_project
+    session = session_for(repo, tests)
+    assert session.scan() == full(repo, tests)
+    assert session.watch_roots == [repo]
+
+
+def test_update_reanalyzes_only_dependents_of_changed_module(sample_project, bump):
+    repo, tests = sample_project
+    session = session_for(repo, tests)
+    session.scan()
+    bump(repo / "pkg" / "core.py", "DOMAINS = ['engine']\n")
+    diff = session.update([repo / "pkg" / "core.py"])
+    assert diff.analyzed == 2
+    assert [p.name for _, p in diff.changed] == ["test_engine_0001.py", "test_engine_0002.py"]
+    assert diff.removed == []
+    assert sorted(session.proposals.items()) == sorted(full(repo, tests))
+
+
+def test_update_handles_new_deleted_and_moved_test_files(sample_project, write):
+    repo, tests = sample_project
+    session = session_for(repo, tests)
+    session.scan()
+    (tests / "test_c.py").unlink()
+    write(tests / "sub" / "test_d.py", "import pkg.io\n")
+    diff = session.update([tests / "test_c.py", tests / "sub"])
+    assert diff.removed == [tests / "test_c.py"]
+    assert [(o.name, p.name) for o, p in diff.changed] == [("test_d.py", "test_io_0001.py")]
+    assert sorted(session.proposals.items()) == sorted(full(repo, tests))
+
+
+def test_new_module_resolves_previously_missing_import(sample_project, write):
+    repo, tests = sample_project
+    write(tests / "test_e.py", "import pkg.later\n")
+    session = session_for(repo, tests)
+    session.scan()
+    write(repo / "pkg" / "later.py", "DOMAINS = ['later']\n")
+    diff = session.update([repo / "pkg" / "later.py"])
+    assert [(o.name, p.name) for o, p in diff.changed] == [("test_e.py", "test_later_0001.py")]
+    assert sorted(session.proposals.items()) == sorted(full(repo, tests))
+
+
+def test_new_module_reanalyzes_star_importers_of_its_package(sample_project, write):
+    repo, tests = sample_project
+    write(tests / "test_e.py", "from pkg import *\n")
+    session = session_for(repo, tests)
+    session.scan()
+    write(repo / "pkg" / "net.py", "DOMAINS = ['net']\n")
+    diff = session.update([repo / "pkg" / "net.py"])
+    assert [(o.name, p.name) for o, p in diff.changed] == [("test_e.py", "test_core_io_net_0001.py")]
+    assert sorted(session.proposals.items()) == sorted(full(repo, tests))
+
+
+def test_unrelated_change_produces_empty_diff(sample_project, bump):
+    repo, tests = sample_project
+    session = session_for(repo, tests)
+    session.scan()
+    bump(tests / "test_a.py", "import pkg.core  # touched\n")
+    diff = session.update([tests / "test_a.py"])
+    assert not diff
+    assert diff.analyzed == 1
+
+
+def test_polling_watcher_reports_changes(tmp_path, write, bump):
+    root = tmp_path / "src"
+    mod = write(root / "a.py", "x = 1\n")
+    watcher = PollingWatcher([root], interval=0.01)
+    assert watcher.poll(timeout=0) == set()
+    bump(mod, "x = 22\n")
+    new = write(root / "pkg" / "b.py", "")
+    assert watcher.poll(timeout=1) == {str(mod), str(new)}
+    mod.unlink()
+    assert watcher.poll(timeout=1) == {str(mod)}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_reports_writes_and_new_directories(tmp_path, write):
+    root = tmp_path / "src"
+    root.mkdir()
+    try:
+        watcher = InotifyWatcher([root])
+    except OSError as e:  # pragma: no cover - depends on the kernel configuration
+        pytest.skip(f"inotify unavailable: {e}")
+    try:
+        assert watcher.poll(timeout=0) == set()
+        mod = write(root / "a.py", "x = 1\n")
+        assert str(mod) in watcher.poll(timeout=2)
+        (root / "pkg").mkdir()
+        assert str(root / "pkg") in watcher.poll(timeout=2)
+        nested = write(root / "pkg" / "b.py", "")
+        assert str(nested) in watcher.poll(timeout=2)
+    finally:
+        watcher.close()
+
+
+@pytest.fixture
+def excluded_session(sample_project, write) -> WatchSession:
+    repo, tests = sample_project
+    write(tests / "fixtures" / "data.py", "")
+    write(tests / "helpers" / "util.py", "")
+    write(repo / "pkg" / "helpers" / "__init__.py", "")
+    return WatchSession(tests, "DOMAINS", root_import="pkg", repo_root=repo, excludes=["Fixtures"])
+
+
+def test_polling_watcher_skips_excluded_trees(excluded_session, write):
+    session = excluded_session
+    repo, tests = session.ctx.repo_root, session.root
+    assert session.source_dirs == [repo / "pkg"]
+    watcher = PollingWatcher(session.watch_roots, 0.01, session.watch_pruned, session.source_dirs)
+    write(tests / "fixtures" / "test_new.py", "")
+    write(tests / "helpers" / "more.py", "")
+    assert watcher.poll(timeout=0) == set()
+    # helpers packages under the import root are still source modules
+    mod = write(repo / "pkg" / "helpers" / "net.py", "DOMAINS = ['net']\n")
+    assert watcher.poll(timeout=1) == {str(mod)}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_skips_excluded_trees(excluded_session, write):
+    session = excluded_session
+    repo, tests = session.ctx.repo_root, session.root
+    try:
+        watcher = InotifyWatcher(session.watch_roots, session.watch_pruned, session.source_dirs)
+    except OSError as e:  # pragma: no cover - depends on the kernel configuration
+        pytest.skip(f"inotify unavailable: {e}")
+    try:
+        watched = set(watcher._wds.values())
+        assert str(repo / "pkg" / "helpers") in watched
+        assert not {str(tests / "fixtures"), str(tests / "helpers")} & watched
+        (tests / "sub" / "FIXTURES").mkdir(parents=True)
+        write(tests / "sub" / "FIXTURES" / "test_new.py", "")
+        assert watcher.poll(timeout=0.2) == {str(tests / "sub")}
+    finally:
+        watcher.close()
+
+
+def test_update_ignores_excluded_trees_of_new_directories(excluded_session, write):
+    session = excluded_session
+    tests = session.root
+    session.scan()
+    resolver = session.ctx.resolver
+    write(tests / "sub" / "fixtures" / "test_new.py", "DOMAINS = ['new']\n")
+    diff = session.update([tests / "sub"])
+    assert not diff
+    assert diff.analyzed == 0
+    # nothing was treated as a new source module
+    assert session.ctx.resolver is resolver
+
+
+class FakeWatcher:
+    def __init__(self, batches):
+        self._batches = batches
+        self.closed = False
+
+    def batches(self):
+        yield from self._batches
+
+    def close(self):
+        self.closed = True
+
+
+def test_run_watch_reports_initial_proposals_and_diffs(sample_project, bump):
+    repo, tests = sample_project
+    session = session_for(repo, tests)
+    out = io.StringIO()
+
+    class Editing(FakeWatcher):
+        def batches(self):
+            bump(repo / "pkg" / "io.py", "DOMAINS = ['net']\n")
+            yield {str(repo / "pkg" / "io.py")}
+
+    watcher = Editing([])
+    run_watch(session, out, "ndjson", watcher=watcher, max_batches=1)
+    events = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [e["event"] for e in events] == ["proposal"] * 3 + ["summary", "proposal", "summary"]
+    assert events[4]["proposed"].endswith("test_net_0001.py")
+    assert events[4]["sentinels"] == ["net"]
+    assert events[5]["mode"] == "watch"
+    assert watcher.closed
+
+
+def test_run_watch_text_reports_removed_files(sample_project):
+    repo, tests = sample_project
+    session = session_for(repo, tests)
+    out = io.StringIO()
+
+    class Deleting(FakeWatcher):
+        def batches(self):
+            (tests / "test_b.py").unlink()
+            yield {str(tests / "test_b.py")}
+
+    run_watch(session, out, watcher=Deleting([]), max_batches=1)
+    lines = out.getvalue().splitlines()
+    assert f"{tests / 'test_b.py'} | (removed)" in lines
+    assert f"{tests / 'test_a.py'} | test_core_0001.py" in lines
+    assert lines[-1].startswith("Updated 0, removed 1 (1 files analyzed in ")
+
+
+def test_update_follows_transitive_imports(sample_project, write, bump):
+    repo, tests = sample_project
+    write(repo / "pkg" / "api.py", "DOMAINS = ['api']\nimport pkg.io\n")
+    write(tests / "test_d.py", "import pkg.api\n")
+    session = WatchSession(tests, "DOMAINS", root_import="pkg", repo_root=repo, follow_depth=0)
+    session.scan()
+    bump(repo / "pkg" / "io.py", "DOMAINS = ['disk']\n")
+    diff = session.update([repo / "pkg" / "io.py"])
+    assert diff.analyzed == 2
+    assert sorted(p.name for _, p in diff.changed) == ["test_api_disk_0001.py", "test_disk_0001.py"]
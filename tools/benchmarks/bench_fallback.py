@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Stress benchmark for the source-level sentinel fallback on malformed files.
+
+Usage:
+  python tools/benchmarks/bench_fallback.py [--mb N] [--regex-kb K]
+
+Generates multi-megabyte files that do not parse and times
+``read_sentinels_from_file``, whose last resort is the linear scanner in
+``parser._sentinels_from_source``. Each shape targets a pathological case of
+the regex it replaced: unclosed ``DOMAINS = [`` lines, long runs of blank
+lines, long annotation-like lines and bracket-heavy code. ``--regex-kb``
+also times the old regex on a prefix of that size for comparison (it is
+quadratic on these shapes, so keep the prefix small).
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from splurge_test_namer.parser import read_sentinels_from_file  # noqa: E402
+
+SHAPES = {
+    "unclosed": "DOMAINS = [\n",
+    "blank": "\n\n\n\n\n\n\n\n   \t\n",
+    "annotation": "DOMAINS: list[str] , x.y " + "a" * 200 + "\n",
+    "brackets": "x = [[[(({{" * 8 + "\n",
+}
+
+
+def make_source(shape: str, size: int) -> str:
+    """Return about ``size`` characters of ``shape`` that fail to parse."""
+    unit = SHAPES[shape]
+    return "def broken(:\n" + unit * (size // len(unit) + 1)
+
+
+def old_regex(src: str, sentinel: str) -> list[str]:
+    """The regex fallback replaced by ``_sentinels_from_source``."""
+    m = re.search(rf"^\s*{sentinel}(?:\s*:\s*[A-Za-z0-9_\[\],\. ]+)?\s*=\s*\[(.*?)\]", src, re.S | re.M)
+    return re.findall(r"['\"](.*?)['\"]", m.group(1)) if m else []
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Stress the sentinel fallback on malformed files")
+    p.add_argument("--mb", type=float, default=4.0, help="Size of each generated file in MiB")
+    p.add_argument("--regex-kb", type=int, default=0, help="Also time the old regex on a prefix of this many KiB")
+    args = p.parse_args(argv)
+
+    size = int(args.mb * 1024 * 1024)
+    header = f"{'shape':<11} {'size':>10} {'scanner (ms)':>13}"
+    if args.regex_kb:
+        header += f" {'regex on ' + str(args.regex_kb) + ' KiB (ms)':>22}"
+    print(header)
+    with tempfile.TemporaryDirectory() as tmp:
+        for shape in SHAPES:
+            path = Path(tmp) / f"test_{shape}.py"
+            path.write_text(make_source(shape, size), encoding="utf-8")
+            elapsed = timed(read_sentinels_from_file, path, "DOMAINS")
+            line = f"{shape:<11} {path.stat().st_size:>10} {elapsed * 1000:>13.1f}"
+            if args.regex_kb:
+                prefix = make_source(shape, args.regex_kb * 1024)
+                line += f" {timed(old_regex, prefix, 'DOMAINS') * 1000:>22.1f}"
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark header-mode analysis on large data-heavy test modules.
+
+Usage:
+  python tools/benchmarks/bench_header.py [--functions N] [--repeat R] [--imports static|toplevel|all]
+
+Compares ``analyze_module`` reading whole files against ``header=True``,
+which stops reading at the first module-level function or class, for a
+module with its sentinel and imports at the top, a module without the
+sentinel (the rest is read but not parsed) and a module assigning the
+sentinel at the end (full fallback). Header mode only applies with the
+``static`` import scope (the default here); the other scopes read whole
+files to find dynamic import calls. Bytes read and parses come from
+``stats.collect_stats``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from splurge_test_namer.constants import IMPORT_SCOPES, IMPORTS_STATIC  # noqa: E402
+from splurge_test_namer.parser import ImportPolicy, analyze_module  # noqa: E402
+from splurge_test_namer.stats import collect_stats  # noqa: E402
+
+
+def make_module(functions: int, sentinel_at: str) -> str:
+    """Return a data-heavy test module with the sentinel at ``top``, ``end`` or ``none``."""
+    lines = ["import pytest", "import pkg.core", ""]
+    if sentinel_at == "top":
+        lines.append("DOMAINS = ['core', 'parser']")
+    for i in range(functions):
+        lines.append("")
+        lines.append(f"CASES_{i} = [{', '.join(repr({'id': j, 'name': f'case_{i}_{j}'}) for j in range(10))}]")
+        lines.append("")
+        lines.append(f"@pytest.mark.parametrize('case', CASES_{i})")
+        lines.append(f"def test_case_{i}(case):")
+        lines.append("    assert case['name'].startswith('case_')")
+    if sentinel_at == "end":
+        lines.append("DOMAINS = ['core', 'parser']")
+    return "\n".join(lines) + "\n"
+
+
+def measure(repeat: int, path: Path, header: bool, policy: ImportPolicy) -> tuple[float, int, int]:
+    """Return the best time, bytes read and parses of analyzing ``path``."""
+    best = float("inf")
+    for _ in range(repeat):
+        with collect_stats() as stats:
+            start = time.perf_counter()
+            analyze_module(path, "DOMAINS", "pkg", path.parent, header=header, policy=policy)
+            best = min(best, time.perf_counter() - start)
+    return best, stats.counters["bytes_read"], stats.counters["parses"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Benchmark header-mode analysis on large modules")
+    p.add_argument("--functions", type=int, default=2000, help="Generated test functions per module")
+    p.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement (best time is reported)")
+    p.add_argument("--imports", choices=IMPORT_SCOPES, default=IMPORTS_STATIC, help="Import scope to analyze with")
+    args = p.parse_args(argv)
+    policy = ImportPolicy(args.imports)
+
+    print(
+        f"{'case':<6} {'size':>10} {'full (ms)':>10} {'header (ms)':>12} {'speedup':>8} "
+        f"{'bytes read':>11} {'parses':>7}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for case in ("top", "none", "end"):
+            path = Path(tmp) / f"test_{case}.py"
+            path.write_text(make_module(args.functions, case), encoding="utf-8")
+            assert (
+                analyze_module(path, "DOMAINS", "pkg", path.parent, header=True, policy=policy).sentinels
+                == analyze_module(path, "DOMAINS", "pkg", path.parent, policy=policy).sentinels
+            )
+            full, _, _ = measure(args.repeat, path, False, policy)
+            head, head_bytes, parses = measure(args.repeat, path, True, policy)
+            size = path.stat().st_size
+            print(
+                f"{case:<6} {size:>10} {full * 1000:>10.2f} {head * 1000:>12.2f} {full / head:>7.1f}x "
+                f"{head_bytes:>11} {parses:>7}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
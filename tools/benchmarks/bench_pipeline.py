@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Benchmark the scan/parse/resolve/rename pipeline on synthetic corpora.
+
+Usage:
+  python tools/benchmarks/bench_pipeline.py run [--size 1k] [--size 10k] [--jobs N]
+      [--trace-memory] [--save NAME] [--output FILE]
+  python tools/benchmarks/bench_pipeline.py compare BASELINE CURRENT [--threshold 0.15]
+
+``run`` generates a deterministic corpus per size (see ``corpus.py``) and
+reports, per phase, wall time, throughput in files/s and peak memory:
+
+  scan          build_proposals with import following (cache disabled)
+  imports       find_imports_in_file over every test file
+  resolve       resolve_module_to_paths for every distinct imported name
+  resolve_index the same names through resolver.ModuleIndex
+  rename        apply_renames of the proposals into the corpus
+
+Peak memory is the process high-water RSS after the phase; with
+``--trace-memory`` each phase also reports the tracemalloc peak of Python
+allocations (this slows the phase, so compare timings only between runs
+with the same setting).
+
+``--save NAME`` stores the results as a baseline in
+``tools/benchmarks/baselines/NAME.json``. ``compare`` accepts baseline names
+or JSON paths and exits with status 1 if any phase is slower than the
+baseline by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import PRESETS, CorpusSpec, generate_corpus, spec_for  # noqa: E402
+
+from splurge_test_namer.namer import apply_renames, build_proposals  # noqa: E402
+from splurge_test_namer.parser import find_imports_in_file  # noqa: E402
+from splurge_test_namer.resolver import ModuleIndex  # noqa: E402
+from splurge_test_namer.util_helpers import iter_test_files, resolve_module_to_paths  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+RESULTS_VERSION = 1
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+
+def peak_rss_mb() -> float | None:
+    """Return the process high-water RSS in MiB, or None when unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """Discard stdout (apply_renames reports every rename)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def measure(fn: Callable[[], int], trace_memory: bool) -> dict[str, float | int | None]:
+    """Run ``fn`` (which returns the number of items processed) and time it."""
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        items = fn()
+        seconds = time.perf_counter() - start
+        traced = tracemalloc.get_traced_memory()[1] / (1024 * 1024) if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return {
+        "seconds": round(seconds, 6),
+        "files": items,
+        "files_per_s": round(items / seconds, 1) if seconds > 0 else None,
+        "peak_rss_mb": peak_rss_mb(),
+        "traced_peak_mb": traced,
+    }
+
+
+def run_size(size: str, jobs: int | None, trace_memory: bool, spec: CorpusSpec | None = None) -> dict:
+    """Generate the ``size`` corpus (or ``spec``) and benchmark every phase on it."""
+    spec = spec if spec is not None else spec_for(size)
+    with tempfile.TemporaryDirectory(prefix=f"splurge-bench-{size}-") as tmp:
+        start = time.perf_counter()
+        corpus = generate_corpus(Path(tmp), spec)
+        generate_seconds = time.perf_counter() - start
+        tests = list(iter_test_files(corpus.tests_root))
+        phases: dict[str, dict] = {}
+        state: dict[str, object] = {}
+
+        def scan() -> int:
+            state["proposals"] = build_proposals(
+                corpus.tests_root, "DOMAINS", root_import=corpus.package, repo_root=corpus.repo_root, jobs=jobs
+            )
+            return len(tests)
+
+        def imports() -> int:
+            names: set[str] = set()
+            for f in tests:
+                names |= find_imports_in_file(f, corpus.package, corpus.repo_root)
+            state["names"] = sorted(names)
+            return len(tests)
+
+        def resolve() -> int:
+            names = state["names"]
+            for name in names:  # type: ignore[attr-defined]
+                resolve_module_to_paths(name, corpus.repo_root)
+            return len(names)  # type: ignore[arg-type]
+
+        def resolve_index() -> int:
+            names = state["names"]
+            index = ModuleIndex(corpus.repo_root)
+            for name in names:  # type: ignore[attr-defined]
+                index.resolve(name)
+            return len(names)  # type: ignore[arg-type]
+
+        def rename() -> int:
+            proposals = state["proposals"]
+            with quiet():
+                apply_renames(proposals)  # type: ignore[arg-type]
+            return len(proposals)  # type: ignore[arg-type]
+
+        # Unresolved names fall back to searching the working directory, so
+        # run inside the corpus to keep results independent of the caller.
+        old_cwd = os.getcwd()
+        os.chdir(corpus.repo_root)
+        try:
+            for name, fn in (
+                ("scan", scan),
+                ("imports", imports),
+                ("resolve", resolve),
+                ("resolve_index", resolve_index),
+                ("rename", rename),
+            ):
+                phases[name] = measure(fn, trace_memory)
+                print_phase(size, name, phases[name])
+        finally:
+            os.chdir(old_cwd)
+    return {
+        "spec": asdict(spec),
+        "corpus_bytes": corpus.bytes,
+        "generate_seconds": round(generate_seconds, 6),
+        "phases": phases,
+    }
+
+
+def print_phase(size: str, name: str, m: dict) -> None:
+    rss = f"{m['peak_rss_mb']:.1f}" if m["peak_rss_mb"] is not None else "-"
+    traced = f"{m['traced_peak_mb']:.1f}" if m["traced_peak_mb"] is not None else "-"
+    rate = m["files_per_s"] if m["files_per_s"] is not None else "-"
+    print(f"{size:<6} {name:<14} {m['seconds']:>10.3f} {m['files']:>8} {rate:>12} {rss:>10} {traced:>10}", flush=True)
+
+
+def load_results(ref: str) -> dict:
+    """Load results from a JSON path or a saved baseline name."""
+    path = Path(ref)
+    if not path.exists():
+        path = BASELINE_DIR / f"{ref}.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Print a phase-by-phase comparison and return the regressed phases."""
+    regressions: list[str] = []
+    print(f"{'size':<6} {'phase':<14} {'base (s)':>10} {'current (s)':>12} {'ratio':>7}")
+    for size, run in current.get("runs", {}).items():
+        base_run = baseline.get("runs", {}).get(size)
+        if base_run is None:
+            continue
+        for phase, m in run["phases"].items():
+            b = base_run["phases"].get(phase)
+            if b is None or not b["seconds"]:
+                continue
+            ratio = m["seconds"] / b["seconds"]
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{size}/{phase}")
+            print(f"{size:<6} {phase:<14} {b['seconds']:>10.3f} {m['seconds']:>12.3f} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Benchmark the splurge-test-namer pipeline on synthetic corpora")
+    sub = p.add_subparsers(dest="command", required=True)
+    run_p = sub.add_parser("run", help="Generate corpora and benchmark each phase")
+    run_p.add_argument("--size", action="append", choices=sorted(PRESETS), help="Corpus size (repeatable; default: 1k)")
+    run_p.add_argument("--jobs", type=int, default=1, help="Worker processes for the scan phase (default: 1)")
+    run_p.add_argument("--trace-memory", action="store_true", help="Also report tracemalloc peaks per phase")
+    run_p.add_argument("--save", default=None, help="Save results as baseline NAME")
+    run_p.add_argument("--output", type=Path, default=None, help="Write results JSON to this file")
+    cmp_p = sub.add_parser("compare", help="Compare two result files or saved baselines")
+    cmp_p.add_argument("baseline", help="Baseline name or results JSON path")
+    cmp_p.add_argument("current", help="Current baseline name or results JSON path")
+    cmp_p.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown before flagging (default: 0.15)")
+    args = p.parse_args(argv)
+
+    if args.command == "compare":
+        regressions = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+        return 0
+
+    print(f"{'size':<6} {'phase':<14} {'seconds':>10} {'files':>8} {'files/s':>12} {'rss MiB':>10} {'traced MiB':>10}")
+    results = {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "jobs": args.jobs,
+        "trace_memory": args.trace_memory,
+        "runs": {size: run_size(size, args.jobs, args.trace_memory) for size in (args.size or ["1k"])},
+    }
+    payload = json.dumps(results, indent=2) + "\n"
+    if args.output is not None:
+        args.output.write_text(payload, encoding="utf-8")
+    if args.save:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        (BASELINE_DIR / f"{args.save}.json").write_text(payload, encoding="utf-8")
+        print(f"saved baseline {BASELINE_DIR / (args.save + '.json')}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark sentinel extraction on large generated modules.
+
+Usage:
+  python tools/benchmarks/bench_sentinels.py [--functions N] [--repeat R]
+
+Compares the fast prefix path used by ``read_sentinels_from_file`` against a
+full ``ast.parse`` of the same module, for a sentinel near the top of the
+file, a module without the sentinel, and a sentinel at the end of the file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from splurge_test_namer.parser import _sentinels_from_tree, read_sentinels_from_file  # noqa: E402
+
+
+def make_module(functions: int, sentinel_at: str) -> str:
+    """Return a large test-like module with the sentinel at ``top``, ``end`` or ``none``."""
+    lines = ["import pytest", ""]
+    if sentinel_at == "top":
+        lines.append("DOMAINS = ['core', 'parser']")
+    for i in range(functions):
+        lines.append("")
+        lines.append(f"@pytest.mark.parametrize('value', [{', '.join(repr(f'v{i}_{j}') for j in range(20))}])")
+        lines.append(f"def test_case_{i}(value):")
+        lines.append(f"    data = {{'id': {i}, 'items': [value] * 3, 'name': 'case_{i}'}}")
+        lines.append("    assert data['items'][0] == value")
+    if sentinel_at == "end":
+        lines.append("DOMAINS = ['core', 'parser']")
+    return "\n".join(lines) + "\n"
+
+
+def full_ast(path: Path, sentinel: str) -> list[str]:
+    """Baseline: parse the whole module and read the sentinel from the tree."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    return _sentinels_from_tree(tree, sentinel) or []
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Benchmark sentinel extraction on large modules")
+    p.add_argument("--functions", type=int, default=5000, help="Generated test functions per module")
+    p.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement (best time is reported)")
+    args = p.parse_args(argv)
+
+    print(f"{'case':<8} {'size':>10} {'full ast (ms)':>14} {'fast (ms)':>10} {'speedup':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for case in ("top", "none", "end"):
+            path = Path(tmp) / f"test_{case}.py"
+            path.write_text(make_module(args.functions, case), encoding="utf-8")
+            assert read_sentinels_from_file(path, "DOMAINS") == full_ast(path, "DOMAINS")
+            slow = best_of(args.repeat, full_ast, path, "DOMAINS")
+            fast = best_of(args.repeat, read_sentinels_from_file, path, "DOMAINS")
+            size = path.stat().st_size
+            print(f"{case:<8} {size:>10} {slow * 1000:>14.2f} {fast * 1000:>10.2f} {slow / fast:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
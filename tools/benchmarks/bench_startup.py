@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Benchmark CLI start-up time with ``python -X importtime``.
+
+Usage:
+  python tools/benchmarks/bench_startup.py [--repeat R] [--budget-ms MS]
+
+For each scenario a fresh interpreter is started ``--repeat`` times with
+``-X importtime``; the best wall time of the process and the best
+cumulative import time of ``splurge_test_namer`` modules are reported.
+Scenarios:
+
+  import   import splurge_test_namer.cli
+  help     splurge-test-namer --help
+  invalid  argument validation failure (invalid --sentinel)
+  dry-run  dry run over a one-file test tree (serial, no cache)
+
+The script also checks that ``--help`` and validation failures do not load
+the analysis modules. It exits with status 1 when a scenario's package
+import time exceeds ``--budget-ms`` or a heavy module is loaded early.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Modules that --help and argument validation must not import.
+HEAVY_MODULES = (
+    "splurge_test_namer.namer",
+    "splurge_test_namer.parser",
+    "splurge_test_namer.cache",
+    "ast",
+    "concurrent.futures",
+    "inspect",
+    "logging",
+    "multiprocessing",
+)
+
+RUN_MAIN = (
+    "import sys; sys.argv = ['splurge-test-namer'] + sys.argv[1:]\n"
+    "from splurge_test_namer import cli\n"
+    "try:\n"
+    "    cli.main()\n"
+    "except SystemExit:\n"
+    "    pass\n"
+    "print('\\nMODULES ' + ' '.join(sorted(sys.modules)))\n"
+)
+
+
+def package_import_us(stderr: str) -> int:
+    """Sum the cumulative import time (µs) of top-level ``splurge_test_namer`` imports."""
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2]
+        stripped = name.strip()
+        if not stripped.startswith("splurge_test_namer"):
+            continue
+        # nested imports are indented below their importer; count only the outermost ones
+        if len(name) - len(name.lstrip()) == 1:
+            total += int(parts[1])
+    return total
+
+
+def run_once(argv: list[str], cwd: Path) -> tuple[float, int, set[str]]:
+    """Run ``RUN_MAIN`` with ``argv`` in a fresh interpreter."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUN_MAIN, *argv],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(REPO_ROOT), "PATH": ""},
+    )
+    wall = time.perf_counter() - start
+    modules: set[str] = set()
+    for line in proc.stdout.splitlines():
+        if line.startswith("MODULES "):
+            modules = set(line.split()[1:])
+    return wall, package_import_us(proc.stderr), modules
+
+
+def scenarios(tmp: Path) -> dict[str, list[str] | None]:
+    tests = tmp / "tests"
+    tests.mkdir()
+    (tests / "test_a.py").write_text("DOMAINS = ['core']\n", encoding="utf-8")
+    return {
+        "import": None,
+        "help": ["--help"],
+        "invalid": ["--test-root", str(tests), "--sentinel", "1bad"],
+        "dry-run": ["--test-root", str(tests), "--no-cache", "--jobs", "1"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Benchmark splurge-test-namer start-up time")
+    p.add_argument("--repeat", type=int, default=10, help="Interpreter starts per scenario (best is reported)")
+    p.add_argument(
+        "--budget-ms", type=float, default=30.0, help="Maximum package import time per scenario (default: 30)"
+    )
+    args = p.parse_args(argv)
+
+    failures: list[str] = []
+    print(f"{'scenario':<10} {'wall (ms)':>10} {'pkg import (ms)':>16}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, cli_args in scenarios(Path(tmp)).items():
+            best_wall = best_import = float("inf")
+            modules: set[str] = set()
+            for _ in range(args.repeat):
+                if cli_args is None:
+                    start = time.perf_counter()
+                    proc = subprocess.run(
+                        [sys.executable, "-X", "importtime", "-c", "import splurge_test_namer.cli"],
+                        capture_output=True,
+                        text=True,
+                        env={"PYTHONPATH": str(REPO_ROOT), "PATH": ""},
+                    )
+                    wall, imp = time.perf_counter() - start, package_import_us(proc.stderr)
+                else:
+                    wall, imp, modules = run_once(cli_args, Path(tmp))
+                best_wall = min(best_wall, wall)
+                best_import = min(best_import, imp)
+            import_ms = best_import / 1000
+            print(f"{name:<10} {best_wall * 1000:>10.1f} {import_ms:>16.1f}")
+            if import_ms > args.budget_ms:
+                failures.append(f"{name}: package import {import_ms:.1f} ms > budget {args.budget_ms:.1f} ms")
+            if name in ("help", "invalid"):
+                early = sorted(m for m in HEAVY_MODULES if m in modules)
+                if early:
+                    failures.append(f"{name}: loaded {', '.join(early)}")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Deterministic synthetic corpus generator for pipeline benchmarks.
+
+Usage:
+  python tools/benchmarks/corpus.py DEST [--size 1k|10k|100k] [--seed N]
+
+Generates a repository containing a source package of modules that declare
+``DOMAINS`` sentinels and a ``tests`` tree whose files import those modules.
+The number of tests and modules, import fan-out, the share of star and
+dynamic imports, directory depth and file sizes are configurable through
+:class:`CorpusSpec`; the same spec and seed always produce the same tree.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+DOMAIN_WORDS = (
+    "api",
+    "auth",
+    "cache",
+    "cli",
+    "config",
+    "core",
+    "db",
+    "events",
+    "io",
+    "models",
+    "net",
+    "parser",
+    "queue",
+    "render",
+    "search",
+    "storage",
+    "sync",
+    "ui",
+    "utils",
+    "workers",
+)
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Shape of a generated corpus.
+
+    Attributes:
+        tests: Number of test files.
+        modules: Number of source modules in the package.
+        fanout: Package imports per test file.
+        star_ratio: Share of imports written as ``from x import *``.
+        dynamic_ratio: Share of imports written as ``importlib.import_module("x")``.
+        missing_ratio: Share of imports naming a module that does not exist.
+        local_sentinel_ratio: Share of test files declaring their own sentinel.
+        depth: Directory nesting depth for both package and tests.
+        branching: Sub-directories per directory level.
+        test_functions: Test functions per test file (drives file size).
+        module_functions: Functions per source module (drives file size).
+        package: Top-level package name.
+        seed: Random seed.
+    """
+
+    tests: int = 1000
+    modules: int = 100
+    fanout: int = 4
+    star_ratio: float = 0.1
+    dynamic_ratio: float = 0.1
+    missing_ratio: float = 0.02
+    local_sentinel_ratio: float = 0.2
+    depth: int = 3
+    branching: int = 4
+    test_functions: int = 8
+    module_functions: int = 12
+    package: str = "benchpkg"
+    seed: int = 1234
+
+
+PRESETS: dict[str, CorpusSpec] = {
+    "1k": CorpusSpec(tests=1_000, modules=100),
+    "10k": CorpusSpec(tests=10_000, modules=1_000),
+    "100k": CorpusSpec(tests=100_000, modules=5_000, depth=4),
+}
+
+
+@dataclass(frozen=True)
+class Corpus:
+    """A generated corpus on disk."""
+
+    repo_root: Path
+    tests_root: Path
+    package: str
+    test_files: int
+    modules: int
+    bytes: int
+
+
+def _dir_parts(rng: random.Random, spec: CorpusSpec) -> list[str]:
+    depth = rng.randint(0, spec.depth)
+    return [f"d{rng.randrange(spec.branching)}" for _ in range(depth)]
+
+
+def _module_source(rng: random.Random, spec: CorpusSpec, index: int) -> str:
+    domains = rng.sample(DOMAIN_WORDS, rng.randint(1, 3))
+    lines = [f'"""Synthetic module {index}."""', "", f"DOMAINS = {domains!r}", ""]
+    for i in range(spec.module_functions):
+        lines.append("")
+        lines.append(f"def func_{i}(value, scale={i}):")
+        lines.append(f"    data = {{'id': {index}, 'value': value, 'items': [value] * {i % 5 + 1}}}")
+        lines.append("    return sum(data['items']) * scale")
+    return "\n".join(lines) + "\n"
+
+
+def _test_source(rng: random.Random, spec: CorpusSpec, module_names: list[str]) -> str:
+    lines = ["import importlib", "", "import pytest", ""]
+    for _ in range(spec.fanout):
+        roll = rng.random()
+        if roll < spec.missing_ratio:
+            name = f"{spec.package}.missing_{rng.randrange(1000)}"
+        else:
+            name = rng.choice(module_names)
+        kind = rng.random()
+        if kind < spec.star_ratio:
+            lines.append(f"from {name} import *  # noqa: F401,F403")
+        elif kind < spec.star_ratio + spec.dynamic_ratio:
+            lines.append(f'_mod_{len(lines)} = importlib.import_module("{name}")')
+        else:
+            head, _, tail = name.rpartition(".")
+            lines.append(f"from {head} import {tail}  # noqa: F401")
+    if rng.random() < spec.local_sentinel_ratio:
+        lines.append("")
+        lines.append(f"DOMAINS = {rng.sample(DOMAIN_WORDS, 1)!r}")
+    for i in range(spec.test_functions):
+        values = ", ".join(repr(f"v{i}_{j}") for j in range(6))
+        lines.append("")
+        lines.append(f"@pytest.mark.parametrize('value', [{values}])")
+        lines.append(f"def test_case_{i}(value):")
+        lines.append(f"    assert {{'id': {i}, 'items': [value]}}['items'][0] == value")
+    return "\n".join(lines) + "\n"
+
+
+def generate_corpus(dest: Path, spec: CorpusSpec) -> Corpus:
+    """Write the corpus described by ``spec`` under ``dest`` and return a summary."""
+    rng = random.Random(spec.seed)
+    total = 0
+    pkg_root = dest / spec.package
+    module_names: list[str] = []
+    package_dirs: set[tuple[str, ...]] = {()}
+    for i in range(spec.modules):
+        parts = _dir_parts(rng, spec)
+        for n in range(1, len(parts) + 1):
+            package_dirs.add(tuple(parts[:n]))
+        path = pkg_root.joinpath(*parts, f"mod_{i}.py")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        src = _module_source(rng, spec, i)
+        path.write_text(src, encoding="utf-8")
+        total += len(src)
+        module_names.append(".".join([spec.package, *parts, f"mod_{i}"]))
+    for parts in package_dirs:
+        init = pkg_root.joinpath(*parts, "__init__.py")
+        init.parent.mkdir(parents=True, exist_ok=True)
+        init.write_text("", encoding="utf-8")
+
+    tests_root = dest / "tests"
+    for i in range(spec.tests):
+        path = tests_root.joinpath(*_dir_parts(rng, spec), f"test_case_{i:06d}.py")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        src = _test_source(rng, spec, module_names)
+        path.write_text(src, encoding="utf-8")
+        total += len(src)
+    return Corpus(dest, tests_root, spec.package, spec.tests, spec.modules, total)
+
+
+def spec_for(size: str, **overrides: object) -> CorpusSpec:
+    """Return the preset spec for ``size`` with field ``overrides`` applied."""
+    if size not in PRESETS:
+        raise ValueError(f"unknown corpus size {size!r}; expected one of {sorted(PRESETS)}")
+    return replace(PRESETS[size], **overrides)
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Generate a synthetic benchmark corpus")
+    p.add_argument("dest", type=Path, help="Destination directory (created)")
+    p.add_argument("--size", default="1k", choices=sorted(PRESETS), help="Corpus preset (default: 1k)")
+    p.add_argument("--seed", type=int, default=None, help="Override the preset seed")
+    args = p.parse_args(argv)
+    spec = spec_for(args.size) if args.seed is None else spec_for(args.size, seed=args.seed)
+    corpus = generate_corpus(args.dest, spec)
+    print(f"generated {corpus.test_files} tests and {corpus.modules} modules ({corpus.bytes} bytes) in {args.dest}")
+    print(asdict(spec))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())